@@ -1,3 +1,5 @@
+import json
+
 from test.base import ApiDBTestCase
 
 
@@ -38,3 +40,49 @@ class AssetTasksTestCase(ApiDBTestCase):
         self.assertEqual(
             assets[0]["tasks"][0]["task_type_priority"], 1
         )
+
+    def get_assets_since(self, since):
+        path = "data/assets/with-tasks?project_id=%s" % self.project.id
+        if since is not None:
+            path += "&since=%s" % since
+        response = self.app.get(path, headers=self.base_headers)
+        self.assertEqual(response.status_code, 200)
+        return (
+            json.loads(response.data.decode("utf-8")),
+            response.headers["X-Grid-Updated-At"]
+        )
+
+    def test_get_assets_and_tasks_since(self):
+        (assets, since) = self.get_assets_since(None)
+        self.assertEqual(len(assets), 1)
+        (assets, since) = self.get_assets_since(since)
+        self.assertEqual(assets, [])
+
+        self.generate_fixture_entity_character()
+        (assets, since) = self.get_assets_since(since)
+        self.assertEqual(len(assets), 1)
+        self.assertEqual(assets[0]["name"], "Rabbit")
+
+        asset_id = str(self.entity_character.id)
+        self.entity_character.delete()
+        (assets, since) = self.get_assets_since(since)
+        self.assertEqual(assets, [{
+            "id": asset_id,
+            "removed": True
+        }])
+
+        path = "data/assets/with-tasks?project_id=%s&since=wrong"
+        self.get(path % self.project.id, 400)
+        self.get("data/assets/with-tasks?since=2018-01-01T00:00:00", 400)
+
+    def test_get_assets_and_tasks_since_expired(self):
+        path = "data/assets/with-tasks?project_id=%s&since=%s"
+        self.get(path % (self.project.id, "2000-01-01T00:00:00"), 410)
+
+    def test_get_assets_and_tasks_empty_project(self):
+        self.generate_fixture_project_standard()
+        path = "data/assets/with-tasks?project_id=%s" % \
+            self.project_standard.id
+        response = self.app.get(path, headers=self.base_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get("X-Grid-Updated-At"))
@@ -1,5 +1,7 @@
 import json
 
+from flask_jwt_extended import decode_token
+
 from test.base import ApiDBTestCase
 
 from zou.app.utils import auth, fields
@@ -57,6 +59,27 @@ class AuthTestCase(ApiDBTestCase):
         self.assertIsAuthenticated(tokens)
         self.logout(tokens)
 
+    def test_login_claims(self):
+        tokens = self.post("auth/login", self.credentials, 200)
+        with self.flask_app.app_context():
+            token = decode_token(tokens["access_token"])
+        self.assertEqual(token["user_claims"], {
+            "id": self.person_dict["id"],
+            "role": "admin"
+        })
+        self.logout(tokens)
+
+    def test_role_change_refuses_token(self):
+        tokens = self.post("auth/login", self.credentials, 200)
+        self.assertIsAuthenticated(tokens)
+        self.person.update({"role": "user"})
+        self.assertIsNotAuthenticated(tokens)
+
+        tokens = self.post("auth/login", self.credentials, 200)
+        self.assertIsAuthenticated(tokens)
+        self.person.update({"active": False})
+        self.assertIsNotAuthenticated(tokens)
+
     def test_unactive_login(self):
         self.person.update({"active": False})
         self.person.save()
@@ -25,3 +25,9 @@ class TasksCsvExportTestCase(ApiDBTestCase):
 Cosmos Landromat,Modeling,Shaders,Props,Tree,Ema Peel,John Doe,50,40,2017-02-20,2017-02-22,2017-02-28,Open\r
 """
         self.assertEqual(csv_tasks, expected_result)
+
+    def test_get_output_files_several_assignees(self):
+        self.task.assignees.append(self.assigner)
+        self.task.save()
+        csv_tasks = self.get_raw("/export/csv/tasks.csv")
+        self.assertIn(",Ema Peel,\"Ema Peel, John Doe\",50,", csv_tasks)
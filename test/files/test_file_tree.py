@@ -339,6 +339,34 @@ class FileTreeTestCase(ApiDBTestCase):
         )
         self.assertEquals(name, "props_tree")
 
+    def test_compile_template(self):
+        template = file_tree.compile_template("<AssetType>/<Asset>_v1")
+        self.assertEquals(len(template.parts), 4)
+        self.assertEquals(template.parts[1], ("/", None))
+        self.assertEquals(template.parts[3], ("_v1", None))
+        self.assertEquals(
+            template.render(self.entity, self.task),
+            "props/tree_v1"
+        )
+        self.assertEquals(
+            file_tree.compile_template("<AssetType>/<Asset>_v1"),
+            template
+        )
+
+    def test_get_compiled_tree(self):
+        compiled_tree = file_tree.get_compiled_tree(self.project)
+        self.assertEquals(
+            file_tree.get_compiled_tree(self.project),
+            compiled_tree
+        )
+        self.project.update({
+            "file_tree": file_tree.get_tree_from_file("standard")
+        })
+        self.assertNotEqual(
+            file_tree.get_compiled_tree(self.project),
+            compiled_tree
+        )
+
     def test_apply_style(self):
         file_name = "Shaders"
         result = file_tree.apply_style(file_name, "uppercase")
@@ -3,6 +3,7 @@ from test.base import ApiDBTestCase
 from zou.app.models.entity import Entity
 
 from zou.app.services import file_tree
+from zou.app.stores import cache_versions_store
 
 
 class FileTreeTestCase(ApiDBTestCase):
@@ -112,3 +113,31 @@ class FileTreeTestCase(ApiDBTestCase):
         )
 
         self.assertTrue(task.id, self.shot_task_standard.id)
+
+    def test_path_index(self):
+        index = file_tree.get_path_index(self.project.id)
+        self.assertEqual(file_tree.get_path_index(self.project.id), index)
+        task_id = index.get_asset_task_id({
+            "AssetType": "Props",
+            "Asset": "Tree",
+            "TaskType": "Shaders"
+        })
+        self.assertEqual(task_id, str(self.task.id))
+
+        self.task.update({"name": "Other"})
+        self.assertNotEqual(file_tree.get_path_index(self.project.id), index)
+        self.entity.update({"name": "Plant"})
+        task_id = file_tree.get_path_index(self.project.id).get_asset_task_id({
+            "AssetType": "Props",
+            "Asset": "Tree",
+            "TaskType": "Shaders"
+        })
+        self.assertIsNone(task_id)
+
+    def test_path_index_version(self):
+        index = file_tree.get_path_index(self.project.id)
+        cache_versions_store.bump("path_indexes:%s" % self.project.id)
+        self.assertNotEqual(file_tree.get_path_index(self.project.id), index)
+        index = file_tree.get_path_index(self.project.id)
+        cache_versions_store.bump("path_indexes")
+        self.assertNotEqual(file_tree.get_path_index(self.project.id), index)
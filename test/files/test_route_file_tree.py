@@ -213,3 +213,48 @@ class FolderPathTestCase(ApiDBTestCase):
             "mode": "unknown"
         }
         self.post("/data/tasks/%s/folder-path" % self.task.id, data, 400)
+
+    def test_get_file_paths(self):
+        data = {
+            "paths": [
+                {
+                    "task_id": str(self.task.id),
+                    "mode": "working",
+                    "name": "main",
+                    "version": 3
+                },
+                {
+                    "task_id": str(self.shot_task.id),
+                    "mode": "output",
+                    "output_type_id": self.cache_type_id
+                }
+            ]
+        }
+        result = self.post("/data/tasks/file-paths", data, 200)
+        self.assertEquals(len(result), 2)
+        self.assertEquals(result[0]["task_id"], str(self.task.id))
+        self.assertEquals(
+            result[0]["path"],
+            "/simple/productions/cosmos_landromat/assets/props/tree/shaders/"
+            "3ds_max"
+        )
+        self.assertEquals(
+            result[0]["name"],
+            "cosmos_landromat_props_tree_shaders_main_v003"
+        )
+        self.assertEquals(
+            result[1]["path"],
+            "/simple/productions/export/cosmos_landromat/shots/s01/p01/"
+            "animation/cache"
+        )
+
+    def test_get_file_paths_wrong_data(self):
+        data = {
+            "paths": [{
+                "task_id": str(self.task.id),
+                "output_type_id": str(self.task_type.id)
+            }]
+        }
+        self.post("/data/tasks/file-paths", data, 400)
+        data = {"paths": [{"task_id": "wrong-id"}]}
+        self.post("/data/tasks/file-paths", data, 404)
@@ -52,3 +52,30 @@ class GetTaskFromPathTestCase(ApiDBTestCase):
             "name": "/simple/productions/the_crew/shots/s01/p01/shaders",
         }
         self.post("/data/tasks/from-path", data, 400)
+
+    def test_get_tasks_from_paths(self):
+        data = {
+            "paths": [
+                {
+                    "file_path": "/simple/productions/the_crew/shots/s01/p01/"
+                                 "animation/3dsmax",
+                    "type": "shot"
+                },
+                {
+                    "file_path": "/simple/productions/the_crew/assets/props/"
+                                 "tree/shaders/3dsmax",
+                    "type": "asset"
+                },
+                {
+                    "file_path": "/simple/productions/the_crew/assets/props/"
+                                 "unknown/shaders/3dsmax",
+                    "type": "asset"
+                }
+            ],
+            "project_id": self.project.id
+        }
+        result = self.post("/data/tasks/from-paths", data, 200)
+        self.assertEquals(len(result), 3)
+        self.assertEquals(result[0]["task"]["id"], str(self.shot_task.id))
+        self.assertEquals(result[1]["task"]["id"], str(self.task.id))
+        self.assertIsNone(result[2]["task"])
@@ -1,6 +1,9 @@
 # -*- coding: UTF-8 -*-
 from test.base import ApiDBTestCase
 
+from zou.app.models.entity import Entity
+from zou.app.models.project import Project
+
 
 class BaseModelTestCase(ApiDBTestCase):
 
@@ -27,7 +30,33 @@ class BaseModelTestCase(ApiDBTestCase):
         pass
 
     def test_get_id_map(self):
-        pass
+        self.generate_fixture_project_status()
+        self.generate_fixture_project()
+        self.generate_fixture_project_standard()
+        self.generate_fixture_entity_type()
+        self.generate_fixture_entity()
+        self.entity.update({"shotgun_id": 1})
+        other_entity = Entity.create(
+            name="Rock",
+            shotgun_id=2,
+            project_id=self.project_standard.id,
+            entity_type_id=self.entity_type.id
+        )
+
+        project_map = Project.get_id_map(field="name")
+        self.assertEqual(project_map, {
+            "Cosmos Landromat": self.project.id,
+            "Big Buck Bunny": self.project_standard.id
+        })
+        entity_map = Entity.get_id_map()
+        self.assertEqual(entity_map, {1: self.entity.id, 2: other_entity.id})
+        entity_map = Entity.get_id_map(project_id=self.project_standard.id)
+        self.assertEqual(entity_map, {2: other_entity.id})
+        entity_map = Entity.get_id_map(
+            field="name",
+            entity_type_id=self.shot_type.id
+        )
+        self.assertEqual(entity_map, {})
 
     def save(self):
         pass
@@ -60,3 +60,21 @@ class CommandsTestCase(ApiTestCase):
         commands.clean_auth_tokens()
         self.assertEquals(len(self.store.keys()), 1)
         self.assertEquals(self.store.keys()[0], "testkey2")
+
+    def test_clean_auth_tokens_flags(self):
+        for index in range(5):
+            self.store.add("revoked-%s" % index, "true")
+            self.store.add("active-%s" % index, "false")
+
+        progress = []
+        result = commands.clean_auth_tokens(
+            batch_size=2,
+            progress_callback=lambda *counts: progress.append(counts)
+        )
+        self.assertEquals(result["deleted"], 5)
+        self.assertTrue(len(progress) > 0)
+        self.assertEquals(progress[-1][1], 5)
+        self.assertEquals(
+            sorted(self.store.keys()),
+            ["active-%s" % index for index in range(5)]
+        )
@@ -28,3 +28,34 @@ class PaginationTestCase(ApiDBTestCase):
         self.assertEquals(pagination_infos["page"], 2)
         self.assertEquals(pagination_infos["offset"], 100)
         self.assertEquals(pagination_infos["limit"], 100)
+
+    def test_keyset_paginate(self):
+        result = self.get("data/persons?limit=100")
+        self.assertEquals(len(result["data"]), 100)
+        self.assertFalse("total" in result)
+        ids = [person["id"] for person in result["data"]]
+
+        result = self.get("data/persons?limit=100&after=%s" % (
+            result["next_cursor"]
+        ))
+        self.assertEquals(len(result["data"]), 100)
+        ids += [person["id"] for person in result["data"]]
+
+        result = self.get("data/persons?limit=100&after=%s" % (
+            result["next_cursor"]
+        ))
+        self.assertEquals(len(result["data"]), 51)
+        self.assertIsNone(result["next_cursor"])
+        ids += [person["id"] for person in result["data"]]
+        self.assertEquals(len(set(ids)), 251)
+        self.assertEquals(ids, sorted(ids))
+
+    def test_keyset_total(self):
+        result = self.get("data/persons?limit=10&with_total=true")
+        self.assertEquals(len(result["data"]), 10)
+        self.assertEquals(result["total"], 251)
+        self.assertEquals(result["limit"], 10)
+
+    def test_keyset_wrong_cursor(self):
+        self.get("data/persons?limit=10&after=wrongcursor", 400)
+        self.get("data/persons?limit=0", 400)
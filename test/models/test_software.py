@@ -53,3 +53,16 @@ class SoftwareTestCase(ApiDBTestCase):
         softwares = self.get("data/softwares")
         self.assertEquals(len(softwares), 2)
         self.delete_404("data/softwares/%s" % fields.gen_uuid())
+
+    def test_get_softwares_updated_since(self):
+        softwares = self.get("data/softwares")
+        last_update = max(software["updated_at"] for software in softwares)
+        path = "data/softwares?updated_since=%s"
+        self.assertEquals(self.get(path % last_update), [])
+
+        software = softwares[0]
+        self.put("data/softwares/%s" % software["id"], {"name": "Maya"})
+        softwares = self.get(path % last_update)
+        self.assertEquals(len(softwares), 1)
+        self.assertEquals(softwares[0]["id"], software["id"])
+        self.get(path % "wrong-date", 400)
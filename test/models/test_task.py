@@ -92,3 +92,18 @@ class TaskTestCase(ApiDBTestCase):
         self.assertEquals(task["project"]["name"], "Cosmos Landromat")
         self.assertEquals(task["entity"]["name"], "Tree")
         self.assertEquals(task["assigner"]["first_name"], "Ema")
+
+    def test_serialize(self):
+        task = Task.get(self.tasks[0].id)
+        task_dict = task.serialize()
+        self.assertEquals(task_dict["id"], str(task.id))
+        self.assertEquals(task_dict["type"], "Task")
+        self.assertEquals(task_dict["assignees"], [str(self.person.id)])
+        self.assertEquals(
+            task_dict["created_at"],
+            task.created_at.isoformat()
+        )
+
+        task_dict = task.serialize(obj_type="Job", relations=False)
+        self.assertEquals(task_dict["type"], "Job")
+        self.assertFalse("assignees" in task_dict)
@@ -0,0 +1,68 @@
+import datetime
+
+from test.base import ApiDBTestCase
+
+from zou.app.models.software import Software
+from zou.app.models.tombstone import Tombstone
+from zou.app.utils import commands
+
+
+class TombstoneTestCase(ApiDBTestCase):
+
+    def setUp(self):
+        super(TombstoneTestCase, self).setUp()
+        self.generate_data(Software, 3)
+
+    def test_delete_adds_tombstone(self):
+        software = self.get_first("data/softwares")
+        self.delete("data/softwares/%s" % software["id"])
+        tombstones = self.get("data/tombstones?model_name=Software")
+        self.assertEquals(len(tombstones), 1)
+        self.assertEquals(tombstones[0]["instance_id"], software["id"])
+        self.assertEquals(len(Tombstone.query.all()), 1)
+
+    def test_get_tombstones_updated_since(self):
+        software = self.get_first("data/softwares")
+        self.delete("data/softwares/%s" % software["id"])
+        tombstone = self.get_first("data/tombstones")
+        tombstones = self.get(
+            "data/tombstones?updated_since=%s" % tombstone["updated_at"]
+        )
+        self.assertEquals(len(tombstones), 0)
+
+    def test_create_tombstone(self):
+        self.post("data/tombstones", {"model_name": "Software"}, 405)
+
+    def test_get_tombstones_updated_since_expired(self):
+        self.get("data/tombstones?updated_since=2000-01-01T00:00:00", 410)
+
+    def test_clean_tombstones(self):
+        softwares = self.get("data/softwares")
+        self.delete("data/softwares/%s" % softwares[0]["id"])
+        self.delete("data/softwares/%s" % softwares[1]["id"])
+        tombstone = Tombstone.query.filter_by(
+            instance_id=softwares[0]["id"]
+        ).first()
+        tombstone.created_at = datetime.datetime(2000, 1, 1)
+        tombstone.save()
+
+        self.assertEquals(commands.clean_tombstones(), 1)
+        tombstones = Tombstone.query.all()
+        self.assertEquals(len(tombstones), 1)
+        self.assertEquals(str(tombstones[0].instance_id), softwares[1]["id"])
+
+    def test_get_tombstones_permissions(self):
+        self.generate_fixture_user_cg_artist()
+        self.log_in_cg_artist()
+        self.get("data/tombstones?model_name=TaskStatus")
+        self.get("data/tombstones?model_name=Software", 403)
+        self.get("data/tombstones", 403)
+
+    def test_next_updated_since(self):
+        response = self.app.get(
+            "data/softwares",
+            headers=self.base_headers
+        )
+        updated_since = response.headers["X-Updated-Since"]
+        softwares = self.get("data/softwares?updated_since=%s" % updated_since)
+        self.assertEquals(len(softwares), 3)
@@ -1,5 +1,6 @@
 from test.base import ApiDBTestCase
 
+from zou.app.models.person import Person
 from zou.app.services import persons_service
 
 from zou.app.services.exception import PersonNotFoundException
@@ -78,3 +79,23 @@ class PersonServiceTestCase(ApiDBTestCase):
             persons_service.get_person_by_email_username,
             "ema.doe@yahoo.com"
         )
+
+    def test_get_request_person(self):
+        with self.flask_app.test_request_context():
+            person = persons_service.get_request_person(
+                "email",
+                self.person_email,
+                persons_service.get_by_email
+            )
+            self.assertEqual(person.id, self.person_id)
+            self.assertEqual(persons_service.get_identity_lookups(), 1)
+
+            person = persons_service.get_identity_person(self.person_id)
+            self.assertEqual(person.email, self.person_email)
+            self.assertEqual(persons_service.get_identity_lookups(), 1)
+
+            person.update({"first_name": "Jane"})
+            person = persons_service.get_identity_person(self.person_id)
+            self.assertEqual(person.first_name, "Jane")
+            self.assertEqual(persons_service.get_identity_lookups(), 2)
+        self.assertEqual(Person.get(self.person_id).first_name, "Jane")
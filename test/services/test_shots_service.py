@@ -1,7 +1,10 @@
 from test.base import ApiDBTestCase
 
+from zou.app import db
+from zou.app.models.entity_type import EntityType
 from zou.app.services import shots_service
 from zou.app.services.exception import SequenceNotFoundException
+from zou.app.stores import cache_versions_store
 
 
 class ShotUtilsTestCase(ApiDBTestCase):
@@ -44,6 +47,29 @@ class ShotUtilsTestCase(ApiDBTestCase):
         episode_type = shots_service.get_episode_type()
         self.assertEqual(episode_type.name, "Episode")
 
+    def test_get_shot_type_cache(self):
+        shot_type = shots_service.get_shot_type()
+        stats = shots_service.entity_type_cache.stats()
+        shot_type_again = shots_service.get_shot_type()
+        self.assertEqual(shot_type.id, shot_type_again.id)
+        self.assertEqual(
+            shots_service.entity_type_cache.stats()["hits"],
+            stats["hits"] + 1
+        )
+
+        shot_type_again.update({"name": "Plan"})
+        self.assertEqual(shots_service.entity_type_cache.stats()["size"], 0)
+        self.assertEqual(shots_service.get_shot_type().name, "Shot")
+
+    def test_get_shot_type_cache_version(self):
+        shot_type_id = shots_service.get_shot_type().id
+        EntityType.query.filter_by(id=shot_type_id).update({"name": "Plan"})
+        db.session.commit()
+        self.assertEqual(shots_service.get_shot_type().id, shot_type_id)
+
+        cache_versions_store.bump("entity_types")
+        self.assertNotEqual(shots_service.get_shot_type().id, shot_type_id)
+
     def test_get_sequences(self):
         sequences = shots_service.get_sequences()
         self.assertDictEqual(
@@ -1,3 +1,5 @@
+import json
+
 from test.base import ApiDBTestCase
 
 
@@ -36,3 +38,36 @@ class ShotTasksTestCase(ApiDBTestCase):
             shots[0]["tasks"][0]["task_type_name"], "Animation"
         )
         self.assertEqual(shots[0]["episode_name"], "E01")
+
+    def test_get_shots_and_tasks_grid(self):
+        path = "data/shots/with-tasks?project_id=%s" % self.project.id
+        shots = self.get(path)
+        self.assertEqual(len(shots), 1)
+        self.assertEqual(shots[0]["tasks"][0]["task_status_name"], "Open")
+
+        self.generate_fixture_task_status_wip()
+        self.shot_task.update({"task_status_id": self.task_status_wip.id})
+        self.generate_fixture_shot("P02")
+        shots = self.get(path)
+        self.assertEqual(len(shots), 2)
+        shot = [shot for shot in shots if shot["name"] == "P01"][0]
+        self.assertEqual(shot["tasks"][0]["task_status_name"], "WIP")
+
+        self.shot.delete()
+        shots = self.get(path)
+        self.assertEqual(len(shots), 1)
+
+    def test_get_shots_and_tasks_etag(self):
+        path = "data/shots/with-tasks?project_id=%s" % self.project.id
+        response = self.app.get(path, headers=self.base_headers)
+        etag = response.headers["ETag"]
+        headers = dict(self.base_headers, **{"If-None-Match": etag})
+        response = self.app.get(path, headers=headers)
+        self.assertEqual(response.status_code, 304)
+
+        self.generate_fixture_shot_task(name="Secondary")
+        response = self.app.get(path, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        shots = json.loads(response.data.decode("utf-8"))
+        self.assertEqual(len(shots[0]["tasks"]), 2)
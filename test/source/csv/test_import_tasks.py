@@ -3,6 +3,7 @@ import datetime
 
 from test.base import ApiDBTestCase
 
+from zou.app.models.department import Department
 from zou.app.models.person import Person
 from zou.app.models.task import Task
 from zou.app.models.task_type import TaskType
@@ -52,3 +53,34 @@ class ImportCsvTasksTestCase(ApiDBTestCase):
         self.assertEqual(task.end_date, datetime.datetime(2017, 3, 19, 0, 0))
         person = Person.get_by(last_name="Doe")
         self.assertEqual(task.assignees, [person])
+
+    def test_import_tasks_bulk(self):
+        path = "/import/csv/tasks?bulk=true"
+        file_path_fixture = self.get_fixture_file_path(
+            os.path.join("csv", "tasks.csv")
+        )
+        self.upload_file(path, file_path_fixture)
+
+        tasks = Task.query.all()
+        self.assertEqual(len(tasks), 3)
+        person = Person.get_by(last_name="Doe")
+        task = [task for task in tasks if len(task.assignees) > 0][0]
+        self.assertEqual(task.assignees, [person])
+        self.assertEqual(task.duration, 40 * 3600)
+
+        result = self.upload_file(path, file_path_fixture)
+        self.assertIn(b"Task already exists.", result)
+        self.assertEqual(len(Task.query.all()), 3)
+
+    def test_import_tasks_bulk_rollback(self):
+        TaskStatus.create(name="To do", short_name="todo", color="#f5f5f5")
+        path = "/import/csv/tasks?bulk=true"
+        file_path_fixture = self.get_fixture_file_path(
+            os.path.join("csv", "tasks.csv")
+        )
+        self.upload_file(path, file_path_fixture, 400)
+
+        self.assertEqual(len(Task.query.all()), 0)
+        self.assertEqual(len(TaskType.query.all()), 0)
+        self.assertEqual(len(Department.query.all()), 0)
+        self.assertEqual(len(TaskStatus.query.all()), 1)
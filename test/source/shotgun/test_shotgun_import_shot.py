@@ -1,5 +1,9 @@
+import json
+
 from test.source.shotgun.base import ShotgunTestCase
 
+from zou.app.blueprints.source.shotgun.shot import ImportShotgunShotsResource
+
 from zou.app.models.entity import Entity
 from zou.app.models.project import Project
 
@@ -91,3 +95,56 @@ class ImportShotgunShotTestCase(ShotgunTestCase):
         shot = self.shots[0]
         self.assertEqual(shot["data"]["sg_custom_field"], "test")
         self.assertEqual(shot["data"]["sg_custom_field_2"], "test 2")
+
+    def test_import_shots_by_chunks(self):
+        self.load_fixture('projects')
+        self.load_fixture('sequences')
+        self.load_fixture('assets')
+
+        sg_shots = []
+        for index in range(5):
+            sg_shot = dict(self.sg_shot)
+            sg_shot["id"] = index + 10
+            sg_shot["code"] = "SH%02d" % (index + 10)
+            sg_shots.append(sg_shot)
+        sg_shots.append(dict(sg_shots[0]))
+
+        chunk_size = ImportShotgunShotsResource.chunk_size
+        ImportShotgunShotsResource.chunk_size = 2
+        try:
+            self.shots = self.post("/import/shotgun/shots", sg_shots, 200)
+        finally:
+            ImportShotgunShotsResource.chunk_size = chunk_size
+        self.assertEqual(len(self.shots), 6)
+
+        self.shots = self.get("data/shots/all")
+        self.assertEqual(len(self.shots), 5)
+
+    def test_import_shots_ndjson(self):
+        self.load_fixture('projects')
+        self.load_fixture('sequences')
+        self.load_fixture('assets')
+
+        sg_shot = dict(self.sg_shot)
+        sg_shot["id"] = 5
+        sg_shot["code"] = "SH05"
+        headers = dict(self.post_headers)
+        headers["Content-type"] = "application/x-ndjson"
+        response = self.app.post(
+            "/import/shotgun/shots",
+            data="\n".join([json.dumps(self.sg_shot), json.dumps(sg_shot)]),
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.shots = json.loads(response.data.decode("utf-8"))
+        self.assertEqual(len(self.shots), 2)
+
+        self.shots = self.get("data/shots/all")
+        self.assertEqual(len(self.shots), 2)
+
+        response = self.app.post(
+            "/import/shotgun/shots",
+            data="{\"id\": 1",
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 400)
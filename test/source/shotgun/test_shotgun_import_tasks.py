@@ -146,6 +146,29 @@ class ImportShotgunTaskTestCase(ShotgunTestCase):
         self.assertEqual(task["assigner_id"], str(assigner.id))
         self.assertEqual(task["assignees"][0], str(assignee.id))
 
+    def test_import_task_assignees(self):
+        self.load_task()
+        self.sg_task["task_assignees"].append({
+            "id": 1,
+            "name": "John Doe",
+            "type": "HumanUser"
+        })
+        self.tasks = self.post("/import/shotgun/tasks", [self.sg_task], 200)
+        self.assertEqual(len(self.tasks[0]["assignees"]), 2)
+
+        task = self.get("data/tasks?shotgun_id=%s" % self.sg_task["id"])[0]
+        john = Person.get_by(last_name="Doe")
+        ema = Person.get_by(last_name="Peel")
+        self.assertEqual(
+            set(task["assignees"]),
+            set([str(john.id), str(ema.id)])
+        )
+
+        self.sg_task["task_assignees"] = self.sg_task["task_assignees"][1:]
+        self.post("/import/shotgun/tasks", [self.sg_task], 200)
+        task = self.get("data/tasks?shotgun_id=%s" % self.sg_task["id"])[0]
+        self.assertEqual(task["assignees"], [str(john.id)])
+
     def test_import_sequence_task(self):
         self.load_sequence_task()
         sequences = shots_service.get_sequences({"shotgun_id": 1})
@@ -35,3 +35,19 @@ class CommandsTestCase(ApiTestCase):
         self.store.add("key-2", "true")
         self.assertTrue("key-1" in self.store.keys())
         self.assertTrue("key-2" in self.store.keys())
+
+    def test_is_revoked_cache(self):
+        self.store.add("key-1", "false")
+        self.assertFalse(self.store.is_revoked({"jti": "key-1"}))
+
+        # Change made without notification, the cached state is used.
+        self.store.revoked_tokens_store.set("key-1", "true")
+        self.assertFalse(self.store.is_revoked({"jti": "key-1"}))
+
+        self.store.on_revocation_message({"data": "key-0 key-1"})
+        self.assertTrue(self.store.is_revoked({"jti": "key-1"}))
+
+        self.store.add("key-2", "false")
+        self.assertFalse(self.store.is_revoked({"jti": "key-2"}))
+        self.store.add("key-2", "true")
+        self.assertTrue(self.store.is_revoked({"jti": "key-2"}))
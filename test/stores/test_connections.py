@@ -0,0 +1,61 @@
+from test.base import ApiTestCase
+
+from zou.app import config
+from zou.app.stores import connections
+
+
+class ConnectionsTestCase(ApiTestCase):
+
+    def test_get_client(self):
+        client = connections.get_client(config.KV_JOBS_DB_INDEX)
+        self.assertEqual(
+            client,
+            connections.get_client(config.KV_JOBS_DB_INDEX)
+        )
+        self.assertNotEqual(
+            client,
+            connections.get_client(config.KV_EVENTS_DB_INDEX)
+        )
+
+    def test_pool_stats(self):
+        pool = connections.HealthCheckedConnectionPool(
+            max_connections=5,
+            db=config.KV_JOBS_DB_INDEX
+        )
+        self.assertEqual(pool.get_stats(), {
+            "max_connections": 5,
+            "created_connections": 0,
+            "available_connections": 0,
+            "used_connections": 0
+        })
+        connection = pool.get_connection("GET")
+        stats = pool.get_stats()
+        self.assertEqual(stats["created_connections"], 1)
+        self.assertEqual(stats["used_connections"], 1)
+
+        pool.release(connection)
+        stats = pool.get_stats()
+        self.assertEqual(stats["available_connections"], 1)
+        self.assertEqual(stats["used_connections"], 0)
+        self.assertIsNotNone(connection.released_at)
+
+    def test_get_pool_size(self):
+        pool = connections.get_pool(config.KV_EVENTS_DB_INDEX)
+        self.assertEqual(pool.max_connections, config.KV_MAX_CONNECTIONS)
+        pool = connections.get_pool(
+            config.KV_EVENTS_DB_INDEX,
+            max_connections=config.KV_EVENT_STREAM_MAX_CONNECTIONS
+        )
+        self.assertEqual(
+            pool.max_connections,
+            config.KV_EVENT_STREAM_MAX_CONNECTIONS
+        )
+
+    def test_event_stream_pool(self):
+        from zou import event_stream
+        connections.get_client(config.KV_EVENTS_DB_INDEX)
+        event_stream.sse.redis
+        self.assertEqual(
+            event_stream.sse.connection_pool.max_connections,
+            config.KV_EVENT_STREAM_MAX_CONNECTIONS
+        )
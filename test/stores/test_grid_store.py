@@ -0,0 +1,56 @@
+from test.base import ApiTestCase
+
+from zou.app.services import grids_service
+from zou.app.stores import grid_store
+
+
+class GridStoreTestCase(ApiTestCase):
+
+    def setUp(self):
+        super(GridStoreTestCase, self).setUp()
+        grid_store.clear()
+
+    def tearDown(self):
+        super(GridStoreTestCase, self).tearDown()
+        grid_store.clear()
+
+    def test_update_rows_after_concurrent_change(self):
+        grid_store.save_rows("shots", "project-01", [
+            {"id": "shot-01", "name": "P01"}
+        ], "0")
+        grid_store.mark_dirty("shots", {"project-01": set(["shot-01"])})
+        (row_ids, version) = grid_store.pop_dirty("shots", "project-01")
+        self.assertEqual(row_ids, set(["shot-01"]))
+
+        grid_store.update_rows("shots", "project-01", [
+            {"id": "shot-01", "name": "P02"}
+        ], [], version)
+        (row_ids, version) = grid_store.pop_dirty("shots", "project-01")
+        self.assertEqual(row_ids, set())
+
+        grid_store.mark_dirty("shots", {"project-01": set(["shot-01"])})
+        etag = grid_store.get_etag("shots", "project-01")
+        grid_store.update_rows("shots", "project-01", [
+            {"id": "shot-01", "name": "P02"}
+        ], [], version)
+        self.assertNotEqual(grid_store.get_etag("shots", "project-01"), etag)
+        (row_ids, version) = grid_store.pop_dirty("shots", "project-01")
+        self.assertEqual(row_ids, set(["shot-01"]))
+
+    def test_get_grid_build_failure(self):
+        def build_rows(project_id, row_ids=None):
+            raise RuntimeError("Database unavailable")
+
+        grid_store.save_rows("shots", "project-01", [
+            {"id": "shot-01", "name": "P01"}
+        ], "0")
+        grid_store.mark_dirty("shots", {"project-01": set(["shot-01"])})
+        with self.assertRaises(RuntimeError):
+            grids_service.get_grid(
+                "shots",
+                "project-01",
+                build_rows,
+                lambda row_ids: False
+            )
+        (row_ids, version) = grid_store.pop_dirty("shots", "project-01")
+        self.assertEqual(row_ids, set(["shot-01"]))
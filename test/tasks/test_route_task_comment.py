@@ -81,3 +81,27 @@ class RouteTaskChangeTestCase(ApiDBTestCase):
 
         path = "/actions/tasks/unknown/comments/"
         comments = self.get(path, 404)
+
+    def test_task_comments_pagination(self):
+        self.task_id = str(self.task.id)
+        path = "/actions/tasks/%s/comment/" % self.task_id
+        for index in range(3):
+            self.post(path, {
+                "task_status_id": self.wip_status_id,
+                "comment": "comment %s" % index
+            })
+
+        path = "/data/tasks/%s/comments/" % self.task_id
+        comments = self.get(path + "?limit=2")
+        self.assertEqual(
+            [comment["text"] for comment in comments],
+            ["comment 2", "comment 1"]
+        )
+        comments = self.get(
+            path + "?limit=2&before=%s" % comments[-1]["id"]
+        )
+        self.assertEqual(
+            [comment["text"] for comment in comments],
+            ["comment 0"]
+        )
+        self.get(path + "?before=wrong-id", 400)
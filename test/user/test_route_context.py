@@ -32,6 +32,13 @@ class UserContextRoutesTestCase(ApiDBTestCase):
         task = Task.get(task_id)
         task.assignees.append(self.user)
 
+    def test_identity_lookups(self):
+        self.assign_user(self.task_id)
+        response = self.app.get("data/user/tasks", headers=self.base_headers)
+        self.assertEqual(response.status_code, 200)
+        # The person loaded at login is still in the process cache.
+        self.assertEqual(response.headers["X-Identity-Lookups"], "0")
+
     def test_get_project_sequences(self):
         self.generate_fixture_shot_task()
         self.assign_user(self.shot_task.id)
@@ -0,0 +1,43 @@
+import time
+import unittest
+
+from zou.app.utils import cache
+
+
+class CacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super(CacheTestCase, self).setUp()
+        self.cache = cache.new("test")
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get("key"))
+        self.cache.set("key", "value")
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertEqual(self.cache.stats(), {
+            "size": 1,
+            "hits": 1,
+            "misses": 1
+        })
+
+    def test_ttl(self):
+        self.cache.ttl = 0.01
+        self.cache.set("key", "value")
+        time.sleep(0.02)
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_max_size(self):
+        self.cache.max_size = 2
+        self.cache.set("key-1", "value-1")
+        self.cache.set("key-2", "value-2")
+        self.cache.get("key-1")
+        self.cache.set("key-3", "value-3")
+        self.assertEqual(self.cache.get("key-1"), "value-1")
+        self.assertIsNone(self.cache.get("key-2"))
+        self.assertEqual(self.cache.get("key-3"), "value-3")
+
+    def test_clear_all(self):
+        self.cache.set("key", "value")
+        cache.clear_all()
+        self.assertIsNone(self.cache.get("key"))
+        self.assertIn("test", cache.get_stats())
@@ -1,5 +1,8 @@
+import json
 import unittest
 
+from zou.app import config
+from zou.app.stores import queue_store
 from zou.app.utils import events
 
 
@@ -44,3 +47,37 @@ class EventsTestCase(unittest.TestCase):
         self.assertEqual(self.counter, 3)
         events.emit("task:new")
         self.assertEqual(self.counter, 4)
+
+    def test_queue_dispatch(self):
+        queue_store.clear()
+        config.EVENT_DISPATCH_MODE = "queue"
+        try:
+            events.register("task:start", "inc_counter", self)
+            events.emit("task:start", {"task_id": "task-01"})
+        finally:
+            config.EVENT_DISPATCH_MODE = "sync"
+        self.assertEqual(self.counter, 1)
+        self.assertEqual(queue_store.size(), 1)
+
+        raw_job = queue_store.pop("test-worker")
+        job = json.loads(raw_job)
+        self.assertEqual(job["handler"], "inc_counter")
+        self.assertEqual(job["data"], {"task_id": "task-01"})
+        events.run_job(job)
+        queue_store.ack("test-worker", raw_job)
+        self.assertEqual(self.counter, 2)
+        self.assertEqual(queue_store.size(), 0)
+        self.assertEqual(
+            queue_store.get_handler_stats()["inc_counter"]["calls"], 1
+        )
+
+    def test_batch(self):
+        with events.batch():
+            events.emit("task:start")
+            with events.batch():
+                events.emit("task:stop")
+            self.assertEqual(len(events.batches.messages), 2)
+            self.assertEqual(
+                events.batches.messages[1]["type"], "task:stop"
+            )
+        self.assertIsNone(events.batches.messages)
@@ -0,0 +1,79 @@
+import unittest
+
+from zou.app.stores import job_store
+from zou.app.utils import events, jobs
+
+
+def fail():
+    raise Exception("Failure")
+
+
+class JobsTestCase(unittest.TestCase):
+
+    __name__ = "test_handler"
+
+    def setUp(self):
+        super(JobsTestCase, self).setUp()
+        self.events = []
+        events.unregister_all()
+        events.register("preview-file:ready", "test_handler", self)
+
+    def tearDown(self):
+        super(JobsTestCase, self).tearDown()
+        events.unregister_all()
+
+    def handle_event(self, data={}):
+        self.events.append(data)
+
+    def save_job(self, job_id):
+        job_store.save(job_id, {
+            "id": job_id,
+            "status": "running",
+            "data": {"preview_file_id": "preview-01"},
+            "event": "preview-file:ready",
+            "error": None
+        })
+
+    def test_end_job(self):
+        self.save_job("job-01")
+        result = jobs.run_job("job-01", len, ([1, 2],))
+        self.assertEqual(result, ("job-01", None))
+        jobs.end_job(result)
+        self.assertEqual(jobs.get("job-01")["status"], "done")
+        self.assertEqual(self.events, [{"preview_file_id": "preview-01"}])
+
+    def test_end_job_failed(self):
+        self.save_job("job-02")
+        jobs.end_job(jobs.run_job("job-02", fail, ()))
+        job = jobs.get("job-02")
+        self.assertEqual(job["status"], "failed")
+        self.assertIn("Failure", job["error"])
+        self.assertEqual(self.events, [])
+
+    def test_get_abandoned_job(self):
+        self.save_job("job-03")
+        job_store.set_alive("job-03", 60)
+        self.assertEqual(jobs.get("job-03")["status"], "running")
+        job_store.job_store.delete(job_store.ALIVE_KEY % "job-03")
+        job = jobs.get("job-03")
+        self.assertEqual(job["status"], "failed")
+        self.assertIn("abandoned", job["error"])
+
+    def test_run_queued_job(self):
+        job_store.save("job-04", {
+            "id": "job-04",
+            "status": "queued",
+            "data": {"preview_file_id": "preview-01"},
+            "event": "preview-file:ready",
+            "error": None,
+            "func": "os.path:join",
+            "args": ["a", "b"]
+        })
+        job_store.push("job-04")
+        self.assertEqual(job_store.pop("worker-01"), "job-04")
+        self.assertEqual(job_store.requeue_processing_jobs("worker-01"), 1)
+        self.assertEqual(job_store.pop("worker-01"), "job-04")
+        jobs.run_queued_job("job-04")
+        job_store.ack("worker-01", "job-04")
+        self.assertEqual(jobs.get("job-04")["status"], "done")
+        self.assertEqual(self.events, [{"preview_file_id": "preview-01"}])
@@ -152,6 +152,29 @@ class ThumbnailTestCase(unittest.TestCase):
         self.assertTrue(os.path.exists(file_path))
         self.assertTrue(Image.open(file_path).size, thumbnail.SQUARE_SIZE)
 
+    def test_build_preview_variants(self):
+        preview_id = "123413-12312"
+        file_path_fixture = self.get_fixture_file_path("thumbnails/th01.png")
+        file_name = thumbnail.get_file_name(preview_id)
+        folder_path = thumbnail.get_preview_folder_name("originals", preview_id)
+        fs.mkdir_p(folder_path)
+        fs.copyfile(file_path_fixture, os.path.join(folder_path, file_name))
+        timings = thumbnail.build_preview_variants(preview_id)
+        self.assertEquals(
+            sorted(timings.keys()),
+            ["decode", "encode", "resize"]
+        )
+
+        folder_path = thumbnail.get_preview_folder_name(
+            "thumbnails-square", preview_id)
+        file_path = os.path.join(folder_path, file_name)
+        self.assertEquals(Image.open(file_path).size, thumbnail.SQUARE_SIZE)
+
+        folder_path = thumbnail.get_preview_folder_name(
+            "thumbnails", preview_id)
+        file_path = os.path.join(folder_path, file_name)
+        self.assertEquals(Image.open(file_path).size, thumbnail.RECTANGLE_SIZE)
+
     def test_get_preview_url_path(self):
         preview_id = '123345-12234-121234'
         path = thumbnail.get_preview_url_path(preview_id)
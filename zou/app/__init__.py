@@ -1,6 +1,6 @@
 from flask import Flask
 from flask_restful import current_app
-from flask_jwt_extended import JWTManager
+from flask_jwt_extended import JWTManager, get_jwt_claims
 from flask_principal import Principal, identity_changed, Identity
 from flask_sqlalchemy import SQLAlchemy
 
@@ -16,7 +16,8 @@ db = SQLAlchemy(app)
 
 app.secret_key = app.config["SECRET_KEY"]
 jwt = JWTManager(app)
-Principal(app)
+# Identity is given by the JWT of each request, it's not kept in session.
+Principal(app, use_sessions=False)
 
 
 def configure_auth():
@@ -26,17 +27,48 @@ def configure_auth():
     def check_if_token_is_revoked(decrypted_token):
         return auth_tokens_store.is_revoked(decrypted_token)
 
-    @jwt.user_loader_callback_loader
-    def add_permissions(callback):
+    @jwt.user_claims_loader
+    def add_claims(identity):
+        """
+        Store person id and role in access tokens, so permissions can be
+        computed without loading the person.
+        """
         try:
-            user = persons_service.get_current_user()
-            identity_changed.send(
-                current_app._get_current_object(),
-                identity=Identity(user.id)
-            )
-            return user
+            person = persons_service.get_person_by_identity(identity)
+            return {"id": str(person.id), "role": person.role}
         except PersonNotFoundException:
-            return None
+            return {}
+
+    @jwt.user_loader_callback_loader
+    def add_permissions(jwt_identity):
+        """
+        Build identity from token claims. Claims are checked against the
+        cached person: a token issued before a role change or a
+        deactivation is refused, so its owner must log in again.
+        """
+        claims = get_jwt_claims()
+        if "id" in claims and "role" in claims:
+            try:
+                person = persons_service.get_identity_person(claims["id"])
+            except PersonNotFoundException:
+                return None
+            if person.role != claims["role"] or not person.active:
+                return None
+            identity = Identity(claims["id"])
+            identity.role = claims["role"]
+        else:
+            # Tokens created before claims were added.
+            try:
+                user = persons_service.get_current_user()
+                identity = Identity(user.id)
+            except PersonNotFoundException:
+                return None
+
+        identity_changed.send(
+            current_app._get_current_object(),
+            identity=identity
+        )
+        return identity
 
 
 def load_api():
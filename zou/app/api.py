@@ -1,5 +1,6 @@
 import sys
 
+from zou.app.services import persons_service
 from zou.app.utils import events
 
 from .blueprints.assets import blueprint as assets_blueprint
@@ -25,6 +26,8 @@ def configure(app):
     app.url_map.strict_slashes = False
     configure_api_routes(app)
     register_event_handlers(app)
+    configure_event_batches(app)
+    configure_identity_lookups(app)
     return app
 
 
@@ -58,3 +61,34 @@ def register_event_handlers(app):
     import event_handlers
     events.register_all(event_handlers.event_map)
     return app
+
+
+def configure_event_batches(app):
+    """
+    Send events emitted while a request is processed in one batch at the end
+    of the request.
+    """
+    @app.before_request
+    def start_event_batch():
+        events.start_batch()
+
+    @app.teardown_request
+    def end_event_batch(exception=None):
+        events.end_batch()
+
+    return app
+
+
+def configure_identity_lookups(app):
+    """
+    In debug mode, tell in a response header how many times the current user
+    was retrieved from the database while processing the request.
+    """
+    @app.after_request
+    def add_identity_lookups_header(response):
+        if app.debug:
+            response.headers["X-Identity-Lookups"] = \
+                str(persons_service.get_identity_lookups())
+        return response
+
+    return app
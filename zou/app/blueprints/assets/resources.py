@@ -1,8 +1,9 @@
-from flask import request, abort
+from flask import request, abort, Response
 from flask_restful import Resource, reqparse
 from flask_jwt_extended import jwt_required
+from werkzeug.http import quote_etag
 
-from zou.app.utils import query, permissions
+from zou.app.utils import fields, query, permissions
 from zou.app.models.entity import Entity
 from zou.app.services import (
     assets_service,
@@ -13,6 +14,7 @@ from zou.app.services import (
 )
 
 from zou.app.services.exception import (
+    GridHistoryExpiredException,
     ProjectNotFoundException,
     AssetTypeNotFoundException,
     AssetNotFoundException,
@@ -82,15 +84,57 @@ class AssetsAndTasksResource(Resource):
         """
         Retrieve all entities that are not shot or sequence.
         Adds project name and asset type name and all related tasks.
+
+        When results are filtered on a single project, the since parameter
+        (ISO formatted UTC date) restricts results to the assets modified
+        after this date. Assets removed in the meantime are listed as
+        {"id": ..., "removed": true}. The X-Grid-Updated-At header gives the
+        date to use as since value for the next request.
         """
         try:
             criterions = query.get_query_criterions_from_request(request)
+            since = criterions.pop("since", None)
+            if since is not None:
+                since = fields.get_datetime_object(since)
             if not permissions.has_manager_permissions():
                 user_service.check_criterions_has_task_related(criterions)
-            return assets_service.all_assets_and_tasks(criterions)
+        except ValueError:
+            abort(400)
         except permissions.PermissionDenied:
             abort(403)
 
+        if list(criterions.keys()) == ["project_id"]:
+            return self.get_project_assets(criterions["project_id"], since)
+        elif since is not None:
+            abort(400)
+        else:
+            return assets_service.all_assets_and_tasks(criterions)
+
+    def get_project_assets(self, project_id, since=None):
+        etag = assets_service.get_assets_grid_etag(project_id)
+        headers = {"ETag": quote_etag(etag)}
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers=headers)
+
+        # The date is taken first: rows written while the response is built
+        # are sent again on next request rather than missed.
+        last_update = assets_service.get_assets_grid_last_update(project_id)
+        headers["X-Grid-Updated-At"] = last_update.isoformat()
+        try:
+            assets = assets_service.get_assets_grid(project_id, since)
+        except GridHistoryExpiredException:
+            abort(410, "Changes since given date are not available anymore.")
+
+        if since is not None:
+            assets += [
+                {"id": asset_id, "removed": True}
+                for asset_id in assets_service.get_assets_grid_removed_ids(
+                    project_id,
+                    since
+                )
+            ]
+        return assets, 200, headers
+
 
 class AssetTypeResource(Resource):
 
@@ -56,17 +56,19 @@ def is_from_browser(user_agent):
 @identity_loaded.connect_via(app)
 def on_identity_loaded(sender, identity):
     if identity.id is not None:
-        from zou.app.services import persons_service
-        identity.user = persons_service.get_person(identity.id)
+        role = getattr(identity, "role", None)
+        if role is None:
+            from zou.app.services import persons_service
+            identity.user = persons_service.get_identity_person(identity.id)
+            role = identity.user.role
 
-        if hasattr(identity.user, "id"):
-            identity.provides.add(UserNeed(identity.user.id))
+        identity.provides.add(UserNeed(identity.id))
 
-        if identity.user.role == "admin":
+        if role == "admin":
             identity.provides.add(RoleNeed("admin"))
             identity.provides.add(RoleNeed("manager"))
 
-        if identity.user.role == "manager":
+        if role == "manager":
             identity.provides.add(RoleNeed("manager"))
 
         return identity
@@ -33,6 +33,7 @@ from .entity_type import (
 )
 from .comments import CommentsResource, CommentResource
 from .time_spent import TimeSpentsResource, TimeSpentResource
+from .tombstone import TombstonesResource
 
 
 routes = [
@@ -69,7 +70,8 @@ routes = [
     ("/data/comments", CommentsResource),
     ("/data/comments/<instance_id>", CommentResource),
     ("/data/time-spents/", TimeSpentsResource),
-    ("/data/time-spents/<instance_id>", TimeSpentResource)
+    ("/data/time-spents/<instance_id>", TimeSpentResource),
+    ("/data/tombstones", TombstonesResource)
 ]
 
 blueprint = Blueprint("/data", "data")
@@ -1,5 +1,6 @@
 import math
 import json
+import datetime
 import sqlalchemy.orm as orm
 
 from flask import request, abort
@@ -8,7 +9,12 @@ from flask_jwt_extended import jwt_required
 
 from sqlalchemy.exc import IntegrityError, StatementError
 
-from zou.app.utils import permissions
+from zou.app.models.serializer import get_serializer
+from zou.app.utils import fields, permissions, query as query_utils
+
+PAGINATION_KEYS = ["page", "after", "limit", "with_total"]
+UPDATED_SINCE_KEY = "updated_since"
+UPDATED_SINCE_HEADER = "X-Updated-Since"
 
 
 class BaseModelsResource(Resource):
@@ -21,8 +27,16 @@ class BaseModelsResource(Resource):
         if query is None:
             query = self.model.query
 
+        query = self.with_relations(query)
         return self.model.serialize_list(query.all())
 
+    def with_relations(self, query):
+        """
+        Load relationships of all listed entries in a few queries instead of
+        letting the serializer lazy load them row by row.
+        """
+        return query.options(*get_serializer(self.model).relation_loaders())
+
     def paginated_entries(self, query, page):
         total = query.count()
         limit = current_app.config['NB_RECORDS_PER_PAGE']
@@ -45,13 +59,44 @@ class BaseModelsResource(Resource):
         }
         return result
 
+    def keyset_entries(self, query, after, limit, with_total=False):
+        """
+        Return entries ordered by id, starting right after the entry referenced
+        by given cursor. The cost of a page doesn't depend on its depth because
+        no offset is involved. Total is computed only on demand.
+        """
+        total = None
+        if with_total:
+            total = query.count()
+
+        if after:
+            query = query.filter(
+                self.model.id > query_utils.decode_cursor(after)
+            )
+        query = query.order_by(self.model.id).limit(limit + 1)
+        entries = self.with_relations(query).all()
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = query_utils.encode_cursor(entries[-1].id)
+
+        result = {
+            "data": self.model.serialize_list(entries),
+            "limit": limit,
+            "next_cursor": next_cursor
+        }
+        if with_total:
+            result["total"] = total
+        return result
+
     def build_filters(self, options):
         many_join_filter = []
         in_filter = []
         filters = {}
 
         for key, value in options.items():
-            if key != "page":
+            if key not in PAGINATION_KEYS and key != UPDATED_SINCE_KEY:
                 field_key = getattr(self.model, key)
                 expr = field_key.property
 
@@ -72,12 +117,12 @@ class BaseModelsResource(Resource):
 
         return (many_join_filter, in_filter, filters)
 
-    def apply_filters(self, query):
+    def apply_filters(self, options):
         (
             many_join_filter,
             in_filter,
             criterions
-        ) = self.build_filters(query)
+        ) = self.build_filters(options)
 
         query = self.model.query.filter_by(**criterions)
 
@@ -87,8 +132,36 @@ class BaseModelsResource(Resource):
         for (key, value) in many_join_filter:
             query = query.filter(getattr(self.model, key).any(id=value))
 
+        if UPDATED_SINCE_KEY in options:
+            query = query.filter(
+                self.model.updated_at > self.get_updated_since(options)
+            )
+
         return query
 
+    def get_updated_since(self, options):
+        """
+        Parse the updated_since filter (ISO formatted UTC date). It allows
+        clients to retrieve only entries modified after their last
+        synchronization. Deleted entries are listed as tombstones. The value
+        to send is given by the X-Updated-Since header of the previous list
+        response (see get_next_updated_since).
+        """
+        return fields.get_datetime_object(options[UPDATED_SINCE_KEY])
+
+    def get_next_updated_since(self):
+        """
+        Return the updated_since value to use for the next synchronization:
+        the current date minus UPDATED_SINCE_MARGIN seconds. Modification
+        dates are set on each API host when changes are flushed, not when
+        they are committed. The margin covers late commits and clock drifts
+        between hosts: such entries are sent twice rather than missed.
+        """
+        margin = current_app.config["UPDATED_SINCE_MARGIN"]
+        next_updated_since = datetime.datetime.utcnow() - \
+            datetime.timedelta(seconds=margin)
+        return next_updated_since.isoformat()
+
     def check_read_permissions(self):
         return permissions.check_manager_permissions()
 
@@ -99,23 +172,41 @@ class BaseModelsResource(Resource):
     def get(self):
         """
         Retrieve all entries for given model. Filters can be specified in the
-        query string.
+        query string. The X-Updated-Since header gives the updated_since
+        value to send to retrieve only the next modifications.
         """
         try:
             self.check_read_permissions()
+            headers = {UPDATED_SINCE_HEADER: self.get_next_updated_since()}
             query = self.model.query
             if not request.args:
-                return self.all_entries(query)
+                return self.all_entries(query), 200, headers
             else:
                 options = request.args
                 query = self.apply_filters(options)
                 page = int(options.get("page", "-1"))
                 is_paginated = page > -1
+                is_keyset_paginated = "after" in options or "limit" in options
 
                 if is_paginated:
-                    return self.paginated_entries(query, page)
+                    return self.paginated_entries(query, page), 200, headers
+                elif is_keyset_paginated:
+                    limit = int(options.get(
+                        "limit",
+                        current_app.config["NB_RECORDS_PER_PAGE"]
+                    ))
+                    if limit < 1:
+                        return {"error": "Limit must be positive."}, 400
+                    return self.keyset_entries(
+                        query,
+                        options.get("after", ""),
+                        limit,
+                        options.get("with_total", "false") == "true"
+                    ), 200, headers
                 else:
-                    return self.all_entries(query)
+                    return self.all_entries(query), 200, headers
+        except ValueError as exception:
+            return {"error": str(exception)}, 400
         except permissions.PermissionDenied:
             abort(403)
 
@@ -0,0 +1,42 @@
+from flask import request, abort
+
+from zou.app.models.tombstone import Tombstone
+from zou.app.utils import permissions
+
+from .base import BaseModelsResource
+
+# Models that every user can list (see their check_read_permissions).
+OPEN_MODEL_NAMES = ["Person", "ProjectStatus", "TaskStatus", "TaskType"]
+
+
+class TombstonesResource(BaseModelsResource):
+
+    def __init__(self):
+        BaseModelsResource.__init__(self, Tombstone)
+
+    def check_read_permissions(self):
+        """
+        Tombstones of a model can be read by the users allowed to list it.
+        Other users must filter tombstones on such a model name.
+        """
+        if request.args.get("model_name") in OPEN_MODEL_NAMES:
+            return True
+        else:
+            return permissions.check_manager_permissions()
+
+    def get_updated_since(self, options):
+        """
+        Tombstones are kept TOMBSTONES_TTL days. Deletions older than that
+        are not known anymore: a client that didn't synchronize since must
+        download whole collections again (410 error).
+        """
+        updated_since = BaseModelsResource.get_updated_since(self, options)
+        if updated_since < Tombstone.get_horizon():
+            abort(410)
+        return updated_since
+
+    def post(self):
+        """
+        Tombstones are created only when entries are deleted.
+        """
+        abort(405)
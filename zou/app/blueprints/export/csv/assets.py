@@ -41,12 +41,13 @@ class AssetsCsvExport(BaseCsvExport):
     def build_row(self, asset_data):
         (asset, project_name, category_name) = asset_data
 
-        if asset.description is None:
-            asset.description = ""
+        description = asset.description
+        if description is None:
+            description = ""
 
         return [
             project_name,
             category_name,
             asset.name,
-            asset.description
+            description
         ]
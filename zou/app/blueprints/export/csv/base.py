@@ -6,6 +6,13 @@ from zou.app.utils import csv_utils, permissions
 
 
 class BaseCsvExport(BaseModelResource):
+    """
+    Export query results as a CSV file. Rows are fetched by batches with a
+    server side cursor and sent to the client as soon as they are built, so
+    memory usage doesn't depend on the export size.
+    """
+
+    batch_size = 1000
 
     def __init__(self, model):
         BaseModelResource.__init__(self, model)
@@ -17,12 +24,15 @@ class BaseCsvExport(BaseModelResource):
     def get(self):
         try:
             self.check_permissions()
-            csv_content = []
-            csv_content.append(self.build_headers())
-            results = self.build_query().all()
-            for result in results:
-                csv_content.append(self.build_row(result))
         except permissions.PermissionDenied:
             abort(403)
 
-        return csv_utils.build_csv_response(csv_content)
+        return csv_utils.build_csv_stream_response(self.build_csv_rows())
+
+    def build_csv_rows(self):
+        yield self.build_headers()
+        query = self.build_query() \
+            .execution_options(stream_results=True) \
+            .yield_per(self.batch_size)
+        for result in query:
+            yield self.build_row(result)
@@ -1,8 +1,13 @@
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import aliased
+
+from zou.app import db
 from zou.app.blueprints.export.csv.base import BaseCsvExport
 
 from zou.app.models.task_status import TaskStatus
 from zou.app.models.task_type import TaskType
-from zou.app.models.task import Task
+from zou.app.models.task import Task, association_table
 from zou.app.models.person import Person
 from zou.app.models.project import Project
 from zou.app.models.department import Department
@@ -53,6 +58,7 @@ class TasksCsvExport(BaseCsvExport):
         query = query.add_columns(Entity.name)
         query = query.add_columns(Person.first_name)
         query = query.add_columns(Person.last_name)
+        query = query.add_columns(self.build_assignees_query())
         query = query.order_by(
             Project.name,
             Department.name,
@@ -63,6 +69,26 @@ class TasksCsvExport(BaseCsvExport):
 
         return query
 
+    def build_assignees_query(self):
+        """
+        Subquery aggregating assignee names of each task, to get them within
+        the export query instead of loading them task by task.
+        """
+        assignee = aliased(Person)
+        assignee_name = assignee.first_name + " " + assignee.last_name
+        return db.session.query(
+            func.string_agg(
+                assignee_name,
+                aggregate_order_by(literal(", "), assignee_name)
+            )
+        ) \
+            .select_from(association_table) \
+            .join(assignee, assignee.id == association_table.c.person) \
+            .filter(association_table.c.task == Task.id) \
+            .correlate(Task) \
+            .as_scalar() \
+            .label("assignees")
+
     def build_row(self, task_data):
         (
             task,
@@ -74,8 +100,10 @@ class TasksCsvExport(BaseCsvExport):
             entity_name,
             assigner_first_name,
             assigner_last_name,
+            persons
         ) = task_data
-        persons = task.assignees_as_string()
+        if persons is None:
+            persons = ""
 
         start_date = ""
         if task.start_date is not None:
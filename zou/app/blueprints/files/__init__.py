@@ -4,8 +4,10 @@ from zou.app.utils.api import configure_api_from_blueprint
 from .resources import (
     FolderPathResource,
     FilePathResource,
+    FilePathsResource,
     SetTreeResource,
     GetTaskFromPathResource,
+    GetTasksFromPathsResource,
     CommentWorkingFileResource,
     GetNextOutputFileResource,
     LastWorkingFilesResource,
@@ -26,6 +28,8 @@ routes = [
     ("/data/tasks/<task_id>/folder-path", FolderPathResource),
     ("/data/tasks/<task_id>/file-path", FilePathResource),
     ("/data/tasks/from-path", GetTaskFromPathResource),
+    ("/data/tasks/from-paths", GetTasksFromPathsResource),
+    ("/data/tasks/file-paths", FilePathsResource),
     (
         "/data/tasks/<task_id>/output-types/<output_type_id>/next-revision",
         GetNextOutputFileResource
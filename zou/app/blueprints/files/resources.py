@@ -213,6 +213,76 @@ class FilePathResource(Resource):
         )
 
 
+class FilePathsResource(Resource):
+    """
+    Return folder paths and file names for a list of tasks and parameters.
+    All paths are built at once, which is much faster than requesting them
+    one by one.
+    """
+
+    def __init__(self):
+        Resource.__init__(self)
+
+    @jwt_required
+    def post(self):
+        (path_queries, separator) = self.get_arguments()
+
+        try:
+            paths = file_tree.get_file_paths(path_queries, sep=separator)
+            if not permissions.has_manager_permissions():
+                project_ids = set(path["project_id"] for path in paths)
+                for project_id in project_ids:
+                    user_service.check_has_task_related(project_id)
+        except TaskNotFoundException:
+            return {
+                "error": "A given task does not exist.",
+                "received_data": request.json,
+            }, 404
+        except OutputTypeNotFoundException:
+            return {
+                "error": "A given output type does not exist.",
+                "received_data": request.json,
+            }, 400
+        except SoftwareNotFoundException:
+            return {
+                "error": "A given software does not exist.",
+                "received_data": request.json,
+            }, 400
+        except MalformedFileTreeException:
+            return {
+                "error":
+                    "Tree is not properly written, check modes and variables",
+                "received_data": request.json,
+            }, 400
+        except permissions.PermissionDenied:
+            abort(403)
+
+        return paths, 200
+
+    def get_arguments(self):
+        geometry_type = files_service.get_or_create_output_type("geometry")
+        maxsoft = files_service.get_or_create_software("3ds Max", "max", ".max")
+
+        parser = reqparse.RequestParser()
+        parser.add_argument(
+            "paths",
+            type=dict,
+            action="append",
+            help="A list of path parameters is required.",
+            required=True
+        )
+        parser.add_argument("sep", default="/")
+        args = parser.parse_args()
+
+        path_queries = []
+        for path_query in args["paths"]:
+            path_query = dict(path_query)
+            path_query.setdefault("software_id", maxsoft.id)
+            path_query.setdefault("output_type_id", geometry_type.id)
+            path_queries.append(path_query)
+        return (path_queries, args["sep"])
+
+
 class SetTreeResource(Resource):
 
     @jwt_required
@@ -330,6 +400,69 @@ class GetTaskFromPathResource(Resource):
         )
 
 
+class GetTasksFromPathsResource(Resource):
+    """
+    Return the tasks matching given paths. Paths are resolved at once with
+    the project path index.
+    """
+
+    @jwt_required
+    def post(self):
+        (
+            path_queries,
+            project_id,
+            mode,
+            sep
+        ) = self.get_arguments()
+
+        try:
+            project = projects_service.get_project(project_id)
+            if not permissions.has_manager_permissions():
+                user_service.check_has_task_related(project_id)
+
+            results = file_tree.get_tasks_from_paths(
+                project,
+                path_queries,
+                mode,
+                sep
+            )
+        except ProjectNotFoundException:
+            return {
+                "error": "Given project does not exist.",
+                "received_data": request.json,
+            }, 400
+        except permissions.PermissionDenied:
+            abort(403)
+
+        return results
+
+    def get_arguments(self):
+        parser = reqparse.RequestParser()
+        parser.add_argument(
+            "paths",
+            type=dict,
+            action="append",
+            help="A list of paths with their type (asset or shot) is "
+                 "required.",
+            required=True
+        )
+        parser.add_argument(
+            "project_id",
+            help="The project ID is required.",
+            required=True
+        )
+        parser.add_argument("mode", "working")
+        parser.add_argument("sep", "/")
+        args = parser.parse_args()
+
+        return (
+            args["paths"],
+            args["project_id"],
+            args["mode"],
+            args["sep"]
+        )
+
+
 class CommentWorkingFileResource(Resource):
 
     @jwt_required
@@ -5,10 +5,11 @@ keyword.
 from flask import Blueprint
 from zou.app.utils.api import configure_api_from_blueprint
 
-from .resources import IndexResource
+from .resources import IndexResource, StatsResource
 
 routes = [
-    ("/", IndexResource)
+    ("/", IndexResource),
+    ("/stats", StatsResource)
 ]
 
 blueprint = Blueprint("index", "index")
@@ -1,7 +1,12 @@
+from flask import abort
 from flask_restful import Resource
+from flask_jwt_extended import jwt_required
+
 from zou import __version__
 
 from zou.app import app
+from zou.app.stores import connections, queue_store
+from zou.app.utils import cache, permissions
 
 
 class IndexResource(Resource):
@@ -10,3 +15,24 @@ class IndexResource(Resource):
             'api': app.config["APP_NAME"],
             'version': __version__
         }
+
+
+class StatsResource(Resource):
+    """
+    Return usage statistics of the caches living in the current worker
+    process (size, hits and misses), of its Redis connection pools and of
+    the queued event handlers.
+    """
+
+    @jwt_required
+    def get(self):
+        try:
+            permissions.check_admin_permissions()
+        except permissions.PermissionDenied:
+            abort(403)
+        return {
+            "caches": cache.get_stats(),
+            "redis_pools": connections.get_stats(),
+            "event_queue_size": queue_store.size(),
+            "event_handlers": queue_store.get_handler_stats()
+        }
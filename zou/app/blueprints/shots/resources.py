@@ -1,6 +1,7 @@
-from flask import request, abort
+from flask import request, abort, Response
 from flask_restful import Resource, reqparse
 from flask_jwt_extended import jwt_required
+from werkzeug.http import quote_etag
 
 from zou.app.models.entity import Entity
 
@@ -195,7 +196,8 @@ class ShotsAndTasksResource(Resource):
     def get(self):
         """
         Retrieve all shots, adds project name and asset type name and all
-        related tasks.
+        related tasks. When results are filtered on a single project, an ETag
+        is sent so clients can revalidate their copy with If-None-Match.
         """
         try:
             criterions = query.get_query_criterions_from_request(request)
@@ -204,7 +206,19 @@ class ShotsAndTasksResource(Resource):
         except permissions.PermissionDenied:
             abort(403)
 
-        return shots_service.get_shots_and_tasks(criterions)
+        if list(criterions.keys()) == ["project_id"]:
+            etag = shots_service.get_shots_grid_etag(criterions["project_id"])
+            headers = {"ETag": quote_etag(etag)}
+            if request.if_none_match.contains(etag):
+                return Response(status=304, headers=headers)
+            else:
+                return (
+                    shots_service.get_shots_and_tasks(criterions),
+                    200,
+                    headers
+                )
+        else:
+            return shots_service.get_shots_and_tasks(criterions)
 
 
 class ProjectShotsResource(Resource):
@@ -29,6 +29,9 @@ class BaseCsvImportResource(Resource):
             self.prepare_import()
             with open(file_path) as csvfile:
                 reader = csv.DictReader(csvfile)
+                if request.args.get("bulk", "false") == "true":
+                    return self.import_rows(reader)
+
                 for row in reader:
                     result.append(self.import_row(row))
 
@@ -47,6 +50,12 @@ class BaseCsvImportResource(Resource):
     def import_row(self):
         pass
 
+    def import_rows(self, rows):
+        """
+        Bulk import, available only for resources that implement it.
+        """
+        abort(400, "Bulk import is not available for this data type.")
+
     def add_to_cache_if_absent(self, cache, retrieve_function, name):
         if name not in cache:
             cache[name] = retrieve_function(name)
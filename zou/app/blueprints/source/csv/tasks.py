@@ -2,18 +2,44 @@ import datetime
 
 from sqlalchemy.exc import IntegrityError
 
+from zou.app import db
 from zou.app.models.project import Project
 from zou.app.models.entity import Entity
 from zou.app.models.entity_type import EntityType
+from zou.app.models.department import Department
 from zou.app.models.person import Person
-from zou.app.models.task import Task
-from zou.app.services import shots_service, tasks_service
+from zou.app.models.task import Task, association_table
+from zou.app.models.task_status import TaskStatus
+from zou.app.models.task_type import TaskType
+from zou.app.services import grids_service, shots_service
+from zou.app.utils import fields
 
 from zou.app.blueprints.source.csv.base import BaseCsvImportResource
 
 
 class TasksCsvImportResource(BaseCsvImportResource):
 
+    columns = [
+        "Project",
+        "Department",
+        "Task Type",
+        "Task Status",
+        "Asset Type",
+        "Asset",
+        "Episode",
+        "Sequence",
+        "Shot",
+        "Name",
+        "Assigner",
+        "Assignee",
+        "Duration",
+        "Estimation",
+        "Start Date",
+        "Real Start Date",
+        "Due Date",
+        "End Date"
+    ]
+
     def prepare_import(self):
         self.projects = {}
         self.sequences = {}
@@ -22,9 +48,7 @@ class TasksCsvImportResource(BaseCsvImportResource):
         self.entity_types = {}
         self.entities = {}
         self.persons = {}
-        self.departments = {}
-        self.task_types = {}
-        self.task_statuses = {}
+        self.clear_reference_cache()
 
         for project in Project.query.all():
             self.projects[project.name] = project
@@ -65,83 +89,136 @@ class TasksCsvImportResource(BaseCsvImportResource):
             result = datetime.datetime.strptime(date, "%Y-%m-%d")
         return result
 
-    def import_row(self, row):
-        project_name = row["Project"]
-        department_name = row["Department"]
-        task_type_name = row["Task Type"]
-        task_status_name = row["Task Status"]
-        entity_type_name = row["Asset Type"]
-        entity_name = row["Asset"]
-        episode_name = row["Episode"]
-        sequence_name = row["Sequence"]
-        shot_name = row["Shot"]
-        name = row["Name"]
-        assigner_name = row["Assigner"]
-        assignee_name = row["Assignee"]
-        duration = int(row["Duration"]) * 3600
-        estimation = int(row["Estimation"]) * 3600
-        start_date = self.normalize_date(row["Start Date"])
-        real_start_date = self.normalize_date(row["Real Start Date"])
-        due_date = self.normalize_date(row["Due Date"])
-        end_date = self.normalize_date(row["End Date"])
+    def read_row(self, row):
+        return {
+            "project_name": row["Project"],
+            "department_name": row["Department"],
+            "task_type_name": row["Task Type"],
+            "task_status_name": row["Task Status"],
+            "entity_type_name": row["Asset Type"],
+            "entity_name": row["Asset"],
+            "episode_name": row["Episode"],
+            "sequence_name": row["Sequence"],
+            "shot_name": row["Shot"],
+            "name": row["Name"],
+            "assigner_name": row["Assigner"],
+            "assignee_name": row["Assignee"],
+            "duration": int(row["Duration"]) * 3600,
+            "estimation": int(row["Estimation"]) * 3600,
+            "start_date": self.normalize_date(row["Start Date"]),
+            "real_start_date": self.normalize_date(row["Real Start Date"]),
+            "due_date": self.normalize_date(row["Due Date"]),
+            "end_date": self.normalize_date(row["End Date"])
+        }
 
-        try:
-            self.add_to_cache_if_absent(
-                self.task_statuses,
-                tasks_service.get_or_create_status,
-                task_status_name
-            )
-            task_status_id = self.get_id_from_cache(
-                self.task_statuses,
-                task_status_name
-            )
+    def resolve_row(self, values):
+        """
+        Find ids of the rows referenced by given row values. Missing task
+        statuses, departments and task types are added to the session
+        without commit, so they are saved or rolled back with the tasks.
+        Return task data and the assignee (None if there is no assignee).
+        """
+        project_id = self.projects[values["project_name"]].id
+        assigner_id = self.persons[values["assigner_name"]].id
+        assignee = self.persons.get(values["assignee_name"], None)
+
+        if len(values["shot_name"]) > 0:
+            episode_id = self.episodes[
+                str(project_id) + values["episode_name"]
+            ].id
+            sequence_id = self.sequences[
+                str(project_id) + str(episode_id) + values["sequence_name"]
+            ].id
+            entity_id = self.shots[
+                str(project_id) + str(sequence_id) + values["shot_name"]
+            ]["id"]
+        else:
+            entity_type_id = self.entity_types[values["entity_type_name"]].id
+            entity_id = self.entities[
+                str(project_id) + str(entity_type_id) + values["entity_name"]
+            ].id
 
-            self.add_to_cache_if_absent(
-                self.departments,
-                tasks_service.get_or_create_department,
-                department_name
+        task_status_name = values["task_status_name"]
+        department_name = values["department_name"]
+        task_type_name = values["task_type_name"]
+
+        if task_status_name not in self.task_statuses:
+            self.task_statuses[task_status_name] = self.get_or_add(
+                TaskStatus,
+                task_status_name,
+                short_name=task_status_name.lower(),
+                color="#f5f5f5"
             )
-            department_id = self.get_id_from_cache(
-                self.departments,
-                department_name
+        task_status_id = self.get_id_from_cache(
+            self.task_statuses,
+            task_status_name
+        )
+
+        if department_name not in self.departments:
+            self.departments[department_name] = self.get_or_add(
+                Department,
+                department_name,
+                color="#000000"
             )
+        department_id = self.get_id_from_cache(
+            self.departments,
+            department_name
+        )
 
-            task_type_key = "%s-%s" % (department_id, task_type_name)
-            if task_type_key not in self.task_types:
-                department = self.departments[department_name]
-                self.task_types[task_type_key] = \
-                    tasks_service.get_or_create_task_type(
-                        department,
-                        task_type_name
-                    )
-
-            task_type_id = self.get_id_from_cache(self.task_types, task_type_key)
-            project_id = self.projects[project_name].id
-            assigner_id = self.persons[assigner_name].id
-            assignee = self.persons.get(assignee_name, None)
-
-            if len(shot_name) > 0:
-                episode_id = self.episodes[str(project_id) + episode_name].id
-                sequence_id = self.sequences[str(project_id) + str(episode_id) + sequence_name].id
-                entity_id = self.shots[str(project_id) + str(sequence_id) + shot_name]["id"]
-            else:
-                entity_type_id = self.entity_types[entity_type_name].id
-                entity_id = self.entities[str(project_id) + str(entity_type_id) + entity_name].id
-
-            task = Task.create(
-                name=name,
-                project_id=project_id,
-                task_type_id=task_type_id,
-                entity_id=entity_id,
-                task_status_id=task_status_id,
-                assigner_id=assigner_id,
-                duration=duration,
-                estimation=estimation,
-                start_date=start_date,
-                end_date=end_date,
-                real_start_date=real_start_date,
-                due_date=due_date
+        task_type_key = "%s-%s" % (department_id, task_type_name)
+        if task_type_key not in self.task_types:
+            self.task_types[task_type_key] = self.get_or_add(
+                TaskType,
+                task_type_name,
+                department_id=department_id,
+                color="#888888",
+                priority=1,
+                for_shots=False
             )
+        task_type_id = self.get_id_from_cache(self.task_types, task_type_key)
+
+        task_data = {
+            "name": values["name"],
+            "project_id": project_id,
+            "task_type_id": task_type_id,
+            "entity_id": entity_id,
+            "task_status_id": task_status_id,
+            "assigner_id": assigner_id,
+            "duration": values["duration"],
+            "estimation": values["estimation"],
+            "start_date": values["start_date"],
+            "end_date": values["end_date"],
+            "real_start_date": values["real_start_date"],
+            "due_date": values["due_date"]
+        }
+        return (task_data, assignee)
+
+    def get_or_add(self, model, name, **data):
+        """
+        Return the entry of given model with given name. A missing entry is
+        flushed to get its id, the import commits it.
+        """
+        instance = model.get_by(name=name)
+        if instance is None:
+            instance = model(name=name, **data)
+            db.session.add(instance)
+            db.session.flush()
+        return instance
+
+    def clear_reference_cache(self):
+        """
+        Entries created by a rolled back transaction don't exist anymore.
+        """
+        self.departments = {}
+        self.task_types = {}
+        self.task_statuses = {}
+
+    def import_row(self, row):
+        values = self.read_row(row)
+
+        try:
+            (task_data, assignee) = self.resolve_row(values)
+            task = Task.create(**task_data)
             if assignee is not None:
                 task.assignees.append(assignee)
             task.save()
@@ -151,6 +228,147 @@ class TasksCsvImportResource(BaseCsvImportResource):
         except KeyError:
             return None
         except IntegrityError:
+            db.session.rollback()
+            self.clear_reference_cache()
             return None
 
         return task
+
+    def import_rows(self, rows):
+        """
+        Bulk mode: all rows are validated and resolved in memory first. Then
+        tasks and assignations are written with multi-row inserts. Missing
+        task statuses, departments and task types are committed in the same
+        single transaction. Rows that can't be imported are listed in the
+        returned error report with their line number.
+        """
+        missing_columns = [
+            column for column in self.columns
+            if column not in (rows.fieldnames or [])
+        ]
+        if len(missing_columns) > 0:
+            raise KeyError(missing_columns[0])
+
+        tasks = []
+        assignations = []
+        errors = []
+        task_keys = set()
+        now = datetime.datetime.utcnow()
+        for (line_number, row) in enumerate(rows, 2):
+            try:
+                (task_data, assignee) = \
+                    self.resolve_row(self.read_row(row))
+            except KeyError as e:
+                errors.append({
+                    "line": line_number,
+                    "error": "Unknown value: %s" % e
+                })
+                continue
+            except (TypeError, ValueError) as e:
+                errors.append({
+                    "line": line_number,
+                    "error": "Wrong value: %s" % e
+                })
+                continue
+            except IntegrityError as e:
+                return self.cancel_import(e)
+
+            task_key = self.get_task_key(task_data)
+            if task_key in task_keys:
+                errors.append({
+                    "line": line_number,
+                    "error": "Task is listed twice in the file."
+                })
+                continue
+            task_keys.add(task_key)
+
+            task_data["id"] = fields.gen_uuid()
+            task_data["created_at"] = now
+            task_data["updated_at"] = now
+            tasks.append((line_number, task_data))
+            if assignee is not None:
+                assignations.append({
+                    "task": task_data["id"],
+                    "person": assignee.id
+                })
+
+        existing_task_keys = self.get_existing_task_keys(
+            set(task_data["project_id"] for (_, task_data) in tasks)
+        )
+        for (line_number, task_data) in tasks:
+            if self.get_task_key(task_data) in existing_task_keys:
+                errors.append({
+                    "line": line_number,
+                    "error": "Task already exists."
+                })
+        task_rows = [
+            task_data for (_, task_data) in tasks
+            if self.get_task_key(task_data) not in existing_task_keys
+        ]
+        task_ids = set(task_data["id"] for task_data in task_rows)
+        assignations = [
+            assignation for assignation in assignations
+            if assignation["task"] in task_ids
+        ]
+
+        try:
+            for chunk in self.get_chunks(task_rows):
+                db.session.execute(Task.__table__.insert().values(chunk))
+            for chunk in self.get_chunks(assignations):
+                db.session.execute(association_table.insert().values(chunk))
+            db.session.commit()
+        except IntegrityError as e:
+            return self.cancel_import(e)
+
+        changes = {}
+        for task_data in task_rows:
+            changes.setdefault(task_data["project_id"], set()) \
+                .add(task_data["entity_id"])
+        grids_service.mark_changes(changes)
+
+        errors.sort(key=lambda error: error["line"])
+        return {
+            "created": len(task_rows),
+            "errors": errors
+        }, 201
+
+    def cancel_import(self, error):
+        """
+        Roll back the whole import, including the reference entries created
+        for it.
+        """
+        db.session.rollback()
+        self.clear_reference_cache()
+        return {
+            "error": "Tasks can't be saved: %s" % error.orig
+        }, 400
+
+    def get_task_key(self, task_data):
+        return (
+            task_data["name"],
+            str(task_data["project_id"]),
+            str(task_data["task_type_id"]),
+            str(task_data["entity_id"])
+        )
+
+    def get_existing_task_keys(self, project_ids):
+        if len(project_ids) == 0:
+            return set()
+        query = Task.query \
+            .filter(Task.project_id.in_(project_ids)) \
+            .with_entities(
+                Task.name,
+                Task.project_id,
+                Task.task_type_id,
+                Task.entity_id
+            )
+        return set(self.get_task_key({
+            "name": name,
+            "project_id": project_id,
+            "task_type_id": task_type_id,
+            "entity_id": entity_id
+        }) for (name, project_id, task_type_id, entity_id) in query)
+
+    def get_chunks(self, rows, chunk_size=1000):
+        for index in range(0, len(rows), chunk_size):
+            yield rows[index:index + chunk_size]
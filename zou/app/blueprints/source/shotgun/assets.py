@@ -22,16 +22,21 @@ from zou.app.services.exception import AssetNotFoundException
 
 class ImportShotgunAssetsResource(BaseImportShotgunResource):
 
+    model = Entity
+
     def __init__(self):
         BaseImportShotgunResource.__init__(self)
 
     def prepare_import(self):
         entity_type_names = self.extract_entity_type_names(self.sg_entries)
         assets_service.save_asset_types(entity_type_names)
-        self.project_ids = Project.get_id_map()
-        self.entity_type_ids = EntityType.get_id_map(field="name")
+        self.project_ids = self.get_id_map(Project)
+        self.entity_type_ids = self.get_id_map(EntityType, field="name")
         self.parent_map = {}
 
+    def get_prefetch_query(self):
+        return assets_service.build_assets_query()
+
     def extract_entity_type_names(self, sg_assets):
         return {
             x["sg_asset_type"] for x in sg_assets
@@ -56,44 +61,42 @@ class ImportShotgunAssetsResource(BaseImportShotgunResource):
         }
 
     def import_entry(self, data):
-        entity = None
         parent_shotgun_ids = data["parent_shotgun_ids"]
         del data["parent_shotgun_ids"]
 
-        try:
-            entity = self.save_entity(data)
-        except IntegrityError:
-            current_app.logger.error(
-                "Similar asset already exists "
-                "or project is missing: %s" % data
-            )
-
-        if entity is not None:
-            for parent_shotgun_id in parent_shotgun_ids:
-                self.parent_map.setdefault(parent_shotgun_id, [])
-                self.parent_map[parent_shotgun_id].append(Entity.get(entity.id))
+        entity = self.save_entity(data)
+        for parent_shotgun_id in parent_shotgun_ids:
+            self.parent_map.setdefault(parent_shotgun_id, set())
+            self.parent_map[parent_shotgun_id].add(entity.id)
 
         return entity
 
     def save_entity(self, data):
-        try:
-            entity = assets_service.get_asset_by_shotgun_id(data["shotgun_id"])
-            entity.update(data)
+        entity = self.get_existing_entry(data)
+        if entity is not None:
+            self.update_entry(entity, data)
             current_app.logger.info("Entity updated: %s" % entity)
-        except AssetNotFoundException:
-            entity = Entity(**data)
-            entity.save()
+        else:
+            entity = self.create_entry(data)
             current_app.logger.info("Entity created: %s" % entity)
         return entity
 
     def post_processing(self):
         # We handle the fact that an asset can have multiple parents by using
-        # the entities out field as a children field.
+        # the entities out field as a children field. Children ids of entries
+        # that failed to be imported are ignored.
         for key in self.parent_map.keys():
             entity = Entity.get_by(shotgun_id=key)
             if entity is not None:
-                entity.update({"entities_out": self.parent_map[key]})
-                entity.save()
+                children = Entity.query \
+                    .filter(Entity.id.in_(self.parent_map[key])) \
+                    .all()
+                try:
+                    entity.update({"entities_out": children})
+                except IntegrityError:
+                    current_app.logger.error(
+                        "Asset links can't be saved for: %s" % entity
+                    )
 
         return self.parent_map
 
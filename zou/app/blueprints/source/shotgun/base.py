@@ -1,7 +1,11 @@
+import json
+
 from flask import request, abort
 from flask_restful import Resource, current_app
 from flask_jwt_extended import jwt_required
 
+from zou.app import db
+from zou.app.services import assets_service
 from zou.app.utils import fields, permissions
 from zou.app.blueprints.source.shotgun.exception import (
     ShotgunEntryImportFailed
@@ -11,6 +15,16 @@ from sqlalchemy.exc import IntegrityError
 
 
 class BaseImportShotgunResource(Resource):
+    """
+    Import Shotgun entries sent as a JSON list or as NDJSON (one entry per
+    line). Entries are imported by chunks: existing rows of a chunk are
+    retrieved with a single query and the chunk is written in one
+    transaction. If a chunk can't be written, its entries are imported one by
+    one so only wrong entries are discarded.
+    """
+
+    model = None
+    chunk_size = 500
 
     def __init__(self):
         Resource.__init__(self)
@@ -18,35 +32,169 @@ class BaseImportShotgunResource(Resource):
     @jwt_required
     def post(self):
         results = []
-        self.sg_entries = request.json
 
         try:
             self.check_permissions()
-            self.prepare_import()
-
-            for sg_entry in self.filtered_entries():
-                try:
-                    data = self.extract_data(sg_entry)
-                    result_entry = self.import_entry(data)
-                    results.append(result_entry)
-                except ShotgunEntryImportFailed as exception:
-                    current_app.logger.warn(exception)
-                except KeyError as exception:
-                    current_app.logger.warn(exception)
-                    current_app.logger.error(
-                        "Your data is not properly formatted: %s" % sg_entry
-                    )
-                except IntegrityError:
-                    current_app.logger.error(
-                        "Data information are duplicated or wrong: %s" %
-                        sg_entry
-                    )
-
-                self.post_processing()
         except permissions.PermissionDenied:
             abort(403)
 
-        return fields.serialize_models(results), 200
+        try:
+            self.sg_entries = self.get_sg_entries()
+        except ValueError:
+            return {"error": "Entries are not properly formatted."}, 400
+
+        self.id_maps = {}
+        self.prepare_import()
+        for chunk in self.get_chunks(self.filtered_entries()):
+            results += self.import_chunk(chunk)
+        self.post_processing()
+
+        return results, 200
+
+    def get_sg_entries(self):
+        """
+        Read entries from the request body. With NDJSON content, each line
+        is parsed separately so there is no need to handle a single huge JSON
+        document.
+        """
+        if request.mimetype == "application/x-ndjson":
+            return [
+                json.loads(line.decode("utf-8"))
+                for line in request.stream
+                if len(line.strip()) > 0
+            ]
+        else:
+            return request.json
+
+    def get_chunks(self, sg_entries):
+        chunk = []
+        for sg_entry in sg_entries:
+            chunk.append(sg_entry)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if len(chunk) > 0:
+            yield chunk
+
+    def import_chunk(self, chunk):
+        """
+        Import all entries of given chunk and commit them at once. In case of
+        integrity error, the chunk is rolled back and imported again entry by
+        entry.
+        """
+        self.existing_entries = self.prefetch_entries(chunk)
+        results = []
+        try:
+            for sg_entry in chunk:
+                result_entry = self.import_sg_entry(sg_entry)
+                if result_entry is not None:
+                    results.append(result_entry)
+            db.session.flush()
+            self.post_chunk_processing()
+            results = fields.serialize_models(results)
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            results = self.import_entries_one_by_one(chunk)
+        return results
+
+    def import_entries_one_by_one(self, chunk):
+        self.existing_entries = self.prefetch_entries(chunk)
+        results = []
+        for sg_entry in chunk:
+            try:
+                result_entry = self.import_sg_entry(sg_entry)
+                if result_entry is not None:
+                    db.session.flush()
+                    self.post_chunk_processing()
+                    results.append(result_entry.serialize())
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                self.existing_entries = self.prefetch_entries(chunk)
+                current_app.logger.error(
+                    "Data information are duplicated or wrong: %s" %
+                    sg_entry
+                )
+        return results
+
+    def import_sg_entry(self, sg_entry):
+        try:
+            data = self.extract_data(sg_entry)
+            return self.import_entry(data)
+        except ShotgunEntryImportFailed as exception:
+            current_app.logger.warn(exception)
+        except KeyError as exception:
+            current_app.logger.warn(exception)
+            current_app.logger.error(
+                "Your data is not properly formatted: %s" % sg_entry
+            )
+        return None
+
+    def prefetch_entries(self, chunk):
+        """
+        Retrieve with a single query the rows matching the Shotgun ids of
+        given chunk. Return them in a dict where keys are Shotgun ids.
+        """
+        if self.model is None:
+            return {}
+
+        shotgun_ids = [
+            sg_entry["id"] for sg_entry in chunk
+            if isinstance(sg_entry, dict) and "id" in sg_entry
+        ]
+        if len(shotgun_ids) == 0:
+            return {}
+
+        query = self.get_prefetch_query() \
+            .filter(self.model.shotgun_id.in_(shotgun_ids))
+        return {entry.shotgun_id: entry for entry in query.all()}
+
+    def get_prefetch_query(self):
+        return self.model.query
+
+    def get_existing_entry(self, data):
+        return self.existing_entries.get(data["shotgun_id"], None)
+
+    def create_entry(self, data, model=None):
+        """
+        Add a new row to the session. Its id is set immediately so it can be
+        used as a foreign key before the chunk is flushed.
+        """
+        if model is None:
+            model = self.model
+        instance = model(id=fields.gen_uuid(), **data)
+        db.session.add(instance)
+        if model is self.model and "shotgun_id" in data:
+            self.existing_entries[data["shotgun_id"]] = instance
+        return instance
+
+    def update_entry(self, instance, data):
+        for (key, value) in data.items():
+            setattr(instance, key, value)
+        return instance
+
+    def get_id_map(self, model, field="shotgun_id", **criterions):
+        """
+        Map field values of given model to ids. Maps are built once per
+        import.
+        """
+        key = (model.__name__, field, tuple(sorted(criterions.items())))
+        return self.get_cached_id_map(
+            key,
+            lambda: model.get_id_map(field=field, **criterions)
+        )
+
+    def get_asset_id_map(self):
+        return self.get_cached_id_map(
+            ("Asset", "shotgun_id"),
+            assets_service.get_asset_id_map
+        )
+
+    def get_cached_id_map(self, key, loader):
+        if key not in self.id_maps:
+            self.id_maps[key] = loader()
+        return self.id_maps[key]
 
     def filtered_entries(self):
         return self.sg_entries
@@ -63,6 +211,9 @@ class BaseImportShotgunResource(Resource):
     def import_entry(self, data):
         pass
 
+    def post_chunk_processing(self):
+        pass
+
     def post_processing(self):
         pass
 
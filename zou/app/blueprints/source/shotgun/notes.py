@@ -14,8 +14,11 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunNotesResource(BaseImportShotgunResource):
 
+    model = Comment
+
     def prepare_import(self):
-        self.person_ids = Person.get_id_map()
+        self.person_ids = self.get_id_map(Person)
+        self.task_ids = self.get_id_map(Task)
 
     def filtered_entries(self):
         return (x for x in self.sg_entries if self.is_note_linked_to_task(x))
@@ -24,11 +27,10 @@ class ImportShotgunNotesResource(BaseImportShotgunResource):
         if len(sg_note["tasks"]) == 0:
             return False
 
-        task = Task.get_by(shotgun_id=sg_note["tasks"][0]["id"])
-        return task is not None
+        return sg_note["tasks"][0]["id"] in self.task_ids
 
     def extract_data(self, sg_note):
-        task = Task.get_by(shotgun_id=sg_note["tasks"][0]["id"])
+        task_id = self.task_ids[sg_note["tasks"][0]["id"]]
         person_id = self.person_ids.get(sg_note["user"]["id"], None)
         date = datetime.datetime.strptime(
             sg_note["created_at"][:19],
@@ -38,21 +40,20 @@ class ImportShotgunNotesResource(BaseImportShotgunResource):
         return {
             "text": sg_note["content"],
             "shotgun_id": sg_note["id"],
-            "object_id": task.id,
+            "object_id": task_id,
             "object_type": "Task",
             "person_id": person_id,
             "created_at": date
         }
 
     def import_entry(self, data):
-        comment = Comment.get_by(shotgun_id=data["shotgun_id"])
+        comment = self.get_existing_entry(data)
         if comment is None:
-            comment = Comment(**data)
-            comment.save()
+            comment = self.create_entry(data)
             current_app.logger.info("Comment created: %s" % comment)
 
         else:
-            comment.update(data)
+            self.update_entry(comment, data)
             current_app.logger.info("Comment updated: %s" % comment)
         return comment
 
@@ -13,6 +13,8 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunPersonsResource(BaseImportShotgunResource):
 
+    model = Person
+
     def __init__(self):
         BaseImportShotgunResource.__init__(self)
 
@@ -39,17 +41,16 @@ class ImportShotgunPersonsResource(BaseImportShotgunResource):
 
     def import_entry(self, data):
         if data["email"] != "changeme@email.com":
-            person = Person.get_by(shotgun_id=data["shotgun_id"])
+            person = self.get_existing_entry(data)
 
             if person is None:
                 data["password"] = auth.encrypt_password("default")
-                person = Person(**data)
-                person.save()
+                person = self.create_entry(data)
                 current_app.logger.info("Person created: %s" % person)
             else:
                 if person.password is None or len(person.password) == 0:
                     data["password"] = auth.encrypt_password("default")
-                person.update(data)
+                self.update_entry(person, data)
                 current_app.logger.info("Person updated: %s" % person)
             return person
 
@@ -13,13 +13,16 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunProjectsResource(BaseImportShotgunResource):
 
+    model = Project
+
     def __init__(self):
         BaseImportShotgunResource.__init__(self)
 
     def prepare_import(self):
         self.project_status_names = self.extract_status_names(self.sg_entries)
         projects_service.save_project_status(self.project_status_names)
-        self.project_status_map = ProjectStatus.get_id_map(field="name")
+        self.project_status_map = \
+            self.get_id_map(ProjectStatus, field="name")
 
     def extract_status_names(self, sg_projects):
         return {x["sg_status"] for x in sg_projects}
@@ -35,19 +38,17 @@ class ImportShotgunProjectsResource(BaseImportShotgunResource):
         }
 
     def import_entry(self, data):
-        project = Project.get_by(shotgun_id=data["shotgun_id"])
+        project = self.get_existing_entry(data)
 
         if project is None:
-            project = Project(**data)
-
             tree_name = current_app.config["DEFAULT_FILE_TREE"]
-            project.file_tree = file_tree.get_tree_from_file(tree_name)
+            data["file_tree"] = file_tree.get_tree_from_file(tree_name)
 
-            project.save()
+            project = self.create_entry(data)
             current_app.logger.info("Project created: %s" % project)
 
         else:
-            project.update(data)
+            self.update_entry(project, data)
             current_app.logger.info("Project updated: %s" % project)
 
         return project
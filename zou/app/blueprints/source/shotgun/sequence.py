@@ -12,9 +12,14 @@ from zou.app.blueprints.source.shotgun.exception import ShotgunEntryImportFailed
 
 class ImportShotgunSequencesResource(BaseImportShotgunResource):
 
+    model = Entity
+
     def prepare_import(self):
         self.sequence_type = shots_service.get_sequence_type()
-        self.project_map = Project.get_id_map(field="name")
+        self.project_map = self.get_id_map(Project, field="name")
+
+    def get_prefetch_query(self):
+        return Entity.query.filter_by(entity_type_id=self.sequence_type.id)
 
     def extract_data(self, sg_sequence):
         project_id = self.get_project(sg_sequence)
@@ -37,19 +42,14 @@ class ImportShotgunSequencesResource(BaseImportShotgunResource):
         return project_id
 
     def import_entry(self, data):
-        sequence = Entity.get_by(
-            shotgun_id=data["shotgun_id"],
-            entity_type_id=self.sequence_type.id
-        )
+        sequence = self.get_existing_entry(data)
 
         if sequence is None:
-            sequence = Entity(**data)
-            sequence.save()
+            sequence = self.create_entry(data)
             current_app.logger.info("Sequence created: %s" % sequence)
 
         else:
-            sequence.update(data)
-            sequence.save()
+            self.update_entry(sequence, data)
             current_app.logger.info("Sequence updated: %s" % sequence)
 
         return sequence
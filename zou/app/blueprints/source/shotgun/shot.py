@@ -3,7 +3,7 @@ from flask_restful import current_app
 from zou.app.models.project import Project
 from zou.app.models.entity import Entity
 
-from zou.app.services import assets_service, shots_service
+from zou.app.services import shots_service
 
 from zou.app.blueprints.source.shotgun.base import (
     BaseImportShotgunResource,
@@ -13,26 +13,22 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunShotsResource(BaseImportShotgunResource):
 
+    model = Entity
+
     def __init__(self):
         BaseImportShotgunResource.__init__(self)
 
     def prepare_import(self):
         self.shot_type = shots_service.get_shot_type()
-        self.project_map = Project.get_id_map(field="name")
-        self.asset_map = self.get_asset_map()
-        self.sequence_map = self.get_sequence_map()
+        self.project_map = self.get_id_map(Project, field="name")
+        self.asset_map = self.get_asset_id_map()
+        self.sequence_map = self.get_id_map(
+            Entity,
+            entity_type_id=shots_service.get_sequence_type().id
+        )
 
-    def get_asset_map(self):
-        assets = assets_service.get_assets()
-        return {
-            asset.shotgun_id: asset.id for asset in assets
-        }
-
-    def get_sequence_map(self):
-        sequences = shots_service.get_sequences()
-        return {
-            sequence.shotgun_id: sequence.id for sequence in sequences
-        }
+    def get_prefetch_query(self):
+        return Entity.query.filter_by(entity_type_id=self.shot_type.id)
 
     def extract_status_names(self, sg_projects):
         return {x["sg_status"] for x in sg_projects}
@@ -105,23 +101,14 @@ class ImportShotgunShotsResource(BaseImportShotgunResource):
         return name[:3] == "sg_" and name not in non_custom_fields
 
     def import_entry(self, data):
-        shot = Entity.get_by(
-            shotgun_id=data["shotgun_id"],
-            entity_type_id=shots_service.get_shot_type().id
-        )
+        shot = self.get_existing_entry(data)
 
         if shot is None:
-            shot = Entity(**data)
-            shot.save()
+            shot = self.create_entry(data)
             current_app.logger.info("Shot created: %s" % shot)
 
         else:
-            if shot.data is None:
-                shot.data = {}
-            shot.update(data)
-            shot.data.update(data["data"])
-            shot.save()
-
+            self.update_entry(shot, data)
             current_app.logger.info("Shot updated: %s" % shot)
 
         return shot
@@ -10,14 +10,15 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunStatusResource(BaseImportShotgunResource):
 
+    model = TaskStatus
+
     def import_entry(self, data):
         task_status = self.get_existing_status(data)
         if task_status is None:
-            task_status = TaskStatus(**data)
-            task_status.save()
+            task_status = self.create_entry(data)
             current_app.logger.info("TaskStatus created: %s" % task_status)
         else:
-            task_status.update(data)
+            self.update_entry(task_status, data)
             current_app.logger.info("TaskStatus updated: %s" % task_status)
 
         return task_status
@@ -35,7 +36,7 @@ class ImportShotgunStatusResource(BaseImportShotgunResource):
         }
 
     def get_existing_status(self, data):
-        task_status = TaskStatus.get_by(shotgun_id=data["shotgun_id"])
+        task_status = self.get_existing_entry(data)
         if task_status is None:
             task_status = TaskStatus.get_by(name=data["short_name"])
         return task_status
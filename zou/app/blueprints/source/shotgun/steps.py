@@ -12,6 +12,8 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunStepsResource(BaseImportShotgunResource):
 
+    model = TaskType
+
     def __init__(self):
         Resource.__init__(self)
 
@@ -46,25 +48,23 @@ class ImportShotgunStepsResource(BaseImportShotgunResource):
                 "name": data["department_name"],
                 "color": data["color"]
             }
-            department = Department(**department_data)
-            department.save()
+            department = self.create_entry(department_data, Department)
             current_app.logger.info("Department created: %s" % department)
         del data["department_name"]
         return department
 
     def save_task_type(self, department, data):
-        task_type = TaskType.get_by(shotgun_id=data["shotgun_id"])
+        task_type = self.get_existing_entry(data)
         data["department_id"] = department.id
 
         if task_type is None:
             task_type = TaskType.get_by(name=data["name"])
 
         if task_type is None:
-            task_type = TaskType(**data)
-            task_type.save()
+            task_type = self.create_entry(data)
             current_app.logger.info("Task Type created: %s" % task_type)
         else:
-            task_type.update(data)
+            self.update_entry(task_type, data)
             current_app.logger.info("Task Type updated: %s" % task_type)
 
         return task_type
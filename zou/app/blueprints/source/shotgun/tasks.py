@@ -1,16 +1,16 @@
 from flask_restful import current_app
+from sqlalchemy.orm.attributes import set_committed_value
 
+from zou.app import db
 from zou.app.models.task_type import TaskType
 from zou.app.models.task_status import TaskStatus
 from zou.app.models.project import Project
 from zou.app.models.person import Person
-from zou.app.models.task import Task
+from zou.app.models.task import Task, association_table
+from zou.app.models.entity import Entity
 
-from zou.app.services import (
-    tasks_service,
-    assets_service,
-    shots_service
-)
+from zou.app.services import grids_service, tasks_service, shots_service
+from zou.app.utils import cache
 
 from zou.app.blueprints.source.shotgun.base import (
     BaseImportShotgunResource,
@@ -20,28 +20,39 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunTasksResource(BaseImportShotgunResource):
 
+    model = Task
+
     def prepare_import(self):
-        self.project_ids = Project.get_id_map()
-        self.person_ids = Person.get_id_map()
-        self.task_type_ids = TaskType.get_id_map(field="name")
-        self.task_status_ids = TaskStatus.get_id_map(field="short_name")
-        self.asset_ids = self.get_asset_map()
-        self.shot_ids = self.get_shot_map()
-        self.sequence_ids = self.get_sequence_map()
-
-    def get_asset_map(self):
-        assets = assets_service.get_assets()
-        return {asset.shotgun_id: asset.id for asset in assets}
-
-    def get_shot_map(self):
-        shots = shots_service.get_shots()
-        return {shot["shotgun_id"]: shot["id"] for shot in shots}
-
-    def get_sequence_map(self):
-        sequences = shots_service.get_sequences()
-        return {
-            sequence.shotgun_id: sequence.id for sequence in sequences
+        self.project_ids = self.get_id_map(Project)
+        self.person_ids = self.get_id_map(Person)
+        self.task_type_ids = self.get_id_map(TaskType, field="name")
+        self.task_status_ids = \
+            self.get_id_map(TaskStatus, field="short_name")
+        self.asset_ids = self.get_asset_id_map()
+        self.shot_ids = self.get_id_map(
+            Entity,
+            entity_type_id=shots_service.get_shot_type().id
+        )
+        self.sequence_ids = self.get_id_map(
+            Entity,
+            entity_type_id=shots_service.get_sequence_type().id
+        )
+        self.assignations = {}
+        # Persons are loaded once per import. Detached copies are kept
+        # because instances of the session are expired by chunk commits.
+        self.person_copies = [
+            cache.get_detached_copy(person) for person in Person.query.all()
+        ]
+
+    def prefetch_entries(self, chunk):
+        # Copies are merged without querying the database. They provide
+        # assignee instances without loading them one by one.
+        self.persons = {
+            person.id: db.session.merge(person, load=False)
+            for person in self.person_copies
         }
+        self.assignations = {}
+        return BaseImportShotgunResource.prefetch_entries(self, chunk)
 
     def filtered_entries(self):
         return [x for x in self.sg_entries if self.is_valid_task(x)]
@@ -90,27 +101,55 @@ class ImportShotgunTasksResource(BaseImportShotgunResource):
         return entity_id
 
     def extract_assignees(self, sg_task, person_ids):
-        assignees = []
-        if len(sg_task["task_assignees"]) > 0:
-            for sg_person in sg_task["task_assignees"]:
-                person_id = person_ids[sg_person["id"]]
-                person = Person.get(person_id)
-                assignees.append(person)
-        return assignees
+        return [
+            person_ids[sg_person["id"]]
+            for sg_person in sg_task["task_assignees"]
+        ]
 
     def import_entry(self, data):
-        task = Task.get_by(shotgun_id=data["shotgun_id"])
+        assignee_ids = data.pop("assignees")
+        task = self.get_existing_entry(data)
 
         if task is None:
-            task = Task(**data)
-            task.save()
+            task = self.create_entry(data)
             current_app.logger.info("Task created: %s" % task)
         else:
-            task.update(data)
+            self.update_entry(task, data)
             current_app.logger.info("Task updated: %s" % task)
 
+        # Assignations are written in bulk once the chunk is flushed. The
+        # relation is set without history, so the ORM doesn't write it too.
+        set_committed_value(
+            task,
+            "assignees",
+            [self.persons[person_id] for person_id in assignee_ids]
+        )
+        self.assignations[task.id] = assignee_ids
+        grids_service.add_session_change(task, task.project_id, task.entity_id)
         return task
 
+    def post_chunk_processing(self):
+        """
+        Replace assignations of the imported tasks with a single delete and a
+        single multi-row insert.
+        """
+        if len(self.assignations) > 0:
+            db.session.execute(
+                association_table.delete().where(
+                    association_table.c.task.in_(
+                        list(self.assignations.keys())
+                    )
+                )
+            )
+            rows = [
+                {"task": task_id, "person": person_id}
+                for (task_id, person_ids) in self.assignations.items()
+                for person_id in person_ids
+            ]
+            if len(rows) > 0:
+                db.session.execute(association_table.insert().values(rows))
+        self.assignations = {}
+
 
 class ImportRemoveShotgunTaskResource(ImportRemoveShotgunBaseResource):
 
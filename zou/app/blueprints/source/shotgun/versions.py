@@ -4,8 +4,6 @@ from zou.app.models.preview_file import PreviewFile
 from zou.app.models.task import Task
 from zou.app.models.person import Person
 
-from zou.app.services import assets_service, shots_service
-
 from zou.app.blueprints.source.shotgun.base import (
     BaseImportShotgunResource,
     ImportRemoveShotgunBaseResource
@@ -14,22 +12,14 @@ from zou.app.blueprints.source.shotgun.base import (
 
 class ImportShotgunVersionsResource(BaseImportShotgunResource):
 
+    model = PreviewFile
+
     def __init__(self):
         BaseImportShotgunResource.__init__(self)
 
     def prepare_import(self):
-        self.person_ids = Person.get_id_map()
-        self.task_ids = Task.get_id_map()
-        self.asset_ids = self.get_asset_map()
-        self.shot_ids = self.get_shot_map()
-
-    def get_asset_map(self):
-        assets = assets_service.get_assets()
-        return {asset.shotgun_id: asset.id for asset in assets}
-
-    def get_shot_map(self):
-        shots = shots_service.get_shots()
-        return {shot["shotgun_id"]: shot["id"] for shot in shots}
+        self.person_ids = self.get_id_map(Person)
+        self.task_ids = self.get_id_map(Task)
 
     def filtered_entries(self):
         return (x for x in self.sg_entries if self.is_version_linked_to_task(x))
@@ -66,7 +56,7 @@ class ImportShotgunVersionsResource(BaseImportShotgunResource):
         return data
 
     def import_entry(self, data):
-        preview_file = PreviewFile.get_by(shotgun_id=data["shotgun_id"])
+        preview_file = self.get_existing_entry(data)
         if preview_file is None:
             preview_file = PreviewFile.get_by(
                 name=data["name"],
@@ -74,11 +64,10 @@ class ImportShotgunVersionsResource(BaseImportShotgunResource):
             )
 
         if preview_file is None:
-            preview_file = PreviewFile(**data)
-            preview_file.save()
+            preview_file = self.create_entry(data)
             current_app.logger.info("PreviewFile created: %s" % preview_file)
         else:
-            preview_file.update(data)
+            self.update_entry(preview_file, data)
             current_app.logger.info("PreviewFile updated: %s" % preview_file)
         return preview_file
 
@@ -1,3 +1,5 @@
+import uuid
+
 from flask import abort, request
 from flask_restful import Resource, reqparse
 from flask_jwt_extended import jwt_required
@@ -142,6 +144,11 @@ class TaskPreviewsResource(Resource):
 
 
 class TaskCommentsResource(Resource):
+    """
+    Return comments of given task, most recent first. Use limit and before
+    (id of the oldest comment already retrieved) parameters to get them page
+    by page.
+    """
 
     def __init__(self):
         Resource.__init__(self)
@@ -154,14 +161,33 @@ class TaskCommentsResource(Resource):
             if not permissions.has_manager_permissions():
                 user_service.check_has_task_related(task_id)
 
-            comments = tasks_service.get_comments(task)
+            (limit, before) = self.get_arguments()
+            comments = tasks_service.get_comments(
+                task,
+                limit=limit,
+                before=before
+            )
         except TaskNotFoundException:
             abort(404)
         except permissions.PermissionDenied:
             abort(403)
+        except ValueError:
+            abort(400)
 
         return comments
 
+    def get_arguments(self):
+        limit = request.args.get("limit", None)
+        if limit is not None:
+            limit = int(limit)
+            if limit < 1:
+                raise ValueError("Limit must be positive.")
+
+        before = request.args.get("before", None)
+        if before is not None:
+            before = uuid.UUID(before)
+        return (limit, before)
+
 
 class CreateShotTasksResource(Resource):
 
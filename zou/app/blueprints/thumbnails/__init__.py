@@ -3,6 +3,7 @@ from zou.app.utils.api import configure_api_from_blueprint
 
 from .resources import (
     CreatePreviewFilePictureResource,
+    PreviewFileJobResource,
     PreviewFileMovieResource,
     PreviewFileThumbnailResource,
     PreviewFileThumbnailSquareResource,
@@ -26,6 +27,10 @@ routes = [
         "/pictures/preview-files/<instance_id>",
         CreatePreviewFilePictureResource
     ),
+    (
+        "/pictures/preview-files/jobs/<job_id>",
+        PreviewFileJobResource
+    ),
     (
         "/movies/originals/preview-files/<instance_id>.mp4",
         PreviewFileMovieResource
@@ -4,8 +4,6 @@ from flask import abort, request, send_from_directory
 from flask_restful import Resource
 from flask_jwt_extended import jwt_required
 
-from moviepy.editor import VideoFileClip
-
 from zou.app.services import (
     shots_service,
     files_service,
@@ -20,7 +18,12 @@ from zou.app.services.exception import (
     EntityNotFoundException,
     PreviewFileNotFoundException
 )
-from zou.app.utils import thumbnail as thumbnail_utils, permissions
+from zou.app.utils import (
+    jobs,
+    movie as movie_utils,
+    permissions,
+    thumbnail as thumbnail_utils
+)
 
 
 class CreatePreviewFilePictureResource(Resource):
@@ -51,18 +54,18 @@ class CreatePreviewFilePictureResource(Resource):
             return thumbnail_utils.get_preview_url_path(instance_id), 201
 
         elif ".mp4" in uploaded_file.filename:
-            file_name = "%s.mp4" % instance_id
             folder = thumbnail_utils.create_folder(folder_path)
-            file_path = os.path.join(folder, file_name)
-            picture_path = os.path.join(folder, "%s.png" % instance_id)
-            uploaded_file.save(file_path + '.tmp')
-            clip = VideoFileClip(file_path + '.tmp')
-            clip = clip.resize(height=720)
-            clip.save_frame(picture_path, round(clip.duration / 2))
-            thumbnail_utils.generate_preview_variants(instance_id)
-            clip.write_videofile(file_path)
+            file_path = os.path.join(folder, "%s.mp4.tmp" % instance_id)
+            uploaded_file.save(file_path)
+            job = jobs.start(
+                "preview-movie",
+                movie_utils.build_preview_movie,
+                (instance_id, file_path, folder),
+                data={"preview_file_id": instance_id},
+                event="preview-file:ready"
+            )
 
-            return {}, 201
+            return job, 202
 
         else:
             abort(400, "Wrong file format")
@@ -78,6 +81,19 @@ class CreatePreviewFilePictureResource(Resource):
         return files_service.get_preview_file(preview_file_id) is not None
 
 
+class PreviewFileJobResource(Resource):
+    """
+    Return status of a preview processing job (running, done or failed).
+    """
+
+    @jwt_required
+    def get(self, job_id):
+        job = jobs.get(job_id)
+        if job is None:
+            abort(404)
+        return job
+
+
 class PreviewFileMovieResource(Resource):
 
     def __init__(self):
@@ -17,6 +17,15 @@ KEY_VALUE_STORE = {
 }
 AUTH_TOKEN_BLACKLIST_KV_INDEX = 0
 KV_EVENTS_DB_INDEX = 2
+KV_EVENT_QUEUE_DB_INDEX = 3
+KV_JOBS_DB_INDEX = 4
+KV_GRIDS_DB_INDEX = 5
+KV_CACHE_VERSIONS_DB_INDEX = 6
+KV_MAX_CONNECTIONS = int(os.getenv("KV_MAX_CONNECTIONS", 50))
+KV_EVENT_STREAM_MAX_CONNECTIONS = \
+    int(os.getenv("KV_EVENT_STREAM_MAX_CONNECTIONS", 1000))
+KV_POOL_TIMEOUT = int(os.getenv("KV_POOL_TIMEOUT", 20))
+KV_HEALTH_CHECK_INTERVAL = int(os.getenv("KV_HEALTH_CHECK_INTERVAL", 30))
 
 JWT_BLACKLIST_ENABLED = True
 JWT_BLACKLIST_TOKEN_CHECKS = ["access", "refresh"]
@@ -44,6 +53,16 @@ SQLALCHEMY_TRACK_MODIFICATIONS = True
 
 NB_RECORDS_PER_PAGE = 100
 
+REFERENCE_DATA_CACHE_TTL = int(os.getenv("REFERENCE_DATA_CACHE_TTL", 600))
+PERSON_CACHE_TTL = int(os.getenv("PERSON_CACHE_TTL", 30))
+GRID_TOMBSTONES_TTL = int(os.getenv("GRID_TOMBSTONES_TTL", 7 * 24 * 3600))
+TOMBSTONES_TTL = int(os.getenv("TOMBSTONES_TTL", 30))  # In days
+UPDATED_SINCE_MARGIN = int(os.getenv("UPDATED_SINCE_MARGIN", 300))
+TOKEN_REVOCATION_CACHE_TTL = \
+    int(os.getenv("TOKEN_REVOCATION_CACHE_TTL", 60))
+TOKEN_REVOCATION_CACHE_SIZE = \
+    int(os.getenv("TOKEN_REVOCATION_CACHE_SIZE", 10000))
+
 DONE_TASK_STATUS = "Done"
 WIP_TASK_STATUS = "WIP"
 TO_REVIEW_TASK_STATUS = "To review"
@@ -64,3 +83,19 @@ EVENT_HANDLERS_FOLDER = os.getenv(
     os.path.join(os.getcwd(), "event_handlers")
 )
 TMP_DIR = os.getenv("TMP_DIR", os.path.join(os.sep, "tmp"))
+
+# Event handlers are run inside the request ("sync") or by a separate worker
+# reading a Redis queue ("queue"). The worker is run with bin/zou
+# process_events.
+EVENT_DISPATCH_MODE = os.getenv("EVENT_DISPATCH_MODE", "sync")
+EVENT_HANDLER_MAX_RETRIES = int(os.getenv("EVENT_HANDLER_MAX_RETRIES", 3))
+EVENT_WORKER_CONCURRENCY = int(os.getenv("EVENT_WORKER_CONCURRENCY", 4))
+EVENT_BATCH_MERGE = os.getenv("EVENT_BATCH_MERGE", "false") == "true"
+
+JOB_PROCESSES = int(os.getenv("JOB_PROCESSES", 2))
+JOB_DISPATCH_MODE = os.getenv("JOB_DISPATCH_MODE", "pool")
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", 3600))
+JOB_HEARTBEAT_INTERVAL = int(os.getenv("JOB_HEARTBEAT_INTERVAL", 10))
+JOB_HEARTBEAT_TIMEOUT = int(os.getenv("JOB_HEARTBEAT_TIMEOUT", 60))
+PREVIEW_VARIANTS_IN_POOL = \
+    os.getenv("PREVIEW_VARIANTS_IN_POOL", "false") == "true"
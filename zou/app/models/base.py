@@ -18,7 +18,8 @@ class BaseMixin(object):
     updated_at = db.Column(
         db.DateTime,
         default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow
+        onupdate=datetime.datetime.utcnow,
+        index=True
     )
 
     def __repr__(self):
@@ -71,16 +72,17 @@ class BaseMixin(object):
         return instance
 
     @classmethod
-    def get_id_map(cls, field="shotgun_id"):
+    def get_id_map(cls, field="shotgun_id", project_id=None, **criterions):
         """
         Build a map to easily match a field value with an id. It's useful during
-        mass import to build foreign keys.
-        """
-        entry_map = {}
-        entries = cls.query.all()
-        for entry in entries:
-            entry_map[getattr(entry, field)] = entry.id
-        return entry_map
+        mass import to build foreign keys. Only the two required columns are
+        selected, rows are not loaded as model instances.
+        """
+        query = db.session.query(getattr(cls, field), cls.id) \
+            .filter_by(**criterions)
+        if project_id is not None:
+            query = query.filter(cls.project_id == project_id)
+        return {key: entry_id for (key, entry_id) in query.all()}
 
     def save(self):
         """
@@ -66,7 +66,7 @@ class Person(db.Model, BaseMixin, SerializerMixin):
                 self.last_name
             )
 
-    def serialize(self, obj_type=None):
-        data = SerializerMixin.serialize(self, obj_type)
+    def serialize(self, obj_type=None, relations=True):
+        data = SerializerMixin.serialize(self, obj_type, relations)
         del data["password"]
         return data
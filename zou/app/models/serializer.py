@@ -1,17 +1,111 @@
+from sqlalchemy import types
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.orm.properties import RelationshipProperty
+from sqlalchemy_utils import UUIDType
+
 from zou.app.utils.fields import serialize_value
 
+serializers = {}
 
-class SerializerMixin(object):
 
-    def serialize(self, obj_type=None):
-        attrs = inspect(self).attrs.keys()
+def serialize_raw(value):
+    return value
+
+
+def serialize_to_string(value):
+    if value is None:
+        return None
+    return str(value)
+
+
+def serialize_date(value):
+    if value is None:
+        return None
+    return value.isoformat()
+
+
+def serialize_bytes(value):
+    if value is None:
+        return None
+    return value.decode("utf-8")
+
+
+def get_converter(column_type):
+    """
+    Select the function that will turn column values into simple data
+    structures, based on the column type. The type is checked once, when the
+    serializer is compiled, instead of for each value.
+    """
+    if isinstance(column_type, UUIDType):
+        return serialize_to_string
+    elif isinstance(column_type, (types.DateTime, types.Date)):
+        return serialize_date
+    elif isinstance(
+        column_type,
+        (JSONB, types.String, types.Integer, types.Boolean, types.Enum)
+    ):
+        return serialize_raw
+    elif isinstance(column_type, types.LargeBinary):
+        return serialize_bytes
+    else:
+        return serialize_value
+
+
+class ModelSerializer(object):
+    """
+    Serializer compiled once per model class. It knows the column list and the
+    converter to apply to each column, so rows can be serialized without
+    inspecting them.
+    """
+
+    def __init__(self, model):
+        mapper = inspect(model)
+        self.model_name = model.__name__
+        self.columns = []
+        self.relationships = []
+        for attr in mapper.attrs:
+            if isinstance(attr, RelationshipProperty):
+                self.relationships.append(attr.key)
+            else:
+                column_type = attr.columns[0].type
+                self.columns.append((attr.key, get_converter(column_type)))
+
+    def serialize(self, instance, obj_type=None, relations=True):
         obj_dict = {
-            attr: serialize_value(getattr(self, attr)) for attr in attrs
+            key: converter(getattr(instance, key))
+            for (key, converter) in self.columns
         }
-        obj_dict["type"] = obj_type or type(self).__name__
+        if relations:
+            for key in self.relationships:
+                obj_dict[key] = serialize_value(getattr(instance, key))
+        obj_dict["type"] = obj_type or self.model_name
         return obj_dict
 
+    def relation_loaders(self):
+        """
+        Loader options to fetch all relationships of a list of rows with one
+        query per relationship instead of one query per row.
+        """
+        return [subqueryload(key) for key in self.relationships]
+
+
+def get_serializer(model):
+    if model not in serializers:
+        serializers[model] = ModelSerializer(model)
+    return serializers[model]
+
+
+class SerializerMixin(object):
+
+    def serialize(self, obj_type=None, relations=True):
+        serializer = get_serializer(type(self))
+        return serializer.serialize(self, obj_type, relations)
+
     @staticmethod
-    def serialize_list(models, obj_type=None):
-        return [model.serialize(obj_type=obj_type) for model in models]
+    def serialize_list(models, obj_type=None, relations=True):
+        return [
+            model.serialize(obj_type=obj_type, relations=relations)
+            for model in models
+        ]
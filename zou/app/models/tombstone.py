@@ -0,0 +1,51 @@
+import datetime
+
+from sqlalchemy import event
+from sqlalchemy_utils import UUIDType
+
+from zou.app import config, db
+from zou.app.models.serializer import SerializerMixin
+from zou.app.models.base import BaseMixin
+from zou.app.utils import fields
+
+
+class Tombstone(db.Model, BaseMixin, SerializerMixin):
+    """
+    Trace of a deleted entry. It allows clients that synchronize data
+    incrementally to know which entries they must remove.
+    """
+    model_name = db.Column(db.String(80), nullable=False, index=True)
+    instance_id = db.Column(
+        UUIDType(binary=False),
+        nullable=False,
+        index=True
+    )
+
+    def __repr__(self):
+        return "<Tombstone %s %s>" % (self.model_name, self.instance_id)
+
+    @classmethod
+    def get_horizon(cls):
+        """
+        Return the date before which tombstones may have been removed (see
+        clean_tombstones command).
+        """
+        return datetime.datetime.utcnow() - \
+            datetime.timedelta(days=config.TOMBSTONES_TTL)
+
+
+@event.listens_for(BaseMixin, "after_delete", propagate=True)
+def add_tombstone(mapper, connection, target):
+    """
+    The tombstone is written in the transaction of the deletion, so it is
+    rolled back with it. Bulk deletions made through queries are not traced.
+    """
+    if not isinstance(target, Tombstone):
+        now = datetime.datetime.utcnow()
+        connection.execute(Tombstone.__table__.insert().values(
+            id=fields.gen_uuid(),
+            model_name=type(target).__name__,
+            instance_id=target.id,
+            created_at=now,
+            updated_at=now
+        ))
@@ -1,4 +1,5 @@
 from sqlalchemy.exc import StatementError, IntegrityError
+from sqlalchemy.orm import subqueryload
 
 from zou.app.utils import events, fields
 
@@ -9,7 +10,7 @@ from zou.app.models.task import Task
 from zou.app.models.task_status import TaskStatus
 from zou.app.models.task_type import TaskType
 
-from zou.app.services import shots_service
+from zou.app.services import grids_service, shots_service
 
 from zou.app.services.exception import (
     AssetNotFoundException,
@@ -59,18 +60,36 @@ def get_asset_types_for_shot(shot_id):
     return result
 
 
-def get_assets(criterions={}):
+def build_assets_query():
+    """
+    Query on entities that are not shots, sequences or episodes.
+    """
     shot_type = shots_service.get_shot_type()
     sequence_type = shots_service.get_sequence_type()
     episode_type = shots_service.get_episode_type()
-    query = Entity.query.filter_by(**criterions)
-    return query.filter(
+    return Entity.query.filter(
         ~Entity.entity_type_id.in_([
             shot_type.id,
             sequence_type.id,
             episode_type.id
         ])
-    ).all()
+    )
+
+
+def get_asset_id_map(field="shotgun_id", project_id=None):
+    """
+    Map given field values of assets to asset ids, without loading assets as
+    model instances.
+    """
+    query = build_assets_query() \
+        .with_entities(getattr(Entity, field), Entity.id)
+    if project_id is not None:
+        query = query.filter(Entity.project_id == project_id)
+    return {key: asset_id for (key, asset_id) in query.all()}
+
+
+def get_assets(criterions={}):
+    return build_assets_query().filter_by(**criterions).all()
 
 
 def get_asset(entity_id):
@@ -257,7 +276,7 @@ def get_task_type_map():
     }
 
 
-def get_asset_map(criterions={}):
+def get_asset_map(criterions={}, asset_ids=None):
     asset_map = {}
 
     shot_type = shots_service.get_shot_type()
@@ -277,6 +296,8 @@ def get_asset_map(criterions={}):
     if "project_id" in criterions:
         asset_query = \
             asset_query.filter(Entity.project_id == criterions["project_id"])
+    if asset_ids is not None:
+        asset_query = asset_query.filter(Entity.id.in_(asset_ids))
 
     assets = asset_query.all()
 
@@ -301,12 +322,53 @@ def get_asset_map(criterions={}):
 
 
 def all_assets_and_tasks(criterions={}):
+    """
+    Return assets with their tasks. When the assets of a single project are
+    requested, the result is read from the grid maintained for this project.
+    """
+    if list(criterions.keys()) == ["project_id"]:
+        return get_assets_grid(criterions["project_id"])
+    else:
+        return build_assets_and_tasks(criterions)
+
+
+def get_assets_grid(project_id, since=None):
+    """
+    Return rows of the assets grid of given project. If since is given, only
+    rows modified after this date are returned.
+    """
+    return grids_service.get_grid(
+        "assets",
+        project_id,
+        build_assets_grid_rows,
+        lambda asset_ids: False,
+        since
+    )
+
+
+def get_assets_grid_removed_ids(project_id, since):
+    return grids_service.get_removed_row_ids("assets", project_id, since)
+
+
+def get_assets_grid_etag(project_id):
+    return grids_service.get_etag("assets", project_id)
+
+
+def get_assets_grid_last_update(project_id):
+    return grids_service.get_last_update("assets", project_id)
+
+
+def build_assets_grid_rows(project_id, asset_ids=None):
+    return build_assets_and_tasks({"project_id": project_id}, asset_ids)
+
+
+def build_assets_and_tasks(criterions={}, asset_ids=None):
     shot_type = shots_service.get_shot_type()
     sequence_type = shots_service.get_sequence_type()
     episode_type = shots_service.get_episode_type()
     task_status_map = get_task_status_map()
     task_type_map = get_task_type_map()
-    asset_map = get_asset_map(criterions)
+    asset_map = get_asset_map(criterions, asset_ids)
     task_map = {}
 
     query = Task.query \
@@ -318,10 +380,13 @@ def all_assets_and_tasks(criterions={}):
                 sequence_type.id,
                 episode_type.id
             ])
-        )
+        ) \
+        .options(subqueryload(Task.assignees))
 
     if "project_id" in criterions:
         query = query.filter(Entity.project_id == criterions["project_id"])
+    if asset_ids is not None:
+        query = query.filter(Task.entity_id.in_(asset_ids))
 
     tasks = query.all()
 
@@ -2,9 +2,16 @@ import os
 import re
 import json
 
+from collections import namedtuple
 from slugify import slugify
+from sqlalchemy import event
+from sqlalchemy.exc import StatementError
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Session, object_session
 
 from zou.app import app
+from zou.app.stores import cache_versions_store
+from zou.app.utils import cache
 
 from zou.app.models.project import Project
 from zou.app.models.entity import Entity
@@ -12,16 +19,300 @@ from zou.app.models.entity_type import EntityType
 from zou.app.models.task_type import TaskType
 from zou.app.models.task import Task
 from zou.app.models.department import Department
+from zou.app.models.output_type import OutputType
+from zou.app.models.software import Software
 
-from zou.app.services import shots_service, tasks_service, files_service
+from zou.app.services import shots_service, files_service
 from zou.app.services.exception import (
     MalformedFileTreeException,
     WrongFileTreeFileException,
     WrongPathFormatException,
-    TaskNotFoundException
+    TaskNotFoundException,
+    SoftwareNotFoundException,
+    OutputTypeNotFoundException
 )
 
 
+class PathContext(object):
+    """
+    Store the rows needed to build paths (entities, projects, task types,
+    departments, entity types, softwares and output types), so each of them
+    is retrieved only once while building several paths. Rows can be loaded
+    in bulk with the preload function. Missing rows are loaded on demand.
+    """
+
+    def __init__(self):
+        self.instances = {}
+        self.slugs = {}
+
+    def get(self, model, instance_id):
+        if instance_id is None:
+            return None
+        instances = self.instances.setdefault(model, {})
+        key = str(instance_id)
+        if key not in instances:
+            instances[key] = model.get(instance_id)
+        return instances[key]
+
+    def load(self, model, instance_ids):
+        """
+        Retrieve with a single query all given rows which are not stored
+        yet.
+        """
+        instances = self.instances.setdefault(model, {})
+        missing_ids = set(
+            str(instance_id) for instance_id in instance_ids
+            if instance_id is not None and str(instance_id) not in instances
+        )
+        if len(missing_ids) > 0:
+            for instance in model.query.filter(model.id.in_(missing_ids)):
+                instances[str(instance.id)] = instance
+        return [
+            instances.get(str(instance_id)) for instance_id in instance_ids
+        ]
+
+    def preload(self, tasks):
+        """
+        Load all data required to build paths of given tasks: entities and
+        their parents (sequences and episodes), projects, entity types, task
+        types and departments.
+        """
+        entities = self.load(Entity, [task.entity_id for task in tasks])
+        sequences = self.load(
+            Entity,
+            [entity.parent_id for entity in entities if entity is not None]
+        )
+        self.load(
+            Entity,
+            [
+                sequence.parent_id
+                for sequence in sequences if sequence is not None
+            ]
+        )
+        entities = [entity for entity in entities if entity is not None]
+        self.load(Project, [entity.project_id for entity in entities])
+        self.load(EntityType, [entity.entity_type_id for entity in entities])
+        task_types = self.load(TaskType, [task.task_type_id for task in tasks])
+        self.load(
+            Department,
+            [
+                task_type.department_id
+                for task_type in task_types if task_type is not None
+            ]
+        )
+
+    def get_entity(self, entity_id):
+        return self.get(Entity, entity_id)
+
+    def get_project(self, project_id):
+        return self.get(Project, project_id)
+
+    def get_entity_type(self, entity_type_id):
+        return self.get(EntityType, entity_type_id)
+
+    def get_task_type(self, task_type_id):
+        return self.get(TaskType, task_type_id)
+
+    def get_department(self, department_id):
+        return self.get(Department, department_id)
+
+    def get_software(self, software_id):
+        return self.get(Software, software_id)
+
+    def get_output_type(self, output_type_id):
+        return self.get(OutputType, output_type_id)
+
+    def slugify(self, text):
+        if text not in self.slugs:
+            self.slugs[text] = slugify(text, separator="_")
+        return self.slugs[text]
+
+
+PathVariables = namedtuple("PathVariables", [
+    "entity",
+    "task",
+    "software",
+    "output_type",
+    "scene",
+    "name",
+    "context"
+])
+
+
+class CompiledTemplate(object):
+    """
+    Template parsed once into a list of parts. A part is either a literal
+    text or a slot with the function resolving its value, so rendering a
+    path requires no parsing.
+    """
+
+    def __init__(self, template, style="lowercase"):
+        self.style = style
+        self.parts = []
+        position = 0
+        for match in re.finditer("<(\w*)>", template):
+            if match.start() > position:
+                self.parts.append(
+                    (template[position:match.start()], None)
+                )
+            self.parts.append(
+                (match.group(1), get_datatype_resolver(match.group(1)))
+            )
+            position = match.end()
+        if position < len(template):
+            self.parts.append((template[position:], None))
+
+    def render(
+        self,
+        entity,
+        task,
+        software=None,
+        output_type=None,
+        scene=1,
+        name="",
+        context=None
+    ):
+        if context is None:
+            context = PathContext()
+        variables = PathVariables(
+            entity, task, software, output_type, scene, name, context
+        )
+        return "".join([
+            text if resolver is None else
+            apply_style(context.slugify(resolver(variables)), self.style)
+            for (text, resolver) in self.parts
+        ])
+
+
+class CompiledTree(object):
+    """
+    File tree of a project with its templates compiled on first use.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.templates = {}
+
+    def get_template(self, mode, section, kind, style=None):
+        key = (mode, section, kind, style)
+        if key not in self.templates:
+            try:
+                templates = self.tree[mode][section]
+                template = templates[kind]
+            except (KeyError, TypeError):
+                raise MalformedFileTreeException(
+                    "Can't find %s template for %s in given tree (%s mode)."
+                    % (section, kind, mode)
+                )
+            if style is None:
+                style = templates.get("style", "")
+            self.templates[key] = CompiledTemplate(template, style)
+        return self.templates[key]
+
+    def get_style(self, mode, section):
+        return self.tree[mode][section].get("style", "")
+
+
+compiled_tree_cache = cache.new("file_trees", max_size=1000)
+template_cache = cache.new("file_tree_templates", max_size=1000)
+
+
+def get_compiled_tree(project):
+    """
+    Return the compiled file tree of given project. It is cached along the
+    project modification date, so the tree is compiled again once the
+    project is modified (for instance when a new file tree is set).
+    """
+    key = str(project.id)
+    cached_tree = compiled_tree_cache.get(key)
+    if cached_tree is None or cached_tree[0] != project.updated_at:
+        cached_tree = compiled_tree_cache.set(key, (
+            project.updated_at,
+            CompiledTree(get_tree_from_project(project))
+        ))
+    return cached_tree[1]
+
+
+def compile_template(template, style="lowercase"):
+    key = (template, style)
+    compiled_template = template_cache.get(key)
+    if compiled_template is None:
+        compiled_template = template_cache.set(
+            key,
+            CompiledTemplate(template, style)
+        )
+    return compiled_template
+
+
+def get_file_paths(path_queries, sep=os.sep):
+    """
+    Build folder path and file name for each given path query. A path query
+    is a dict with task_id, mode, software_id, output_type_id, scene, name and
+    version keys. Only task_id is required. Data are retrieved with a few
+    queries for all paths instead of several queries per path.
+    """
+    context = PathContext()
+    tasks = load_path_instances(
+        context,
+        Task,
+        [path_query.get("task_id") for path_query in path_queries],
+        TaskNotFoundException
+    )
+    if None in tasks:
+        raise TaskNotFoundException
+    context.preload(tasks)
+    load_path_instances(
+        context,
+        Software,
+        [path_query.get("software_id") for path_query in path_queries],
+        SoftwareNotFoundException
+    )
+    load_path_instances(
+        context,
+        OutputType,
+        [path_query.get("output_type_id") for path_query in path_queries],
+        OutputTypeNotFoundException
+    )
+
+    paths = []
+    for (task, path_query) in zip(tasks, path_queries):
+        options = {
+            "mode": path_query.get("mode", "working"),
+            "software": context.get_software(path_query.get("software_id")),
+            "output_type":
+                context.get_output_type(path_query.get("output_type_id")),
+            "scene": path_query.get("scene", 1),
+            "name": path_query.get("name", ""),
+            "context": context
+        }
+        paths.append({
+            "task_id": str(task.id),
+            "project_id": str(task.project_id),
+            "path": get_folder_path(task, sep=sep, **options),
+            "name": get_file_name(
+                task,
+                version=path_query.get("version", 1),
+                **options
+            )
+        })
+    return paths
+
+
+def load_path_instances(context, model, instance_ids, exception):
+    """
+    Load given rows in the path context. Raise given exception if an id is
+    malformed or doesn't match any row. Empty ids are ignored.
+    """
+    try:
+        instances = context.load(model, instance_ids)
+    except StatementError:
+        raise exception
+    for (instance_id, instance) in zip(instance_ids, instances):
+        if instance_id is not None and instance is None:
+            raise exception
+    return instances
+
+
 def get_file_path(
     task,
     mode="working",
@@ -30,8 +321,12 @@ def get_file_path(
     scene=1,
     name="",
     version=1,
-    sep=os.sep
+    sep=os.sep,
+    context=None
 ):
+    if context is None:
+        context = PathContext()
+
     file_name = get_file_name(
         task,
         mode=mode,
@@ -40,6 +335,7 @@ def get_file_path(
         scene=scene,
         name=name,
         version=version,
+        context=context
     )
     folder = get_folder_path(
         task,
@@ -48,7 +344,8 @@ def get_file_path(
         output_type=output_type,
         scene=scene,
         name=name,
-        sep=sep
+        sep=sep,
+        context=context
     )
 
     return join_path(folder, file_name, sep)
@@ -61,21 +358,25 @@ def get_file_name(
     output_type=None,
     scene=1,
     name="",
-    version=1
+    version=1,
+    context=None
 ):
-    entity = Entity.get(task.entity_id)
-    project = get_project(entity)
-    tree = get_tree_from_project(project)
+    if context is None:
+        context = PathContext()
+    entity = context.get_entity(task.entity_id)
+    project = get_project(entity, context)
+    compiled_tree = get_compiled_tree(project)
 
     file_name = get_file_name_root(
-        tree,
+        compiled_tree,
         mode,
         entity,
         task,
         software,
         output_type,
         scene,
-        name
+        name,
+        context
     )
     file_name = add_version_suffix_to_file_name(file_name, version)
 
@@ -89,32 +390,39 @@ def get_folder_path(
     output_type=None,
     scene=1,
     name="",
-    sep=os.sep
+    sep=os.sep,
+    context=None
 ):
-    entity = Entity.get(task.entity_id)
-    project = get_project(entity)
+    if context is None:
+        context = PathContext()
+    entity = context.get_entity(task.entity_id)
+    project = get_project(entity, context)
     tree = get_tree_from_project(project)
     root_path = get_root_path(tree, mode, sep)
-    style = tree[mode]["folder_path"].get("style", "")
 
-    folder_template = get_folder_path_template(tree, mode, entity)
-    folder_path = update_variable(
-        folder_template,
+    folder_template = get_compiled_tree(project).get_template(
+        mode,
+        "folder_path",
+        get_entity_kind(entity)
+    )
+    folder_path = folder_template.render(
         entity,
         task,
         software,
         output_type,
         scene,
         name,
-        style
+        context
     )
     folder_path = change_folder_path_separators(folder_path, sep)
 
     return join_path(root_path, folder_path, "")
 
 
-def get_project(entity):
-    return Project.get(entity.project_id)
+def get_project(entity, context=None):
+    if context is None:
+        return Project.get(entity.project_id)
+    return context.get_project(entity.project_id)
 
 
 def get_tree_from_project(project):
@@ -133,46 +441,54 @@ def get_tree_from_file(tree_name):
     return json.loads(tree_string)
 
 
-def get_folder_path_template(tree, mode, entity):
+def get_entity_kind(entity):
     if shots_service.is_shot(entity):
-        return tree[mode]["folder_path"]["shot"]
+        return "shot"
     elif shots_service.is_sequence(entity):
-        return tree[mode]["folder_path"]["sequence"]
+        return "sequence"
     else:
-        return tree[mode]["folder_path"]["asset"]
+        return "asset"
+
+
+def get_folder_path_template(tree, mode, entity):
+    return tree[mode]["folder_path"][get_entity_kind(entity)]
 
 
 def get_file_name_template(tree, mode, entity):
-    if shots_service.is_shot(entity):
-        return tree[mode]["file_name"]["shot"]
-    elif shots_service.is_sequence(entity):
-        return tree[mode]["file_name"]["sequence"]
-    else:
-        return tree[mode]["file_name"]["asset"]
+    return tree[mode]["file_name"][get_entity_kind(entity)]
 
 
 def get_file_name_root(
-    tree,
+    compiled_tree,
     mode,
     entity,
     task,
     software,
     output_type,
     scene,
-    name
+    name,
+    context=None
 ):
-    file_name = get_file_name_template(tree, mode, entity)
-    file_name = update_variable(
-        file_name,
+    file_name_template = compiled_tree.get_template(
+        mode,
+        "file_name",
+        get_entity_kind(entity),
+        "lowercase"
+    )
+    file_name = file_name_template.render(
         entity,
         task,
         software,
         output_type,
         scene,
-        name
+        name,
+        context
     )
     file_name = slugify(file_name, separator="_")
-    file_name = apply_style(file_name, tree[mode]["file_name"].get("style", ""))
+    file_name = apply_style(
+        file_name,
+        compiled_tree.get_style(mode, "file_name")
+    )
     return file_name
 
 
@@ -204,27 +520,46 @@ def update_variable(
     output_type=None,
     scene=1,
     name="",
-    style="lowercase"
+    style="lowercase",
+    context=None
 ):
-    variables = re.findall('<(\w*)>', template)
-
-    render = template
-    for variable in variables:
-        data = get_folder_from_datatype(
-            variable,
-            entity,
-            task,
-            software,
-            output_type,
-            scene,
-            name
-        )
-        render = render.replace(
-            "<%s>" % variable,
-            apply_style(slugify(data, separator="_"), style)
-        )
+    return compile_template(template, style).render(
+        entity,
+        task,
+        software,
+        output_type,
+        scene,
+        name,
+        context
+    )
 
-    return render
+
+datatype_resolvers = {
+    "Project": lambda v: get_folder_from_project(v.entity, v.context),
+    "Task": lambda v: get_folder_from_task(v.task),
+    "TaskType": lambda v: get_folder_from_task_type(v.task, v.context),
+    "Department": lambda v: get_folder_from_department(v.task, v.context),
+    "Shot": lambda v: get_folder_from_shot(v.entity),
+    "AssetType": lambda v: get_folder_from_asset_type(v.entity, v.context),
+    "Sequence": lambda v: get_folder_from_sequence(v.entity, v.context),
+    "Episode": lambda v: get_folder_from_episode(v.entity, v.context),
+    "Asset": lambda v: get_folder_from_asset(v.entity),
+    "Software": lambda v: get_folder_from_software(v.software),
+    "OutputType": lambda v: get_folder_from_output_type(v.output_type),
+    "Scene": lambda v: get_folder_from_scene(v.scene),
+    "Name": lambda v: v.name
+}
+
+
+def get_datatype_resolver(datatype):
+    """
+    Return the function computing the value of given data type from path
+    variables. Unknown data types raise an error when the value is computed.
+    """
+    def raise_unknown_datatype(variables):
+        raise MalformedFileTreeException("Unknown data type: %s." % datatype)
+
+    return datatype_resolvers.get(datatype, raise_unknown_datatype)
 
 
 def get_folder_from_datatype(
@@ -234,42 +569,20 @@ def get_folder_from_datatype(
     software=None,
     output_type=None,
     scene=1,
-    name=""
+    name="",
+    context=None
 ):
-    if datatype == "Project":
-        folder = get_folder_from_project(entity)
-    elif datatype == "Task":
-        folder = get_folder_from_task(task)
-    elif datatype == "TaskType":
-        folder = get_folder_from_task_type(task)
-    elif datatype == "Department":
-        folder = get_folder_from_department(task)
-    elif datatype == "Shot":
-        folder = get_folder_from_shot(entity)
-    elif datatype == "AssetType":
-        folder = get_folder_from_asset_type(entity)
-    elif datatype == "Sequence":
-        folder = get_folder_from_sequence(entity)
-    elif datatype == "Episode":
-        folder = get_folder_from_episode(entity)
-    elif datatype == "Asset":
-        folder = get_folder_from_asset(entity)
-    elif datatype == "Software":
-        folder = get_folder_from_software(software)
-    elif datatype == "OutputType":
-        folder = get_folder_from_output_type(output_type)
-    elif datatype == "Scene":
-        folder = get_folder_from_scene(scene)
-    elif datatype == "Name":
-        folder = name
-    else:
-        raise MalformedFileTreeException("Unknown data type: %s." % datatype)
+    if context is None:
+        context = PathContext()
 
-    return folder
+    resolver = get_datatype_resolver(datatype)
+    return resolver(PathVariables(
+        entity, task, software, output_type, scene, name, context
+    ))
 
 
-def get_folder_from_project(entity):
-    project = get_project(entity)
+def get_folder_from_project(entity, context=None):
+    project = get_project(entity, context)
     return project.name
 
 
@@ -288,18 +601,22 @@ def get_folder_from_output_type(output_type):
     return output_type.name.lower()
 
 
-def get_folder_from_department(task):
+def get_folder_from_department(task, context=None):
+    if context is None:
+        context = PathContext()
     folder = ""
-    task_type = TaskType.get(task.task_type_id)
+    task_type = context.get_task_type(task.task_type_id)
     if task_type is not None:
-        task_type = tasks_service.get_department_from_task_type(task_type)
-        folder = task_type.name
+        department = context.get_department(task_type.department_id)
+        folder = department.name
     return folder
 
 
-def get_folder_from_task_type(task):
+def get_folder_from_task_type(task, context=None):
+    if context is None:
+        context = PathContext()
     folder = ""
-    task_type = TaskType.get(task.task_type_id)
+    task_type = context.get_task_type(task.task_type_id)
     if task_type is not None:
         folder = task_type.name
     return folder
@@ -312,9 +629,11 @@ def get_folder_from_asset(asset):
     return folder
 
 
-def get_folder_from_sequence(entity):
+def get_folder_from_sequence(entity, context=None):
+    if context is None:
+        context = PathContext()
     if shots_service.is_shot(entity):
-        sequence = shots_service.get_sequence_from_shot(entity)
+        sequence = context.get_entity(entity.parent_id)
         sequence_name = sequence.name
     elif shots_service.is_sequence(entity):
         sequence_name = entity.name
@@ -322,19 +641,21 @@ def get_folder_from_sequence(entity):
         sequence_name = ""
 
     if "Seq" in sequence_name:
-        sequence_number = sequence.name[3:]
+        sequence_number = sequence_name[3:]
         sequence_name = "S%s" % sequence_number.zfill(3)
     return sequence_name
 
 
-def get_folder_from_episode(entity):
+def get_folder_from_episode(entity, context=None):
+    if context is None:
+        context = PathContext()
     if shots_service.is_shot(entity):
-        sequence = shots_service.get_sequence_from_shot(entity)
+        sequence = context.get_entity(entity.parent_id)
     elif shots_service.is_sequence(entity):
         sequence = entity
 
     try:
-        episode = shots_service.get_episode_from_sequence(sequence)
+        episode = context.get_entity(sequence.parent_id)
         episode_name = episode.name
     except:
         episode_name = "e001"
@@ -342,9 +663,11 @@ def get_folder_from_episode(entity):
     return episode_name
 
 
-def get_folder_from_asset_type(asset):
+def get_folder_from_asset_type(asset, context=None):
+    if context is None:
+        context = PathContext()
     if asset is not None:
-        asset_type = EntityType.get(asset.entity_type_id)
+        asset_type = context.get_entity_type(asset.entity_type_id)
         folder = asset_type.name
     else:
         raise MalformedFileTreeException("Given asset is null.")
@@ -393,6 +716,108 @@ class PathTokens(object):
 
 
 def get_shot_task_from_path(file_path, project, mode="working", sep="/"):
+    return get_task_from_path(file_path, project, "shot", mode, sep)
+
+
+def get_asset_task_from_path(file_path, project, mode="working", sep="/"):
+    return get_task_from_path(file_path, project, "asset", mode, sep)
+
+
+def get_task_from_path(
+    file_path,
+    project,
+    path_type="shot",
+    mode="working",
+    sep="/"
+):
+    task_id = get_task_id_from_path(file_path, project, path_type, mode, sep)
+    task = Task.get(task_id)
+    if task is None:
+        clear_path_index(project.id)
+        task_id = get_task_id_from_path(
+            file_path, project, path_type, mode, sep
+        )
+        task = Task.get(task_id)
+        if task is None:
+            raise TaskNotFoundException
+    return task
+
+
+def get_tasks_from_paths(project, path_queries, mode="working", sep="/"):
+    """
+    Find the tasks matching given paths. A path query is a dict with a
+    file_path and a type (shot or asset) keys. Tasks are retrieved with a
+    single query. For paths that don't match any task, the task is None.
+    """
+    index = get_path_index(project.id)
+    task_ids = []
+    for path_query in path_queries:
+        try:
+            task_id = get_task_id_from_path(
+                path_query.get("file_path", ""),
+                project,
+                path_query.get("type", "shot"),
+                mode,
+                sep,
+                index
+            )
+        except (WrongPathFormatException, TaskNotFoundException):
+            task_id = None
+        task_ids.append(task_id)
+
+    tasks = {}
+    found_task_ids = [task_id for task_id in task_ids if task_id is not None]
+    if len(found_task_ids) > 0:
+        for task in Task.query.filter(Task.id.in_(found_task_ids)):
+            tasks[str(task.id)] = task.serialize()
+
+    return [
+        {
+            "file_path": path_query.get("file_path", ""),
+            "task": tasks.get(task_id, None)
+        }
+        for (path_query, task_id) in zip(path_queries, task_ids)
+    ]
+
+
+def get_task_id_from_path(
+    file_path,
+    project,
+    path_type="shot",
+    mode="working",
+    sep="/",
+    index=None
+):
+    """
+    Find the id of the task matching given path. Names extracted from the
+    path are first looked up in the project path index. If the index doesn't
+    know them, the database is queried and the index is rebuilt on next use.
+    """
+    if index is None:
+        index = get_path_index(project.id)
+
+    if path_type == "shot":
+        data_names = get_shot_data_names_from_path(
+            file_path, project, mode, sep
+        )
+        task_id = index.get_shot_task_id(data_names)
+    else:
+        data_names = get_asset_data_names_from_path(
+            file_path, project, mode, sep
+        )
+        task_id = index.get_asset_task_id(data_names)
+
+    if task_id is None:
+        if path_type == "shot":
+            task = guess_shot_task(project, data_names)
+        else:
+            task = guess_asset_task(project, data_names)
+        clear_path_index(project.id)
+        task_id = str(task.id)
+    return task_id
+
+
+def get_shot_data_names_from_path(file_path, project, mode="working", sep="/"):
     template_elements = get_shot_template_folders(project, mode, sep)
     elements = get_path_folders(project, file_path, mode, sep)
 
@@ -403,11 +828,35 @@ def get_shot_task_from_path(file_path, project, mode="working", sep="/"):
             "%s doesn't match %s" % (file_path, template)
         )
 
-    data_names = extract_variable_values_from_path(
+    return extract_variable_values_from_path(
+        elements,
+        template_elements
+    )
+
+
+def get_asset_data_names_from_path(
+    file_path,
+    project,
+    mode="working",
+    sep="/"
+):
+    template_elements = get_asset_template_folders(project, mode, sep)
+    elements = get_path_folders(project, file_path, mode, sep)
+
+    if len(elements) != len(template_elements):
+        tree = get_tree_from_project(project)
+        template = get_asset_path_template(tree, mode)
+        raise WrongPathFormatException(
+            "%s doesn't match %s" % (file_path, template)
+        )
+
+    return extract_variable_values_from_path(
         elements,
         template_elements
     )
 
+
+def guess_shot_task(project, data_names):
     shot = guess_shot(
         project,
         data_names.get(PathTokens.EPISODE, ""),
@@ -418,31 +867,14 @@ def get_shot_task_from_path(file_path, project, mode="working", sep="/"):
         data_names.get(PathTokens.DEPARTMENT, ""),
         data_names.get(PathTokens.TASK_TYPE, ""),
     )
-    task = guess_task(
+    return guess_task(
         shot,
         task_type,
         data_names.get(PathTokens.TASK, ""),
     )
 
-    return task
-
-
-def get_asset_task_from_path(file_path, project, mode="working", sep="/"):
-    template_elements = get_asset_template_folders(project, mode, sep)
-    elements = get_path_folders(project, file_path, mode, sep)
-
-    if len(elements) != len(template_elements):
-        tree = get_tree_from_project(project)
-        template = get_asset_path_template(tree, mode)
-        raise WrongPathFormatException(
-            "%s doesn't match %s" % (file_path, template)
-        )
-
-    data_names = extract_variable_values_from_path(
-        elements,
-        template_elements
-    )
 
+def guess_asset_task(project, data_names):
     asset = guess_asset(
         project,
         data_names.get(PathTokens.ASSET_TYPE, ""),
@@ -452,14 +884,12 @@ def get_asset_task_from_path(file_path, project, mode="working", sep="/"):
         data_names.get(PathTokens.DEPARTMENT, ""),
         data_names.get(PathTokens.TASK_TYPE, ""),
     )
-    task = guess_task(
+    return guess_task(
         asset,
         task_type,
         data_names.get(PathTokens.TASK, ""),
     )
 
-    return task
-
 
 def extract_variable_values_from_path(elements, template_elements):
     # TODO: add prefix / suffix handle
@@ -573,7 +1003,10 @@ def guess_task_type(department_name, task_type_name):
         "name": task_type_name
     }
     if len(department_name) > 0:
-        criterions["department_id"] = Department.get_by(name=department_name).id
+        department = Department.get_by(name=department_name)
+        if department is None:
+            return None
+        criterions["department_id"] = department.id
 
     return TaskType.get_by(**criterions)
 
@@ -583,6 +1016,8 @@ def guess_task(entity, task_type, task_name):
         raise WrongPathFormatException(
             "No asset or shot found in given path."
         )
+    if task_type is None:
+        raise TaskNotFoundException
 
     criterions = {
         "entity_id": entity.id,
@@ -596,3 +1031,243 @@ def guess_task(entity, task_type, task_name):
         raise TaskNotFoundException
     else:
         return task
+
+
+def get_key_id(instance_id):
+    if instance_id is None:
+        return None
+    return str(instance_id)
+
+
+class PathIndex(object):
+    """
+    In-memory index of the names of a project entities and tasks. It gives
+    ids of tasks matching the names extracted from a path without querying
+    the database. The lookups follow the same rules as the guess functions.
+    """
+
+    def __init__(self, project_id):
+        self.entity_types = {}
+        self.departments = {}
+        self.task_types = {}
+        self.entities = {}
+        self.children = {}
+        self.tasks = {}
+
+        for (entity_type_id, name) in EntityType.query.with_entities(
+            EntityType.id, EntityType.name
+        ):
+            self.entity_types.setdefault(name, str(entity_type_id))
+
+        for (department_id, name) in Department.query.with_entities(
+            Department.id, Department.name
+        ):
+            self.departments.setdefault(name, str(department_id))
+
+        for (task_type_id, department_id, name) in TaskType.query \
+                .with_entities(
+                    TaskType.id, TaskType.department_id, TaskType.name
+                ):
+            self.task_types.setdefault(name, []).append(
+                (get_key_id(department_id), str(task_type_id))
+            )
+
+        for (entity_id, entity_type_id, parent_id, name) in Entity.query \
+                .filter_by(project_id=project_id) \
+                .with_entities(
+                    Entity.id, Entity.entity_type_id, Entity.parent_id,
+                    Entity.name
+                ):
+            entity_type_id = str(entity_type_id)
+            self.entities.setdefault((entity_type_id, name), str(entity_id))
+            self.children.setdefault(
+                (entity_type_id, get_key_id(parent_id), name),
+                str(entity_id)
+            )
+
+        for (task_id, entity_id, task_type_id, name) in Task.query \
+                .filter_by(project_id=project_id) \
+                .with_entities(
+                    Task.id, Task.entity_id, Task.task_type_id, Task.name
+                ):
+            self.tasks.setdefault(
+                (get_key_id(entity_id), get_key_id(task_type_id)), []
+            ).append((name, str(task_id)))
+
+    def get_shot_task_id(self, data_names):
+        episode_id = None
+        episode_name = data_names.get(PathTokens.EPISODE, "")
+        if len(episode_name) > 0:
+            episode_type_id = str(shots_service.get_episode_type().id)
+            episode_id = self.entities.get((episode_type_id, episode_name))
+
+        sequence_id = None
+        sequence_name = data_names.get(PathTokens.SEQUENCE, "")
+        if len(sequence_name) > 0:
+            sequence_type_id = str(shots_service.get_sequence_type().id)
+            sequence_id = self.children.get(
+                (sequence_type_id, episode_id, sequence_name)
+            )
+
+        shot_type_id = str(shots_service.get_shot_type().id)
+        shot_id = self.children.get((
+            shot_type_id,
+            sequence_id,
+            data_names.get(PathTokens.SHOT, "")
+        ))
+        return self.get_task_id(shot_id, data_names)
+
+    def get_asset_task_id(self, data_names):
+        asset_type_id = self.entity_types.get(
+            data_names.get(PathTokens.ASSET_TYPE, "")
+        )
+        asset_id = self.entities.get(
+            (asset_type_id, data_names.get(PathTokens.ASSET, ""))
+        )
+        return self.get_task_id(asset_id, data_names)
+
+    def get_task_id(self, entity_id, data_names):
+        task_type_id = self.get_task_type_id(
+            data_names.get(PathTokens.DEPARTMENT, ""),
+            data_names.get(PathTokens.TASK_TYPE, "")
+        )
+        if entity_id is None or task_type_id is None:
+            return None
+
+        task_name = data_names.get(PathTokens.TASK, "")
+        for (name, task_id) in self.tasks.get((entity_id, task_type_id), []):
+            if len(task_name) == 0 or name == task_name:
+                return task_id
+        return None
+
+    def get_task_type_id(self, department_name, task_type_name):
+        department_id = None
+        if len(department_name) > 0:
+            department_id = self.departments.get(department_name)
+            if department_id is None:
+                return None
+
+        for (task_type_department_id, task_type_id) in \
+                self.task_types.get(task_type_name, []):
+            if department_id is None or \
+               department_id == task_type_department_id:
+                return task_type_id
+        return None
+
+
+path_index_cache = cache.new(
+    "path_indexes",
+    ttl=app.config["REFERENCE_DATA_CACHE_TTL"],
+    max_size=100
+)
+
+
+def get_path_index(project_id):
+    """
+    Return the path index of given project. It is built on first use. Indexes
+    are tagged with versions stored in Redis, so an index modified by another
+    process is built again.
+    """
+    key = str(project_id)
+    version = get_path_index_version(key)
+    entry = path_index_cache.get(key)
+    if entry is None or entry[0] != version:
+        entry = path_index_cache.set(key, (version, PathIndex(project_id)))
+    return entry[1]
+
+
+def get_path_index_version(project_id):
+    return cache_versions_store.get_versions(
+        "path_indexes",
+        "path_indexes:%s" % project_id
+    )
+
+
+def clear_path_index(project_id=None):
+    """
+    Drop the path index of given project, or all indexes if no project is
+    given. They will be rebuilt on next use, in every process.
+    """
+    clear_local_path_index(project_id)
+    if project_id is None:
+        cache_versions_store.bump("path_indexes")
+    else:
+        cache_versions_store.bump("path_indexes:%s" % project_id)
+
+
+def clear_local_path_index(project_id=None):
+    if project_id is None:
+        path_index_cache.clear()
+    else:
+        path_index_cache.delete(str(project_id))
+
+
+def clear_session_path_index(target, project_id=None):
+    """
+    Drop the local index right away. The other processes are notified once
+    the session is committed, so they don't rebuild their index from data
+    that are not visible yet.
+    """
+    clear_local_path_index(project_id)
+    session = object_session(target)
+    if session is not None:
+        project_ids = session.info.setdefault("path_index_changes", set())
+        project_ids.add(None if project_id is None else str(project_id))
+
+
+@event.listens_for(Session, "after_commit")
+def publish_path_index_changes(session):
+    project_ids = session.info.pop("path_index_changes", None)
+    if project_ids:
+        if None in project_ids:
+            clear_path_index()
+        else:
+            for project_id in project_ids:
+                clear_path_index(project_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def drop_path_index_changes(session):
+    session.info.pop("path_index_changes", None)
+
+
+def has_changed(target, keys):
+    state = inspect(target)
+    return any(state.attrs[key].history.has_changes() for key in keys)
+
+
+@event.listens_for(Entity, "after_insert")
+@event.listens_for(Entity, "after_delete")
+@event.listens_for(Task, "after_insert")
+@event.listens_for(Task, "after_delete")
+def clear_project_path_index(mapper, connection, target):
+    clear_session_path_index(target, target.project_id)
+
+
+@event.listens_for(Entity, "after_update")
+def clear_path_index_on_entity_update(mapper, connection, target):
+    if has_changed(target, ["project_id"]):
+        clear_session_path_index(target)
+    elif has_changed(target, ["name", "entity_type_id", "parent_id"]):
+        clear_session_path_index(target, target.project_id)
+
+
+@event.listens_for(Task, "after_update")
+def clear_path_index_on_task_update(mapper, connection, target):
+    if has_changed(target, ["project_id"]):
+        clear_session_path_index(target)
+    elif has_changed(target, ["name", "entity_id", "task_type_id"]):
+        clear_session_path_index(target, target.project_id)
+
+
+@event.listens_for(EntityType, "after_insert")
+@event.listens_for(EntityType, "after_update")
+@event.listens_for(EntityType, "after_delete")
+@event.listens_for(TaskType, "after_insert")
+@event.listens_for(TaskType, "after_update")
+@event.listens_for(TaskType, "after_delete")
+@event.listens_for(Department, "after_insert")
+@event.listens_for(Department, "after_update")
+@event.listens_for(Department, "after_delete")
+def clear_all_path_indexes(mapper, connection, target):
+    clear_session_path_index(target)
@@ -0,0 +1,195 @@
+import calendar
+import datetime
+
+from sqlalchemy import event
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Session, object_session
+
+from zou.app.models.entity import Entity
+from zou.app.models.entity_type import EntityType
+from zou.app.models.task import Task
+from zou.app.models.task_status import TaskStatus
+from zou.app.models.task_type import TaskType
+from zou.app.services.exception import GridHistoryExpiredException
+from zou.app.stores import grid_store
+
+GRID_NAMES = ["shots", "assets"]
+
+
+def get_grid(name, project_id, build_rows, is_rebuild_needed, since=None):
+    """
+    Return rows of the grid of given project. The grid is built entirely on
+    first read, then only rows modified since the previous read are built
+    again. If since is given (as a datetime), only rows written after this
+    date are returned.
+
+    build_rows receives the project id and optionally the ids of the rows to
+    build. is_rebuild_needed receives the ids of the modified rows and tells
+    if they require a full rebuild. GridHistoryExpiredException is raised
+    if removals since given date are not known anymore.
+    """
+    project_id = str(project_id)
+    if since is not None and \
+       get_timestamp(since) < grid_store.get_horizon(name, project_id):
+        raise GridHistoryExpiredException
+    if grid_store.is_built(name, project_id):
+        (row_ids, version) = grid_store.pop_dirty(name, project_id)
+        if len(row_ids) > 0:
+            try:
+                if is_rebuild_needed(row_ids):
+                    build_grid(name, project_id, build_rows)
+                else:
+                    update_grid(name, project_id, build_rows, row_ids, version)
+            except Exception:
+                restore_dirty(name, project_id, row_ids)
+                raise
+    else:
+        build_grid(name, project_id, build_rows)
+
+    return grid_store.get_rows(name, project_id, get_timestamp(since))
+
+
+def build_grid(name, project_id, build_rows):
+    generation = grid_store.get_generation()
+    (row_ids, version) = grid_store.pop_dirty(name, project_id)
+    try:
+        grid_store.save_rows(
+            name,
+            project_id,
+            build_rows(project_id),
+            generation,
+            version
+        )
+    except Exception:
+        restore_dirty(name, project_id, row_ids)
+        raise
+
+
+def update_grid(name, project_id, build_rows, row_ids, version):
+    rows = build_rows(project_id, row_ids)
+    removed_row_ids = row_ids - set(row["id"] for row in rows)
+    grid_store.update_rows(
+        name,
+        project_id,
+        rows,
+        list(removed_row_ids),
+        version
+    )
+
+
+def restore_dirty(name, project_id, row_ids):
+    """
+    Rows that could not be written (database error, timeout...) are flagged
+    as modified again, so the next read builds them.
+    """
+    if len(row_ids) > 0:
+        grid_store.mark_dirty(name, {project_id: row_ids})
+
+
+def get_etag(name, project_id):
+    return grid_store.get_etag(name, str(project_id))
+
+
+def get_removed_row_ids(name, project_id, since):
+    """
+    Return ids of the rows removed from given grid after given date.
+    """
+    return grid_store.get_removed_row_ids(
+        name,
+        str(project_id),
+        get_timestamp(since)
+    )
+
+
+def get_last_update(name, project_id):
+    """
+    Return the current date of the grid clock. Clients give it back as since
+    value to retrieve modifications made after this call. It must be read
+    before the rows sent to the client.
+    """
+    timestamp = grid_store.get_last_update(name, str(project_id))
+    return datetime.datetime.utcfromtimestamp(timestamp // 1000000) \
+        .replace(microsecond=timestamp % 1000000)
+
+
+def get_timestamp(date):
+    """
+    Convert given UTC date to a timestamp in microseconds, the unit used by
+    the grid store.
+    """
+    if date is None:
+        return None
+    else:
+        return calendar.timegm(date.utctimetuple()) * 1000000 + \
+            date.microsecond
+
+
+def mark_changes(changes):
+    """
+    Flag grid rows as modified. Changes are given as a dict where keys are
+    project ids and values are entity ids. It's required only when data are
+    written without the ORM (multi-row inserts).
+    """
+    changes = {
+        str(project_id): set(str(entity_id) for entity_id in entity_ids)
+        for (project_id, entity_ids) in changes.items()
+    }
+    for name in GRID_NAMES:
+        grid_store.mark_dirty(name, changes)
+
+
+def add_session_change(target, project_id, entity_id):
+    session = object_session(target)
+    if session is not None and project_id is not None and \
+       entity_id is not None:
+        changes = session.info.setdefault("grid_changes", {})
+        changes.setdefault(str(project_id), set()).add(str(entity_id))
+
+
+@event.listens_for(Task, "after_insert")
+@event.listens_for(Task, "after_update")
+@event.listens_for(Task, "after_delete")
+def track_task_change(mapper, connection, task):
+    add_session_change(task, task.project_id, task.entity_id)
+    for entity_id in inspect(task).attrs.entity_id.history.deleted:
+        add_session_change(task, task.project_id, entity_id)
+
+
+@event.listens_for(Entity, "after_insert")
+@event.listens_for(Entity, "after_update")
+@event.listens_for(Entity, "after_delete")
+def track_entity_change(mapper, connection, entity):
+    add_session_change(entity, entity.project_id, entity.id)
+
+
+@event.listens_for(TaskStatus, "after_update")
+@event.listens_for(TaskStatus, "after_delete")
+@event.listens_for(TaskType, "after_update")
+@event.listens_for(TaskType, "after_delete")
+@event.listens_for(EntityType, "after_update")
+@event.listens_for(EntityType, "after_delete")
+def track_reference_change(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["grids_reset"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def save_session_changes(session):
+    """
+    Changes are sent to the grid store once they are committed, so grids
+    are never refreshed with data that could be rolled back.
+    """
+    if session.info.pop("grids_reset", False):
+        grid_store.invalidate_all()
+
+    changes = session.info.pop("grid_changes", None)
+    if changes:
+        for name in GRID_NAMES:
+            grid_store.mark_dirty(name, changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def drop_session_changes(session):
+    session.info.pop("grids_reset", None)
+    session.info.pop("grid_changes", None)
@@ -1,12 +1,18 @@
 import slugify
 
+from sqlalchemy import event
 from sqlalchemy.exc import StatementError
 
+from flask import g, has_request_context
 from flask_jwt_extended import get_jwt_identity
 
+from zou.app import config, db
 from zou.app.models.person import Person
+from zou.app.utils import cache
 from zou.app.services.exception import PersonNotFoundException
 
+person_cache = cache.new("persons", ttl=config.PERSON_CACHE_TTL, max_size=1000)
+
 
 def all():
     return Person.query.all()
@@ -87,4 +93,79 @@ def get_by_desktop_login(desktop_login):
 
 
 def get_current_user():
-    return get_by_email(get_jwt_identity())
+    """
+    Return the person matching the JWT identity. It is retrieved from the
+    database at most once per request.
+    """
+    return get_person_by_identity(get_jwt_identity())
+
+
+def get_identity_person(person_id):
+    """
+    Return the person matching given identity id, once per request too.
+    """
+    return get_request_person("id", str(person_id), get_person)
+
+
+def get_person_by_identity(email):
+    """
+    Return the person matching given JWT identity.
+    """
+    return get_request_person("email", email, get_by_email)
+
+
+def get_request_person(field, value, loader):
+    """
+    Return person stored in the request cache for given field value. If it's
+    not there, the process cache is checked, it keeps persons for a few
+    seconds. As a last resort the person is loaded from the database and a
+    detached copy is stored in both caches under its email and its id.
+    Cached copies are merged in the session without querying the database.
+    """
+    persons = cache.get_request_cache("persons")
+    if persons is None:
+        return loader(value)
+
+    key = (field, value)
+    person = persons.get(key, None)
+    if person is None:
+        person = person_cache.get(key)
+        if person is None:
+            add_identity_lookup()
+            person = loader(value)
+            person_copy = cache.get_detached_copy(person)
+            for person_key in get_person_keys(person):
+                person_cache.set(person_key, person_copy)
+                persons[person_key] = person_copy
+            return person
+        else:
+            for person_key in get_person_keys(person):
+                persons[person_key] = person
+
+    return db.session.merge(person, load=False)
+
+
+def get_person_keys(person):
+    return [("email", person.email), ("id", str(person.id))]
+
+
+def add_identity_lookup():
+    g.identity_lookups = get_identity_lookups() + 1
+
+
+def get_identity_lookups():
+    """
+    Number of times the current person was retrieved from the database while
+    processing the current request.
+    """
+    if has_request_context():
+        return getattr(g, "identity_lookups", 0)
+    else:
+        return 0
+
+
+@event.listens_for(Person, "after_update")
+@event.listens_for(Person, "after_delete")
+def clear_request_persons(mapper, connection, target):
+    person_cache.clear()
+    cache.clear_request_cache("persons")
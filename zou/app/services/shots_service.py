@@ -1,7 +1,9 @@
-from sqlalchemy.orm import aliased
+from sqlalchemy import event
+from sqlalchemy.orm import aliased, subqueryload
 from sqlalchemy.exc import IntegrityError
 
-from zou.app.utils import events, fields
+from zou.app import config
+from zou.app.utils import cache, events, fields
 
 from zou.app.models.entity import Entity
 from zou.app.models.entity_type import EntityType
@@ -10,6 +12,7 @@ from zou.app.models.task import Task
 from zou.app.models.task_status import TaskStatus
 from zou.app.models.task_type import TaskType
 
+from zou.app.services import grids_service
 from zou.app.services.exception import (
     EpisodeNotFoundException,
     SequenceNotFoundException,
@@ -33,25 +36,50 @@ def get_episode_from_sequence(sequence):
     return episode
 
 
+entity_type_cache = cache.new(
+    "entity_types",
+    ttl=config.REFERENCE_DATA_CACHE_TTL
+)
+
+
+@event.listens_for(EntityType, "after_insert")
+@event.listens_for(EntityType, "after_update")
+@event.listens_for(EntityType, "after_delete")
+def clear_entity_type_cache(mapper, connection, target):
+    cache.clear_session_cache(target, entity_type_cache)
+
+
+def get_or_create_entity_type(name):
+    entity_type = EntityType.get_by(name=name)
+    if entity_type is None:
+        entity_type = EntityType.create(name=name)
+    return entity_type
+
+
+def get_cached_entity_type(name):
+    """
+    Entity types used to describe the shot hierarchy are read very often and
+    almost never modified. They are kept in a cache until they are modified
+    by any process.
+    """
+    return cache.get_or_load_instance(
+        entity_type_cache,
+        name,
+        lambda: get_or_create_entity_type(name),
+        cache.get_version(entity_type_cache)
+    )
+
+
 def get_episode_type():
-    episode_type = EntityType.get_by(name="Episode")
-    if episode_type is None:
-        episode_type = EntityType.create(name="Episode")
-    return episode_type
+    return get_cached_entity_type("Episode")
 
 
 def get_sequence_type():
-    sequence_type = EntityType.get_by(name="Sequence")
-    if sequence_type is None:
-        sequence_type = EntityType.create(name="Sequence")
-    return sequence_type
+    return get_cached_entity_type("Sequence")
 
 
 def get_shot_type():
-    shot_type = EntityType.get_by(name="Shot")
-    if shot_type is None:
-        shot_type = EntityType.create(name="Shot")
-    return shot_type
+    return get_cached_entity_type("Shot")
 
 
 def get_episodes(criterions={}):
@@ -109,9 +137,9 @@ def get_episode_map(criterions={}):
     return episode_map
 
 
-def get_shot_map(criterions={}):
+def get_shot_map(criterions={}, shot_ids=None):
     shot_map = {}
-    episode_map = get_episode_map(criterions)
+    episode_map = get_episode_map(dict(criterions))
 
     shot_type = get_shot_type()
     Sequence = aliased(Entity, name='sequence')
@@ -123,6 +151,8 @@ def get_shot_map(criterions={}):
     if "project_id" in criterions:
         shot_query = \
             shot_query.filter(Entity.project_id == criterions["project_id"])
+    if shot_ids is not None:
+        shot_query = shot_query.filter(Entity.id.in_(shot_ids))
     shots = shot_query.all()
 
     for (shot, sequence_name, sequence_parent_id) in shots:
@@ -155,18 +185,63 @@ def get_shot_map(criterions={}):
 
 
 def get_shots_and_tasks(criterions={}):
+    """
+    Return shots with their tasks. When the shots of a single project are
+    requested, the result is read from the grid maintained for this project.
+    """
+    if list(criterions.keys()) == ["project_id"]:
+        return get_shots_grid(criterions["project_id"])
+    else:
+        return build_shots_and_tasks(criterions)
+
+
+def get_shots_grid(project_id):
+    return grids_service.get_grid(
+        "shots",
+        project_id,
+        build_shots_grid_rows,
+        is_shots_grid_rebuild_needed
+    )
+
+
+def get_shots_grid_etag(project_id):
+    return grids_service.get_etag("shots", project_id)
+
+
+def build_shots_grid_rows(project_id, shot_ids=None):
+    return build_shots_and_tasks({"project_id": project_id}, shot_ids)
+
+
+def is_shots_grid_rebuild_needed(entity_ids):
+    """
+    Sequence and episode names are stored in every shot row, so their
+    modification requires to build the whole grid again.
+    """
+    return Entity.query \
+        .filter(Entity.id.in_(entity_ids)) \
+        .filter(Entity.entity_type_id.in_([
+            get_sequence_type().id,
+            get_episode_type().id
+        ])) \
+        .count() > 0
+
+
+def build_shots_and_tasks(criterions={}, shot_ids=None):
     shot_type = get_shot_type()
     task_status_map = get_task_status_map()
     task_type_map = get_task_type_map()
-    shot_map = get_shot_map(criterions)
+    shot_map = get_shot_map(criterions, shot_ids)
     task_map = {}
 
     query = Task.query \
         .join(Entity) \
-        .filter(Entity.entity_type_id == shot_type.id)
+        .filter(Entity.entity_type_id == shot_type.id) \
+        .options(subqueryload(Task.assignees))
 
     if "project_id" in criterions:
         query = query.filter(Entity.project_id == criterions["project_id"])
+    if shot_ids is not None:
+        query = query.filter(Task.entity_id.in_(shot_ids))
 
     tasks = query.all()
 
@@ -1,9 +1,10 @@
 import datetime
 
+from sqlalchemy import event, tuple_
 from sqlalchemy.exc import StatementError, IntegrityError, DataError
 
 from zou.app import app
-from zou.app.utils import events
+from zou.app.utils import cache, events
 
 from zou.app.models.comment import Comment
 from zou.app.models.person import Person
@@ -32,20 +33,46 @@ from zou.app.services import (
 )
 
 
+task_status_cache = cache.new(
+    "task_statuses",
+    ttl=app.config["REFERENCE_DATA_CACHE_TTL"]
+)
+
+
+@event.listens_for(TaskStatus, "after_insert")
+@event.listens_for(TaskStatus, "after_update")
+@event.listens_for(TaskStatus, "after_delete")
+def clear_task_status_cache(mapper, connection, target):
+    cache.clear_session_cache(target, task_status_cache)
+
+
+def get_cached_status(name, short_name=""):
+    """
+    Well-known statuses are read very often and almost never modified. They
+    are kept in a cache until they are modified by any process.
+    """
+    return cache.get_or_load_instance(
+        task_status_cache,
+        (name, short_name),
+        lambda: get_or_create_status(name, short_name),
+        cache.get_version(task_status_cache)
+    )
+
+
 def get_done_status():
-    return get_or_create_status(app.config["DONE_TASK_STATUS"], "done")
+    return get_cached_status(app.config["DONE_TASK_STATUS"], "done")
 
 
 def get_wip_status():
-    return get_or_create_status(app.config["WIP_TASK_STATUS"], "wip")
+    return get_cached_status(app.config["WIP_TASK_STATUS"], "wip")
 
 
 def get_to_review_status():
-    return get_or_create_status(app.config["TO_REVIEW_TASK_STATUS"], "pndng")
+    return get_cached_status(app.config["TO_REVIEW_TASK_STATUS"], "pndng")
 
 
 def get_todo_status():
-    return get_or_create_status("Todo")
+    return get_cached_status("Todo")
 
 
 def get_task_status(task_status_id):
@@ -360,20 +387,43 @@ def get_time_spents(task_id):
     return result
 
 
-def get_comments(task):
+def get_comments(task, limit=None, before=None):
+    """
+    Return comments of given task, most recent first, with their author,
+    their status and their preview, all retrieved with a single query.
+    When an id is given as before parameter, only comments older than this
+    comment are returned.
+    """
     comments = []
 
-    query = Comment.query.order_by(Comment.created_at.desc()) \
+    query = Comment.query \
+        .order_by(Comment.created_at.desc(), Comment.id.desc()) \
         .filter_by(object_id=task.id) \
         .join(Person, TaskStatus) \
+        .outerjoin(PreviewFile, PreviewFile.id == Comment.preview_file_id) \
         .add_columns(
             TaskStatus.name,
             TaskStatus.short_name,
             TaskStatus.color,
             Person.first_name,
-            Person.last_name
+            Person.last_name,
+            PreviewFile.revision,
+            PreviewFile.is_movie
         )
 
+    if before is not None:
+        before_date = Comment.query \
+            .with_entities(Comment.created_at) \
+            .filter(Comment.id == before) \
+            .as_scalar()
+        query = query.filter(
+            tuple_(Comment.created_at, Comment.id) <
+            tuple_(before_date, before)
+        )
+
+    if limit is not None:
+        query = query.limit(limit)
+
     for result in query.all():
         (
             comment,
@@ -381,7 +431,9 @@ def get_comments(task):
             task_status_short_name,
             task_status_color,
             person_first_name,
-            person_last_name
+            person_last_name,
+            preview_revision,
+            preview_is_movie
         ) = result
 
         comment_dict = comment.serialize()
@@ -398,11 +450,10 @@ def get_comments(task):
         }
 
         if comment.preview_file_id is not None:
-            preview = PreviewFile.get(comment.preview_file_id)
             comment_dict["preview"] = {
-                "id": str(preview.id),
-                "revision": preview.revision,
-                "is_movie": preview.is_movie
+                "id": str(comment.preview_file_id),
+                "revision": preview_revision,
+                "is_movie": preview_is_movie
             }
         comments.append(comment_dict)
     return comments
@@ -1,73 +1,174 @@
-import sys
-import redis
+import os
+import threading
+
+from redis.exceptions import RedisError
 
 from zou.app import config
+from zou.app.stores import connections
+from zou.app.utils import cache
 
+REVOCATION_CHANNEL = "auth_tokens:revocations"
 
-try:
-    revoked_tokens_store = redis.StrictRedis(
-        host=config.KEY_VALUE_STORE["host"],
-        port=config.KEY_VALUE_STORE["port"],
-        db=config.AUTH_TOKEN_BLACKLIST_KV_INDEX,
-        decode_responses=True
-    )
-    revoked_tokens_store.get(None)
-except redis.ConnectionError:
-    try:
-        import fakeredis
-        revoked_tokens_store = fakeredis.FakeStrictRedis()
-    except:
-        print("Cannot access to the required Redis instance")
-        sys.exit(1)
+
+revoked_tokens_store = \
+    connections.get_client(config.AUTH_TOKEN_BLACKLIST_KV_INDEX)
+
+revocation_cache = cache.new(
+    "token_revocations",
+    ttl=config.TOKEN_REVOCATION_CACHE_TTL,
+    max_size=config.TOKEN_REVOCATION_CACHE_SIZE
+)
+revocation_listener = {"pid": None, "thread": None}
+revocation_listener_lock = threading.Lock()
 
 
 def add(key, token, ttl=None):
     """
-    Store a token with key as access key.
+    Store a token with key as access key. Revocations are notified to the
+    other processes.
     """
-    return revoked_tokens_store.set(key.encode("utf-8"), token, ex=ttl)
+    result = revoked_tokens_store.set(key.encode("utf-8"), token, ex=ttl)
+    if token == "true":
+        notify_revocations([key])
+    else:
+        revocation_cache.delete(key)
+    return result
+
+
+def decode(value):
+    if value is not None and hasattr(value, 'decode'):
+        value = value.decode("utf-8")
+    return value
 
 
 def get(key):
     """
     Retrieve auth token corresponding at given key.
     """
-    value = revoked_tokens_store.get(key)
-    if value is not None and hasattr(value, 'decode'):
-        value = value.decode("utf-8")
-    return value
+    return decode(revoked_tokens_store.get(key))
+
+
+def get_many(keys):
+    """
+    Retrieve auth tokens corresponding at given keys with a single request.
+    """
+    if len(keys) == 0:
+        return []
+    return [decode(value) for value in revoked_tokens_store.mget(keys)]
 
 
 def delete(key):
     """
     Remove auth token corresponding at given key.
     """
-    return revoked_tokens_store.delete(key.encode("utf-8"))
+    result = revoked_tokens_store.delete(key.encode("utf-8"))
+    notify_revocations([key])
+    return result
+
+
+def delete_many(keys):
+    """
+    Remove auth tokens corresponding at given keys with a single request.
+    """
+    if len(keys) == 0:
+        return 0
+    result = revoked_tokens_store.delete(
+        *[key.encode("utf-8") for key in keys]
+    )
+    notify_revocations(keys)
+    return result
+
+
+def iter_key_batches(batch_size=1000):
+    """
+    Iterate over all keys available in the store by batches. Keys are
+    retrieved with SCAN cursors, so the Redis server is never blocked while
+    the whole keyspace is walked. A key can be returned more than once.
+    """
+    cursor = None
+    while cursor != 0:
+        (cursor, keys) = revoked_tokens_store.scan(
+            cursor=cursor or 0,
+            count=batch_size
+        )
+        if len(keys) > 0:
+            yield [decode(key) for key in keys]
 
 
 def keys():
     """
     Get all keys available in the store.
     """
-    keys = revoked_tokens_store.keys()
-    if len(keys) > 0 and hasattr(keys[0], 'decode'):
-        return [x.decode("utf-8") for x in revoked_tokens_store.keys()]
-    else:
-        return [x for x in revoked_tokens_store.keys()]
+    return list(set(
+        key for keys in iter_key_batches() for key in keys
+    ))
 
 
 def clear():
     """
     Clear all auth token stored in the store.
     """
-    for key in keys():
-        delete(key)
+    for keys in iter_key_batches():
+        delete_many(keys)
 
 
 def is_revoked(decrypted_token):
     """
-    Tell if a stored auth token is revoked or not.
+    Tell if a stored auth token is revoked or not. Known states are kept in
+    a local cache for a short time. The cache is used only while this process
+    listens to the revocations published by the other processes.
     """
     jti = decrypted_token["jti"]
-    is_revoked = get(jti)
-    return (is_revoked is None) or (is_revoked == "true")
+    is_listening = start_revocation_listener()
+
+    is_revoked = None
+    if is_listening:
+        is_revoked = revocation_cache.get(jti)
+
+    if is_revoked is None:
+        value = get(jti)
+        is_revoked = (value is None) or (value == "true")
+        if is_listening and value is not None:
+            revocation_cache.set(jti, is_revoked)
+    return is_revoked
+
+
+def notify_revocations(keys):
+    """
+    Drop given keys from the local revocation cache and ask the other
+    processes to drop them too.
+    """
+    for key in keys:
+        revocation_cache.delete(key)
+    revoked_tokens_store.publish(REVOCATION_CHANNEL, " ".join(keys))
+
+
+def on_revocation_message(message):
+    for key in decode(message["data"]).split(" "):
+        revocation_cache.delete(key)
+
+
+def start_revocation_listener():
+    """
+    Make sure a thread of the current process listens to published
+    revocations. It is started on first use, and started again after a fork
+    or if the thread stopped. Return False if it can't be started.
+    """
+    with revocation_listener_lock:
+        thread = revocation_listener["thread"]
+        if revocation_listener["pid"] == os.getpid() and \
+           thread is not None and thread.is_alive():
+            return True
+
+        # Revocations may have been missed while nothing was listening.
+        revocation_cache.clear()
+        try:
+            pubsub = revoked_tokens_store.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{REVOCATION_CHANNEL: on_revocation_message})
+            revocation_listener["thread"] = \
+                pubsub.run_in_thread(sleep_time=1, daemon=True)
+            revocation_listener["pid"] = os.getpid()
+            return True
+        except RedisError:
+            revocation_listener["thread"] = None
+            return False
@@ -0,0 +1,42 @@
+from zou.app import config
+from zou.app.stores import connections
+
+VERSION_KEY = "cache_versions:%s"
+
+
+cache_versions_store = \
+    connections.get_client(config.KV_CACHE_VERSIONS_DB_INDEX)
+
+
+def decode(value):
+    if value is not None and hasattr(value, "decode"):
+        value = value.decode("utf-8")
+    return value
+
+
+def get_versions(*names):
+    """
+    Return current versions of given cached data. Processes tag their cached
+    values with these versions and drop values tagged with older ones.
+    """
+    return tuple(
+        decode(version) or "0"
+        for version in cache_versions_store.mget(
+            *[VERSION_KEY % name for name in names]
+        )
+    )
+
+
+def bump(*names):
+    """
+    Change versions of given cached data, so every process drops its cached
+    values.
+    """
+    pipeline = cache_versions_store.pipeline()
+    for name in names:
+        pipeline.incr(VERSION_KEY % name)
+    pipeline.execute()
+
+
+def clear():
+    cache_versions_store.flushdb()
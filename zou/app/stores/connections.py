@@ -0,0 +1,81 @@
+import sys
+import redis
+
+from redis.exceptions import ConnectionError
+
+from zou.app import config
+from zou.redis_pool import HealthCheckedConnectionPool
+
+pools = {}
+clients = {}
+
+
+def get_pool(db_index, max_connections=None):
+    """
+    Return the connection pool used for given Redis database index and
+    maximum size. Pools are shared by every store of the process using the
+    same database index and size.
+    """
+    if max_connections is None:
+        max_connections = config.KV_MAX_CONNECTIONS
+    key = (db_index, max_connections)
+    if key not in pools:
+        pools[key] = HealthCheckedConnectionPool(
+            host=config.KEY_VALUE_STORE["host"],
+            port=config.KEY_VALUE_STORE["port"],
+            db=db_index,
+            max_connections=max_connections,
+            timeout=config.KV_POOL_TIMEOUT,
+            health_check_interval=config.KV_HEALTH_CHECK_INTERVAL,
+            socket_keepalive=True,
+            decode_responses=True
+        )
+    return pools[key]
+
+
+def get_client(db_index, max_connections=None):
+    """
+    Return a Redis client for given database index, built on the shared
+    connection pool of this index. If Redis is not reachable when the client
+    is created, a fake Redis instance is used instead.
+    """
+    if max_connections is None:
+        max_connections = config.KV_MAX_CONNECTIONS
+    key = (db_index, max_connections)
+    if key not in clients:
+        try:
+            client = redis.StrictRedis(
+                connection_pool=get_pool(db_index, max_connections)
+            )
+            client.ping()
+        except ConnectionError:
+            pools.pop(key, None)
+            client = get_fake_client(db_index)
+        clients[key] = client
+    return clients[key]
+
+
+def get_fake_client(db_index):
+    try:
+        import fakeredis
+        return fakeredis.FakeStrictRedis(db=db_index)
+    except:
+        print("Cannot access to the required Redis instance")
+        sys.exit(1)
+
+
+def get_stats():
+    """
+    Return usage statistics of every connection pool of the current process.
+    """
+    return {
+        get_pool_name(db_index, max_connections): pool.get_stats()
+        for ((db_index, max_connections), pool) in pools.items()
+    }
+
+
+def get_pool_name(db_index, max_connections):
+    if max_connections == config.KV_MAX_CONNECTIONS:
+        return str(db_index)
+    else:
+        return "%s:%s" % (db_index, max_connections)
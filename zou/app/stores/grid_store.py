@@ -0,0 +1,292 @@
+import json
+
+from redis.exceptions import WatchError
+
+from zou.app import config
+from zou.app.stores import connections
+
+GENERATION_KEY = "grids:generation"
+ROWS_KEY = "grids:%s:%s:rows"
+BUILT_KEY = "grids:%s:%s:built"
+VERSION_KEY = "grids:%s:%s:version"
+DIRTY_KEY = "grids:%s:%s:dirty"
+UPDATED_KEY = "grids:%s:%s:updated"
+REMOVED_KEY = "grids:%s:%s:removed"
+CLOCK_KEY = "grids:%s:%s:clock"
+
+
+grid_store = connections.get_client(config.KV_GRIDS_DB_INDEX)
+
+
+def decode(value):
+    if value is not None and hasattr(value, "decode"):
+        value = value.decode("utf-8")
+    return value
+
+
+def get_generation():
+    return decode(grid_store.get(GENERATION_KEY)) or "0"
+
+
+def get_etag(name, project_id):
+    """
+    Return a tag that changes every time given grid is modified or
+    invalidated.
+    """
+    (generation, version) = grid_store.mget(
+        GENERATION_KEY,
+        VERSION_KEY % (name, project_id)
+    )
+    return "%s-%s" % (decode(generation) or "0", decode(version) or "0")
+
+
+def is_built(name, project_id):
+    """
+    Tell if given grid was built since the last global invalidation.
+    """
+    (generation, built) = grid_store.mget(
+        GENERATION_KEY,
+        BUILT_KEY % (name, project_id)
+    )
+    return built is not None and decode(built) == (decode(generation) or "0")
+
+
+def get_time(client=None):
+    """
+    Return current time of the Redis server in microseconds. The same clock
+    is used by every worker to timestamp grid rows.
+    """
+    (seconds, microseconds) = (client or grid_store).time()
+    return int(seconds) * 1000000 + int(microseconds)
+
+
+def execute_stamped(name, project_id, write=None):
+    """
+    Run given write function in a transaction stamped with the clock of
+    given grid. The function receives the pipeline and the timestamp.
+    Transactions are retried until no other one was executed between the
+    clock read and the write, so timestamps of rows always increase in
+    the order rows are written. Return the timestamp and the results of the
+    transaction.
+    """
+    clock_key = CLOCK_KEY % (name, project_id)
+    with grid_store.pipeline() as pipeline:
+        while True:
+            try:
+                pipeline.watch(clock_key)
+                clock = int(decode(pipeline.get(clock_key)) or 0)
+                timestamp = max(get_time(pipeline), clock + 1)
+                pipeline.multi()
+                pipeline.set(clock_key, timestamp)
+                if write is not None:
+                    write(pipeline, timestamp)
+                return (timestamp, pipeline.execute())
+            except WatchError:
+                continue
+
+
+def get_rows(name, project_id, since=None):
+    """
+    Return rows of given grid. If since is given (in microseconds), only rows
+    written after this time are returned.
+    """
+    if since is None:
+        rows = grid_store.hvals(ROWS_KEY % (name, project_id))
+    else:
+        row_ids = grid_store.zrangebyscore(
+            UPDATED_KEY % (name, project_id),
+            "(%d" % since,
+            "+inf"
+        )
+        if len(row_ids) > 0:
+            rows = grid_store.hmget(ROWS_KEY % (name, project_id), row_ids)
+        else:
+            rows = []
+    return [json.loads(decode(row)) for row in rows if row is not None]
+
+
+def get_removed_row_ids(name, project_id, since):
+    """
+    Return ids of rows removed from given grid after given time (in
+    microseconds).
+    """
+    return [
+        decode(row_id)
+        for row_id in grid_store.zrangebyscore(
+            REMOVED_KEY % (name, project_id),
+            "(%d" % since,
+            "+inf"
+        )
+    ]
+
+
+def get_last_update(name, project_id):
+    """
+    Return a time (in microseconds) such as every row written or removed
+    later gets a bigger timestamp. It's the current server time: the grid
+    clock is moved forward, so writes started before are stamped again.
+    """
+    (timestamp, _) = execute_stamped(name, project_id)
+    return timestamp
+
+
+def get_horizon(name, project_id):
+    """
+    Return the oldest time (in microseconds) from which removed rows are
+    still known. Older removals are dropped after GRID_TOMBSTONES_TTL
+    seconds.
+    """
+    clock = decode(grid_store.get(CLOCK_KEY % (name, project_id)))
+    return int(clock or 0) - config.GRID_TOMBSTONES_TTL * 1000000
+
+
+def save_rows(name, project_id, rows, generation, version=None):
+    """
+    Replace all rows of given grid and flag it as built for given
+    generation. Rows that are not part of the grid anymore are kept as
+    removed. If the grid version changed since the rows were built (see
+    pop_dirty), rows are flagged as modified again.
+    """
+    row_ids = set(row["id"] for row in rows)
+    removed_row_ids = [
+        decode(row_id)
+        for row_id in grid_store.hkeys(ROWS_KEY % (name, project_id))
+        if decode(row_id) not in row_ids
+    ]
+
+    def write(pipeline, timestamp):
+        pipeline.delete(ROWS_KEY % (name, project_id))
+        pipeline.delete(UPDATED_KEY % (name, project_id))
+        if len(rows) > 0:
+            write_rows(pipeline, name, project_id, rows, timestamp)
+        write_removed_row_ids(
+            pipeline,
+            name,
+            project_id,
+            removed_row_ids,
+            timestamp
+        )
+        pipeline.set(BUILT_KEY % (name, project_id), generation)
+        pipeline.get(VERSION_KEY % (name, project_id))
+
+    (_, results) = execute_stamped(name, project_id, write)
+    check_version(name, project_id, row_ids, version, decode(results[-1]))
+
+
+def update_rows(name, project_id, rows, removed_row_ids=[], version=None):
+    """
+    Write given rows and remove rows matching given ids from given grid.
+    Ids that don't match any row of the grid are ignored. If the grid
+    version changed since the rows were built (see pop_dirty), rows are
+    flagged as modified again.
+    """
+    row_ids = [row["id"] for row in rows] + list(removed_row_ids)
+    if len(removed_row_ids) > 0:
+        pipeline = grid_store.pipeline()
+        for row_id in removed_row_ids:
+            pipeline.hexists(ROWS_KEY % (name, project_id), row_id)
+        removed_row_ids = [
+            row_id
+            for (row_id, exists) in zip(removed_row_ids, pipeline.execute())
+            if exists
+        ]
+
+    def write(pipeline, timestamp):
+        if len(rows) > 0:
+            write_rows(pipeline, name, project_id, rows, timestamp)
+        if len(removed_row_ids) > 0:
+            pipeline.hdel(ROWS_KEY % (name, project_id), *removed_row_ids)
+            pipeline.zrem(UPDATED_KEY % (name, project_id), *removed_row_ids)
+        write_removed_row_ids(
+            pipeline,
+            name,
+            project_id,
+            removed_row_ids,
+            timestamp
+        )
+        pipeline.get(VERSION_KEY % (name, project_id))
+
+    (_, results) = execute_stamped(name, project_id, write)
+    check_version(name, project_id, row_ids, version, decode(results[-1]))
+
+
+def check_version(name, project_id, row_ids, version, current_version):
+    """
+    Rows built while the grid was modified may be older than rows written
+    by a concurrent reader. They are flagged as modified, so the next read
+    builds them again. The grid version is moved too: a client that read the
+    stale rows doesn't get a not modified answer for them.
+    """
+    if version is not None and version != (current_version or "0"):
+        mark_dirty(name, {project_id: row_ids})
+
+
+def write_rows(pipeline, name, project_id, rows, timestamp):
+    pipeline.hmset(ROWS_KEY % (name, project_id), {
+        row["id"]: json.dumps(row) for row in rows
+    })
+    pipeline.zadd(UPDATED_KEY % (name, project_id), **{
+        row["id"]: timestamp for row in rows
+    })
+    pipeline.zrem(
+        REMOVED_KEY % (name, project_id),
+        *[row["id"] for row in rows]
+    )
+
+
+def write_removed_row_ids(pipeline, name, project_id, row_ids, timestamp):
+    """
+    Keep given row ids as removed and drop removals older than
+    GRID_TOMBSTONES_TTL seconds.
+    """
+    if len(row_ids) > 0:
+        pipeline.zadd(REMOVED_KEY % (name, project_id), **{
+            row_id: timestamp for row_id in row_ids
+        })
+    pipeline.zremrangebyscore(
+        REMOVED_KEY % (name, project_id),
+        "-inf",
+        timestamp - config.GRID_TOMBSTONES_TTL * 1000000
+    )
+
+
+def mark_dirty(name, changes):
+    """
+    Flag rows of grids as modified and move the version of their grids.
+    Changes are given as a dict where keys are project ids and values are
+    row ids.
+    """
+    pipeline = grid_store.pipeline()
+    for (project_id, row_ids) in changes.items():
+        if len(row_ids) > 0:
+            pipeline.sadd(DIRTY_KEY % (name, project_id), *row_ids)
+        pipeline.incr(VERSION_KEY % (name, project_id))
+    pipeline.execute()
+
+
+def pop_dirty(name, project_id):
+    """
+    Return ids of modified rows of given grid and reset the list. The
+    current version of the grid is returned too, it must be given back when
+    the rows are written.
+    """
+    pipeline = grid_store.pipeline(transaction=True)
+    pipeline.smembers(DIRTY_KEY % (name, project_id))
+    pipeline.delete(DIRTY_KEY % (name, project_id))
+    pipeline.get(VERSION_KEY % (name, project_id))
+    (row_ids, _, version) = pipeline.execute()
+    return (
+        set(decode(row_id) for row_id in row_ids),
+        decode(version) or "0"
+    )
+
+
+def invalidate_all():
+    """
+    Require a full rebuild of every grid on next read.
+    """
+    return grid_store.incr(GENERATION_KEY)
+
+
+def clear():
+    grid_store.flushdb()
@@ -0,0 +1,121 @@
+import json
+
+from redis.exceptions import WatchError
+
+from zou.app import config
+from zou.app.stores import connections
+
+JOB_KEY = "jobs:%s"
+ALIVE_KEY = "jobs:%s:alive"
+QUEUE_KEY = "jobs:queue"
+PROCESSING_KEY = "jobs:processing:%s"
+JOB_TTL = 24 * 3600
+
+
+job_store = connections.get_client(config.KV_JOBS_DB_INDEX)
+
+
+def save(job_id, job):
+    """
+    Store description and status of given job. It is kept for one day.
+    """
+    return job_store.set(JOB_KEY % job_id, json.dumps(job), ex=JOB_TTL)
+
+
+def get(job_id):
+    """
+    Retrieve description and status of given job. Return None if the job is
+    unknown or too old.
+    """
+    return load(job_store.get(JOB_KEY % job_id))
+
+
+def load(value):
+    if value is None:
+        return None
+    if hasattr(value, "decode"):
+        value = value.decode("utf-8")
+    return json.loads(value)
+
+
+def set_alive(job_id, ttl):
+    """
+    Tell that given job is still processed. Without a new call before ttl
+    seconds, the job is considered as abandoned.
+    """
+    return job_store.set(ALIVE_KEY % job_id, "true", ex=ttl)
+
+
+def is_alive(job_id):
+    return job_store.exists(ALIVE_KEY % job_id)
+
+
+def mark_abandoned(job_id, error, ended_at):
+    """
+    Flag given job as failed if it is still running while nothing processes
+    it anymore. The check and the update are done in a transaction, so a
+    job ending at the same time is never overwritten.
+    """
+    with job_store.pipeline() as pipeline:
+        try:
+            pipeline.watch(JOB_KEY % job_id, ALIVE_KEY % job_id)
+            job = load(pipeline.get(JOB_KEY % job_id))
+            if job is None or job["status"] != "running" or \
+               pipeline.exists(ALIVE_KEY % job_id):
+                return job
+            job["status"] = "failed"
+            job["error"] = error
+            job["ended_at"] = ended_at
+            pipeline.multi()
+            pipeline.set(JOB_KEY % job_id, json.dumps(job), ex=JOB_TTL)
+            pipeline.execute()
+            return job
+        except WatchError:
+            return get(job_id)
+
+
+def push(job_id):
+    """
+    Add given job at the end of the queue processed by job workers.
+    """
+    return job_store.lpush(QUEUE_KEY, job_id)
+
+
+def pop(worker_name, timeout=1):
+    """
+    Wait for the next job and move it to the processing list of given worker.
+    None is returned if no job came before the timeout.
+    """
+    job_id = job_store.brpoplpush(
+        QUEUE_KEY,
+        PROCESSING_KEY % worker_name,
+        timeout
+    )
+    if job_id is not None and hasattr(job_id, "decode"):
+        job_id = job_id.decode("utf-8")
+    return job_id
+
+
+def ack(worker_name, job_id):
+    """
+    Remove given job from the processing list of given worker.
+    """
+    return job_store.lrem(PROCESSING_KEY % worker_name, 1, job_id)
+
+
+def requeue_processing_jobs(worker_name):
+    """
+    Put back in the queue the jobs a worker was processing when it stopped.
+    Return the number of jobs put back.
+    """
+    nb_jobs = 0
+    while job_store.rpoplpush(
+        PROCESSING_KEY % worker_name,
+        QUEUE_KEY
+    ) is not None:
+        nb_jobs += 1
+    return nb_jobs
+
+
+def clear():
+    job_store.flushdb()
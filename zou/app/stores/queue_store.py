@@ -0,0 +1,112 @@
+import json
+
+from zou.app import config
+from zou.app.stores import connections
+
+QUEUE_KEY = "events:queue"
+PROCESSING_KEY = "events:processing:%s"
+FAILED_KEY = "events:failed"
+STATS_KEY = "events:stats"
+
+
+event_queue_store = connections.get_client(config.KV_EVENT_QUEUE_DB_INDEX)
+
+
+def decode(value):
+    if value is not None and hasattr(value, "decode"):
+        value = value.decode("utf-8")
+    return value
+
+
+def push(job):
+    """
+    Add a job at the end of the queue.
+    """
+    return event_queue_store.lpush(QUEUE_KEY, json.dumps(job))
+
+
+def pop(worker_name, timeout=1):
+    """
+    Wait for the next job and move it to the processing list of given worker.
+    The raw job is returned, it is required to acknowledge the job once it
+    is processed. None is returned if no job came before the timeout.
+    """
+    return decode(event_queue_store.brpoplpush(
+        QUEUE_KEY,
+        PROCESSING_KEY % worker_name,
+        timeout
+    ))
+
+
+def ack(worker_name, raw_job):
+    """
+    Remove given job from the processing list of given worker.
+    """
+    return event_queue_store.lrem(PROCESSING_KEY % worker_name, 1, raw_job)
+
+
+def fail(worker_name, raw_job):
+    """
+    Move given job from the processing list of given worker to the failed
+    jobs list.
+    """
+    event_queue_store.lpush(FAILED_KEY, raw_job)
+    return ack(worker_name, raw_job)
+
+
+def requeue_processing_jobs(worker_name):
+    """
+    Put back in the queue the jobs a worker was processing when it stopped.
+    Return the number of jobs put back.
+    """
+    nb_jobs = 0
+    while event_queue_store.rpoplpush(
+        PROCESSING_KEY % worker_name,
+        QUEUE_KEY
+    ) is not None:
+        nb_jobs += 1
+    return nb_jobs
+
+
+def size():
+    return event_queue_store.llen(QUEUE_KEY)
+
+
+def add_handler_stats(handler_name, duration, failed=False):
+    """
+    Update counters of given handler: number of calls, number of failures and
+    total time spent in the handler.
+    """
+    pipeline = event_queue_store.pipeline()
+    pipeline.hincrby(STATS_KEY, "%s:calls" % handler_name, 1)
+    pipeline.hincrbyfloat(STATS_KEY, "%s:time" % handler_name, duration)
+    if failed:
+        pipeline.hincrby(STATS_KEY, "%s:failures" % handler_name, 1)
+    pipeline.execute()
+
+
+def get_handler_stats():
+    """
+    Return counters of every handler run by the workers.
+    """
+    stats = {}
+    for (key, value) in event_queue_store.hgetall(STATS_KEY).items():
+        (handler_name, counter) = decode(key).rsplit(":", 1)
+        handler_stats = stats.setdefault(handler_name, {
+            "calls": 0,
+            "failures": 0,
+            "time": 0.0
+        })
+        handler_stats[counter] = float(decode(value))
+
+    for handler_stats in stats.values():
+        handler_stats["calls"] = int(handler_stats["calls"])
+        handler_stats["failures"] = int(handler_stats["failures"])
+        if handler_stats["calls"] > 0:
+            handler_stats["average_time"] = \
+                handler_stats["time"] / handler_stats["calls"]
+    return stats
+
+
+def clear():
+    event_queue_store.flushdb()
@@ -0,0 +1,175 @@
+import threading
+import time
+
+from collections import OrderedDict
+from flask import g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+caches = OrderedDict()
+
+
+class MemoryCache(object):
+    """
+    Key/value cache living in the worker process. Entries can expire after a
+    given number of seconds and the cache can be bounded in size, in which
+    case the least recently used entries are dropped first. Hits and misses
+    are counted to make the cache efficiency observable.
+    """
+
+    def __init__(self, name, ttl=None, max_size=None):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Return value stored for given key or None if there is no value or if
+        the value is expired.
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                (value, expiration) = entry
+                if expiration is None or expiration > time.time():
+                    self.entries[key] = entry
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        expiration = None
+        if self.ttl is not None:
+            expiration = time.time() + self.ttl
+
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expiration)
+            if self.max_size is not None:
+                while len(self.entries) > self.max_size:
+                    self.entries.popitem(last=False)
+        return value
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def new(name, ttl=None, max_size=None):
+    """
+    Create a cache and register it, so it can be listed and cleared with the
+    other caches of the process.
+    """
+    cache = MemoryCache(name, ttl=ttl, max_size=max_size)
+    caches[name] = cache
+    return cache
+
+
+def clear_all():
+    for cache in caches.values():
+        cache.clear()
+
+
+def get_stats():
+    return {name: cache.stats() for (name, cache) in caches.items()}
+
+
+def get_request_cache(name):
+    """
+    Return a dict stored in the context of the current request, it is dropped
+    at the end of the request. None is returned outside of requests.
+    """
+    if not has_request_context():
+        return None
+
+    request_caches = getattr(g, "request_caches", None)
+    if request_caches is None:
+        request_caches = g.request_caches = {}
+    return request_caches.setdefault(name, {})
+
+
+def clear_request_cache(name):
+    if has_request_context():
+        getattr(g, "request_caches", {}).pop(name, None)
+
+
+def get_or_load_instance(cache, key, loader, version=None):
+    """
+    Return the model instance stored in cache for given key. If it's not
+    cached, the loader function is used to retrieve it from the database.
+    Cached instances are detached copies. They are merged in the current
+    session without querying the database. If a version is given (see
+    get_version), instances cached with another version are loaded again.
+    """
+    from zou.app import db
+
+    entry = cache.get(key)
+    if entry is None or entry[0] != version:
+        entry = cache.set(key, (version, get_detached_copy(loader())))
+    return db.session.merge(entry[1], load=False)
+
+
+def get_version(cache):
+    """
+    Return the version of given cache shared by all processes. It changes
+    every time a process commits a modification of the cached data.
+    """
+    from zou.app.stores import cache_versions_store
+
+    return cache_versions_store.get_versions(cache.name)[0]
+
+
+def clear_session_cache(target, cache):
+    """
+    Clear given cache in the current process right away. The other processes
+    drop their entries once the session of given instance is committed, so
+    they don't reload data that are not visible yet.
+    """
+    cache.clear()
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("cache_changes", set()).add(cache.name)
+
+
+@event.listens_for(Session, "after_commit")
+def publish_cache_changes(session):
+    from zou.app.stores import cache_versions_store
+
+    names = session.info.pop("cache_changes", None)
+    if names:
+        cache_versions_store.bump(*names)
+
+
+@event.listens_for(Session, "after_rollback")
+def drop_cache_changes(session):
+    session.info.pop("cache_changes", None)
+
+
+def get_detached_copy(instance):
+    """
+    Build a copy of given instance that is not attached to any session. It
+    behaves like an instance loaded by a query that was later detached.
+    """
+    mapper = inspect(instance).mapper
+    copy = mapper.class_manager.new_instance()
+    for attr in mapper.column_attrs:
+        setattr(copy, attr.key, getattr(instance, attr.key))
+    make_transient_to_detached(copy)
+    return copy
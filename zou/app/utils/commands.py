@@ -1,20 +1,187 @@
 import json
+import time
 import datetime
+import threading
 
+from zou.app import app, config, db
+from zou.app.models.tombstone import Tombstone
 from zou.app.stores import auth_tokens_store as store
+from zou.app.stores import job_store, queue_store
+from zou.app.utils import events, jobs
 
 
-def clean_auth_tokens():
+def clean_auth_tokens(batch_size=1000, progress_callback=None):
     """
     Remove all revoked tokens (most of the time outdated) from the key value
-    store.
+    store. Keys are scanned by batches: values of a batch are retrieved with
+    one request and removed with another one. Expired tokens are dropped by
+    Redis itself through their TTL.
+
+    The progress callback, if any, receives the number of scanned and deleted
+    keys after each batch. Final counts and duration are returned.
+    """
+    start = time.time()
+    nb_scanned = 0
+    nb_deleted = 0
+    for keys in store.iter_key_batches(batch_size):
+        values = store.get_many(keys)
+        keys_to_delete = [
+            key for (key, value) in zip(keys, values)
+            if is_cleanable_token(value)
+        ]
+        nb_scanned += len(keys)
+        nb_deleted += store.delete_many(keys_to_delete)
+        if progress_callback is not None:
+            progress_callback(nb_scanned, nb_deleted)
+
+    return {
+        "scanned": nb_scanned,
+        "deleted": nb_deleted,
+        "duration": time.time() - start
+    }
+
+
+def is_cleanable_token(value):
+    """
+    Tokens are stored as a "true" or "false" revoked flag. Entries stored
+    in the former JSON format are removed when they are revoked or expired.
     """
-    for key in store.keys():
-        value = json.loads(store.get(key))
+    if value is None or value == "false":
+        return False
+    elif value == "true":
+        return True
 
+    try:
+        value = json.loads(value)
         is_revoked = value["revoked"] == True
         expiration = datetime.datetime.fromtimestamp(value["token"]["exp"])
         is_expired = expiration < datetime.datetime.now()
+        return is_revoked or is_expired
+    except (ValueError, TypeError, KeyError):
+        return False
+
+
+def clean_tombstones():
+    """
+    Remove tombstones older than TOMBSTONES_TTL days. Clients that didn't
+    synchronize since then get a 410 error and must reload all data.
+    Return the number of removed tombstones.
+    """
+    nb_deleted = Tombstone.query \
+        .filter(Tombstone.created_at < Tombstone.get_horizon()) \
+        .delete(synchronize_session=False)
+    db.session.commit()
+    return nb_deleted
+
+
+def process_events(worker_name, concurrency=None):
+    """
+    Run event handlers queued by the API when EVENT_DISPATCH_MODE is set to
+    queue. Jobs left unfinished by a previous run of the same worker are
+    queued again first. No more than concurrency handlers run at the same
+    time.
+    """
+    if concurrency is None:
+        concurrency = config.EVENT_WORKER_CONCURRENCY
+    slots = threading.BoundedSemaphore(concurrency)
+
+    queue_store.requeue_processing_jobs(worker_name)
+    while True:
+        slots.acquire()
+        raw_job = queue_store.pop(worker_name)
+        if raw_job is None:
+            slots.release()
+        else:
+            thread = threading.Thread(
+                target=process_event_job,
+                args=(worker_name, raw_job, slots)
+            )
+            thread.daemon = True
+            thread.start()
+
+
+def process_event_job(worker_name, raw_job, slots):
+    """
+    Run the handler of given job. A failing job is queued again until it
+    reaches the maximum number of retries, then it is moved to the failed
+    jobs list.
+    """
+    try:
+        job = json.loads(raw_job)
+        with app.app_context():
+            events.run_job(job)
+        queue_store.ack(worker_name, raw_job)
+    except Exception:
+        app.logger.exception("Event job failed: %s" % raw_job)
+        retry_event_job(worker_name, raw_job)
+    finally:
+        slots.release()
+
+
+def retry_event_job(worker_name, raw_job):
+    try:
+        job = json.loads(raw_job)
+    except ValueError:
+        return queue_store.fail(worker_name, raw_job)
+
+    if job.get("attempts", 0) < config.EVENT_HANDLER_MAX_RETRIES:
+        job["attempts"] = job.get("attempts", 0) + 1
+        queue_store.push(job)
+        queue_store.ack(worker_name, raw_job)
+    else:
+        queue_store.fail(worker_name, raw_job)
+
+
+def process_jobs(worker_name, concurrency=None):
+    """
+    Run jobs queued by the API when JOB_DISPATCH_MODE is set to queue. Jobs
+    left unfinished by a previous run of the same worker are queued again
+    first. Running jobs are kept alive every JOB_HEARTBEAT_INTERVAL seconds,
+    so jobs of a worker that died are reported as failed.
+    """
+    if concurrency is None:
+        concurrency = config.JOB_PROCESSES
+    slots = threading.BoundedSemaphore(concurrency)
+    running_job_ids = set()
+
+    heartbeat = threading.Thread(
+        target=keep_jobs_alive,
+        args=(running_job_ids,)
+    )
+    heartbeat.daemon = True
+    heartbeat.start()
+
+    job_store.requeue_processing_jobs(worker_name)
+    while True:
+        slots.acquire()
+        job_id = job_store.pop(worker_name)
+        if job_id is None:
+            slots.release()
+        else:
+            running_job_ids.add(job_id)
+            thread = threading.Thread(
+                target=process_job,
+                args=(worker_name, job_id, running_job_ids, slots)
+            )
+            thread.daemon = True
+            thread.start()
+
+
+def process_job(worker_name, job_id, running_job_ids, slots):
+    try:
+        jobs.run_queued_job(job_id)
+    except Exception:
+        app.logger.exception("Job failed: %s" % job_id)
+    finally:
+        running_job_ids.discard(job_id)
+        job_store.ack(worker_name, job_id)
+        slots.release()
+
 
-        if is_revoked or is_expired:
-            store.delete(key)
+def keep_jobs_alive(running_job_ids):
+    while True:
+        try:
+            jobs.keep_alive(list(running_job_ids))
+        except Exception:
+            app.logger.exception("Jobs heartbeat failed.")
+        time.sleep(config.JOB_HEARTBEAT_INTERVAL)
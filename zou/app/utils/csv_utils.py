@@ -5,7 +5,7 @@ except ImportError:
 import csv
 
 from zou.app import config
-from flask import make_response
+from flask import Response, make_response, stream_with_context
 from slugify import slugify
 
 
@@ -18,6 +18,31 @@ def build_csv_response(csv_content, file_name="export"):
     return csv_response
 
 
+def build_csv_stream_response(csv_rows, file_name="export"):
+    """
+    Build a response that sends CSV rows as soon as they are produced by
+    given iterable, instead of building the whole file in memory.
+    """
+    file_name = build_csv_file_name(file_name)
+    csv_response = Response(
+        stream_with_context(build_csv_lines(csv_rows)),
+        mimetype="text/csv"
+    )
+    csv_response = build_csv_headers(csv_response, file_name)
+
+    return csv_response
+
+
+def build_csv_lines(csv_rows):
+    string_wrapper = StringIO()
+    csv_writer = csv.writer(string_wrapper)
+    for csv_row in csv_rows:
+        csv_writer.writerow(csv_row)
+        yield string_wrapper.getvalue()
+        string_wrapper.seek(0)
+        string_wrapper.truncate(0)
+
+
 def build_csv_file_name(file_name):
     return "%s_%s" % (
         slugify(config.APP_NAME, separator="_"),
@@ -18,6 +18,10 @@ def create_all():
 
 def drop_all():
     from zou.app import db
+    from zou.app.stores import grid_store
+    from zou.app.utils import cache
+    cache.clear_all()
+    grid_store.clear()
     db.session.flush()
     db.session.close()
     db.drop_all()
@@ -1,13 +1,18 @@
 from collections import OrderedDict
+from contextlib import contextmanager
 from zou.app import config
-from zou.app.stores import publisher_store
+from zou.app.stores import publisher_store, queue_store
 
 import json
+import time
+import threading
 
 handlers = {}
 
 publisher = publisher_store.new()
 
+batches = threading.local()
+
 
 def register(event, name, handler):
     if event not in handlers:
@@ -34,9 +39,107 @@ def unregister_all():
 
 def emit(event, data={}):
     event_handlers = handlers.get(event, {})
-    publisher.publish('sse', json.dumps({
+    publish({
         "type": event,
-        "data": {"data": data}})
-    )
-    for func in event_handlers.values():
-        func.handle_event(data)
+        "data": {"data": data}
+    })
+    if config.EVENT_DISPATCH_MODE == "queue":
+        for name in event_handlers.keys():
+            queue_store.push({
+                "event": event,
+                "handler": name,
+                "data": data,
+                "attempts": 0
+            })
+    else:
+        for func in event_handlers.values():
+            func.handle_event(data)
+
+
+def publish(message):
+    """
+    Send given message to the event stream. If a batch is open, the message
+    is kept until the batch is closed.
+    """
+    pending_messages = getattr(batches, "messages", None)
+    if pending_messages is None:
+        publisher.publish("sse", json.dumps(message))
+    else:
+        pending_messages.append(message)
+
+
+def start_batch():
+    """
+    Keep messages of emitted events in memory until the batch is closed.
+    Batches can be nested, messages are sent when the outermost batch is
+    closed.
+    """
+    if getattr(batches, "messages", None) is None:
+        batches.messages = []
+        batches.depth = 0
+    batches.depth += 1
+
+
+def end_batch():
+    if getattr(batches, "messages", None) is None:
+        return
+
+    batches.depth -= 1
+    if batches.depth <= 0:
+        messages = batches.messages
+        batches.messages = None
+        publish_messages(messages)
+
+
+@contextmanager
+def batch():
+    """
+    Context manager that sends all events emitted inside it at once.
+    """
+    start_batch()
+    try:
+        yield
+    finally:
+        end_batch()
+
+
+def publish_messages(messages):
+    """
+    Send given messages with a single round trip to Redis. If
+    EVENT_BATCH_MERGE is set, they are merged in a single batch event.
+    """
+    if len(messages) == 0:
+        return
+
+    if config.EVENT_BATCH_MERGE and len(messages) > 1:
+        publisher.publish("sse", json.dumps({
+            "type": "batch",
+            "data": {"data": {"events": messages}}
+        }))
+    else:
+        pipeline = publisher.pipeline(transaction=False)
+        for message in messages:
+            pipeline.publish("sse", json.dumps(message))
+        pipeline.execute()
+
+
+def run_job(job):
+    """
+    Run the handler described by given queued job and record how long it
+    took. Nothing is done if the handler is no longer registered.
+    """
+    handler = handlers.get(job["event"], {}).get(job["handler"], None)
+    if handler is None:
+        return
+
+    start = time.time()
+    failed = True
+    try:
+        handler.handle_event(job["data"])
+        failed = False
+    finally:
+        queue_store.add_handler_stats(
+            job["handler"],
+            time.time() - start,
+            failed=failed
+        )
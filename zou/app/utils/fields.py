@@ -87,3 +87,14 @@ def get_date_object(date_string, date_format="%Y-%m-%d"):
     Shortcut for date parsing.
     """
     return datetime.datetime.strptime(date_string, date_format)
+
+
+def get_datetime_object(datetime_string):
+    """
+    Parse given ISO formatted date and time, with or without microseconds.
+    Raises a ValueError if the string is malformed.
+    """
+    try:
+        return get_date_object(datetime_string, "%Y-%m-%dT%H:%M:%S.%f")
+    except ValueError:
+        return get_date_object(datetime_string, "%Y-%m-%dT%H:%M:%S")
@@ -0,0 +1,148 @@
+import datetime
+import importlib
+import multiprocessing
+import threading
+import traceback
+import uuid
+
+from zou.app import app, config
+from zou.app.stores import job_store
+from zou.app.utils import events
+
+pool = None
+pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Return the pool of worker processes used to run CPU heavy jobs. It is
+    created on first use, so each API process gets its own pool.
+    """
+    global pool
+    with pool_lock:
+        if pool is None:
+            pool = multiprocessing.Pool(processes=config.JOB_PROCESSES)
+    return pool
+
+
+def start(name, func, args=(), data={}, event=None):
+    """
+    Run given function outside of the request and return the job description
+    right away. Job status is stored in the key value store, so it can be
+    retrieved from any API process. If an event name is given, the event
+    is emitted with job data once the job is done.
+
+    If JOB_DISPATCH_MODE is set to queue, the job is put in a durable queue
+    processed by job workers (see process_jobs command). Function must be
+    importable and arguments JSON serializable. Otherwise the job is run by
+    the process pool of the API process.
+    """
+    job = {
+        "id": str(uuid.uuid4()),
+        "name": name,
+        "status": "queued",
+        "data": data,
+        "event": event,
+        "error": None,
+        "created_at": datetime.datetime.now().isoformat(),
+        "ended_at": None
+    }
+    if config.JOB_DISPATCH_MODE == "queue":
+        job["func"] = "%s:%s" % (func.__module__, func.__name__)
+        job["args"] = list(args)
+        job_store.save(job["id"], job)
+        job_store.push(job["id"])
+    else:
+        job["status"] = "running"
+        job_store.set_alive(job["id"], config.JOB_TIMEOUT)
+        job_store.save(job["id"], job)
+        get_pool().apply_async(
+            run_job,
+            (job["id"], func, args),
+            callback=end_job
+        )
+    return job
+
+
+def get(job_id):
+    """
+    Return description and status of given job. A running job that nothing
+    processes anymore (its process died or it exceeded its deadline) is
+    flagged as failed.
+    """
+    job = job_store.get(job_id)
+    if job is not None and job["status"] == "running" and \
+       not job_store.is_alive(job_id):
+        job = job_store.mark_abandoned(
+            job_id,
+            "Job abandoned: no sign of life from its worker.",
+            datetime.datetime.now().isoformat()
+        )
+    return job
+
+
+def run_job(job_id, func, args):
+    """
+    Function run by the worker processes. Errors are caught and returned to
+    the API process, which stores them in the job status.
+    """
+    try:
+        func(*args)
+        return (job_id, None)
+    except Exception:
+        return (job_id, traceback.format_exc())
+
+
+def end_job(result):
+    """
+    Store the final status of a job and emit its event if it succeeded.
+    """
+    (job_id, error) = result
+    job = job_store.get(job_id)
+    if job is None:
+        return
+
+    job["ended_at"] = datetime.datetime.now().isoformat()
+    if error is None:
+        job["status"] = "done"
+    else:
+        job["status"] = "failed"
+        job["error"] = error
+    job_store.save(job_id, job)
+
+    if job["status"] == "done" and job["event"] is not None:
+        with app.app_context():
+            events.emit(job["event"], job["data"])
+    return job
+
+
+def get_job_function(path):
+    (module_name, func_name) = path.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def run_queued_job(job_id):
+    """
+    Run a job taken from the queue by a job worker. The worker is expected
+    to keep the job alive while it runs (see keep_alive).
+    """
+    job = job_store.get(job_id)
+    if job is None:
+        return None
+
+    job["status"] = "running"
+    job_store.set_alive(job_id, config.JOB_HEARTBEAT_TIMEOUT)
+    job_store.save(job_id, job)
+    try:
+        func = get_job_function(job["func"])
+    except (AttributeError, ImportError, ValueError):
+        return end_job((job_id, traceback.format_exc()))
+    return end_job(run_job(job_id, func, job["args"]))
+
+
+def keep_alive(job_ids):
+    """
+    Renew liveness of given running jobs. Job workers call it regularly.
+    """
+    for job_id in job_ids:
+        job_store.set_alive(job_id, config.JOB_HEARTBEAT_TIMEOUT)
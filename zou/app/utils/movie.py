@@ -0,0 +1,26 @@
+import os
+
+from moviepy.editor import VideoFileClip
+
+from zou.app.utils import thumbnail
+
+MOVIE_HEIGHT = 720
+
+
+def build_preview_movie(instance_id, uploaded_movie_path, folder_path):
+    """
+    Resize uploaded movie to a 720p mp4 preview, extract its middle frame as
+    preview picture and generate picture variants from it. The uploaded
+    movie is removed once done.
+    """
+    movie_path = os.path.join(folder_path, "%s.mp4" % instance_id)
+    picture_path = os.path.join(folder_path, "%s.png" % instance_id)
+
+    clip = VideoFileClip(uploaded_movie_path)
+    clip = clip.resize(height=MOVIE_HEIGHT)
+    clip.save_frame(picture_path, round(clip.duration / 2))
+    thumbnail.build_preview_variants(instance_id)
+    clip.write_videofile(movie_path)
+
+    os.remove(uploaded_movie_path)
+    return movie_path
@@ -1,6 +1,31 @@
+import base64
+import uuid
+
+
 def get_query_criterions_from_request(request):
     criterions = {}
     for key, value in request.args.items():
         if key not in ["page"]:
             criterions[key] = value
     return criterions
+
+
+def encode_cursor(instance_id):
+    """
+    Turn given id into an opaque cursor that can be given back by the client to
+    retrieve the next page of a keyset paginated list.
+    """
+    cursor = base64.urlsafe_b64encode(str(instance_id).encode("utf-8"))
+    return cursor.decode("utf-8")
+
+
+def decode_cursor(cursor):
+    """
+    Retrieve the id stored in given cursor. Raises a ValueError if the cursor
+    is malformed.
+    """
+    try:
+        instance_id = base64.urlsafe_b64decode(cursor.encode("utf-8"))
+        return uuid.UUID(instance_id.decode("utf-8"))
+    except (TypeError, UnicodeError, base64.binascii.Error):
+        raise ValueError("Wrong cursor format: %s" % cursor)
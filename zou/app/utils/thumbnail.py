@@ -1,9 +1,9 @@
 import os
-import shutil
 import math
+import time
 
 from zou.app import app
-from zou.app.utils import fs
+from zou.app.utils import fs, jobs
 
 from PIL import Image
 
@@ -78,7 +78,16 @@ def get_full_size_from_width(im, width):
 
 def turn_into_thumbnail(file_path, size=None):
     im = Image.open(file_path)
+    im = resize_image(im, size)
+    im.save(file_path)
+
 
+def resize_image(im, size=None):
+    """
+    Return a resized copy of given image. If the height of given size is 0,
+    it is computed from the image ratio. Else the image is cropped to fit
+    the target ratio before being resized.
+    """
     if size is not None:
         (width, height) = size
 
@@ -89,8 +98,7 @@ def turn_into_thumbnail(file_path, size=None):
     else:
         size = im.size
 
-    im = im.resize(size)
-    im.save(file_path)
+    return im.resize(size)
 
 
 def prepare_image_for_thumbnail(im, size):
@@ -135,21 +143,63 @@ def url_path(data_type, instance_id):
 
 
 def generate_preview_variants(instance_id):
+    """
+    Build the picture variants of given preview file. If
+    PREVIEW_VARIANTS_IN_POOL is set, the work is done by the job process
+    pool to keep CPU heavy resizes out of the API process.
+    """
+    if app.config["PREVIEW_VARIANTS_IN_POOL"]:
+        return jobs.get_pool().apply(build_preview_variants, (instance_id,))
+    else:
+        return build_preview_variants(instance_id)
+
+
+def build_preview_variants(instance_id):
+    """
+    Decode the original picture once, then derive all variants from the
+    in-memory image. The largest variant is built first from the original
+    and the smaller ones are derived from it. Return time spent to decode,
+    resize and encode pictures.
+    """
     file_name = get_file_name(instance_id)
     original_path = get_preview_file_path("originals", instance_id)
-    variants = [
+    timings = {"decode": 0.0, "resize": 0.0, "encode": 0.0}
+
+    start = time.time()
+    im = Image.open(original_path)
+    im.load()
+    timings["decode"] += time.time() - start
+
+    start = time.time()
+    preview = resize_image(im, PREVIEW_SIZE)
+    timings["resize"] += time.time() - start
+    variants = [("previews", preview)]
+
+    for (picture_type, size) in [
         ("thumbnails", RECTANGLE_SIZE),
-        ("thumbnails-square", SQUARE_SIZE),
-        ("previews", PREVIEW_SIZE)
-    ]
+        ("thumbnails-square", SQUARE_SIZE)
+    ]:
+        start = time.time()
+        variants.append((picture_type, resize_image(preview, size)))
+        timings["resize"] += time.time() - start
 
-    for picture_data in variants:
-        (picture_type, size) = picture_data
+    for (picture_type, variant) in variants:
         folder_path = get_preview_folder_name(picture_type, instance_id)
         full_folder_path = create_folder(folder_path)
-        picture_path = os.path.join(full_folder_path, file_name)
-        shutil.copyfile(original_path, picture_path)
-        turn_into_thumbnail(picture_path, size)
+        start = time.time()
+        variant.save(os.path.join(full_folder_path, file_name))
+        timings["encode"] += time.time() - start
+
+    app.logger.debug(
+        "Preview variants of %s built (decode: %.3fs, resize: %.3fs, "
+        "encode: %.3fs)." % (
+            instance_id,
+            timings["decode"],
+            timings["resize"],
+            timings["encode"]
+        )
+    )
+    return timings
 
 
 def get_preview_url_path(instance_id):
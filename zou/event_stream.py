@@ -1,13 +1,51 @@
 import os
+import redis
 
 from flask import Flask
-from flask_sse import sse
+from flask_sse import ServerSentEventsBlueprint
 
-app = Flask(__name__)
-redis_host =  os.environ.get("KV_HOST", "localhost")
-redis_port =  os.environ.get("KV_PORT", "6379")
-redis_url = "redis://%s:%s/2" % (redis_host, redis_port)
+from zou.redis_pool import HealthCheckedConnectionPool
+
+# The event stream server doesn't load the API: its settings are read from
+# the same environment variables as zou.app.config.
+redis_host = os.environ.get("KV_HOST", "localhost")
+redis_port = os.environ.get("KV_PORT", "6379")
+redis_db_index = 2
+max_connections = int(os.environ.get("KV_EVENT_STREAM_MAX_CONNECTIONS", 1000))
+pool_timeout = int(os.environ.get("KV_POOL_TIMEOUT", 20))
+health_check_interval = int(os.environ.get("KV_HEALTH_CHECK_INTERVAL", 30))
+
+
+class EventStreamBlueprint(ServerSentEventsBlueprint):
+    """
+    Server sent events blueprint that relies on a single bounded connection
+    pool instead of opening a new Redis connection for each publication and
+    each listener. Every listener holds a connection of the pool.
+    """
 
+    connection_pool = None
+    client = None
 
-app.config["REDIS_URL"] = redis_url
+    @property
+    def redis(self):
+        if self.client is None:
+            self.connection_pool = HealthCheckedConnectionPool(
+                host=redis_host,
+                port=redis_port,
+                db=redis_db_index,
+                max_connections=max_connections,
+                timeout=pool_timeout,
+                health_check_interval=health_check_interval,
+                socket_keepalive=True
+            )
+            self.client = redis.StrictRedis(
+                connection_pool=self.connection_pool
+            )
+        return self.client
+
+
+sse = EventStreamBlueprint("sse", __name__)
+sse.add_url_rule(rule="", endpoint="stream", view_func=sse.stream)
+
+app = Flask(__name__)
 app.register_blueprint(sse, url_prefix='/events')
@@ -0,0 +1,52 @@
+import time
+import redis
+
+from redis.exceptions import ConnectionError, TimeoutError
+
+
+class HealthCheckedConnectionPool(redis.BlockingConnectionPool):
+    """
+    Connection pool with a maximum size. When no connection is available,
+    callers wait for one to be released instead of opening new connections.
+    Connections that stayed idle for too long are checked with a PING before
+    being reused, broken ones are reset so they reconnect on next command.
+    The underlying queue is compatible with gevent monkey patching.
+    """
+
+    def __init__(self, health_check_interval=30, **kwargs):
+        self.health_check_interval = health_check_interval
+        redis.BlockingConnectionPool.__init__(self, **kwargs)
+
+    def get_connection(self, command_name, *keys, **options):
+        connection = redis.BlockingConnectionPool.get_connection(
+            self,
+            command_name,
+            *keys,
+            **options
+        )
+        released_at = getattr(connection, "released_at", None)
+        if connection._sock is not None and released_at is not None and \
+           time.time() - released_at > self.health_check_interval:
+            self.check_health(connection)
+        return connection
+
+    def release(self, connection):
+        connection.released_at = time.time()
+        return redis.BlockingConnectionPool.release(self, connection)
+
+    def check_health(self, connection):
+        try:
+            connection.send_command("PING")
+            connection.read_response()
+        except (ConnectionError, TimeoutError):
+            connection.disconnect()
+
+    def get_stats(self):
+        available = len([x for x in list(self.pool.queue) if x is not None])
+        created = len(self._connections)
+        return {
+            "max_connections": self.max_connections,
+            "created_connections": created,
+            "available_connections": available,
+            "used_connections": created - available
+        }